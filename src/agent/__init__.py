@@ -2,12 +2,13 @@
 """
 Enhanced data quality agent with automatic table discovery and comprehensive reporting.
 """
-from .smart_planner import run_smart_dq_check, create_smart_dq_agent
+from .smart_planner import run_smart_dq_check, create_smart_dq_agent, get_smart_dq_agent
 from .reporting_tools import generate_comprehensive_dq_report, save_dq_report_to_file
 
 __all__ = [
     'run_smart_dq_check',
     'create_smart_dq_agent',
+    'get_smart_dq_agent',
     'generate_comprehensive_dq_report',
     'save_dq_report_to_file'
 ]
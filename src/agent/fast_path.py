@@ -0,0 +1,132 @@
+# src/agent/fast_path.py
+"""
+Deterministic planner for unambiguous requests.
+
+Requests of the form "<check> on <table>" (e.g. "duplicates on PROD_SALES.PUBLIC.ORDERS",
+"nulls and stats for public.customers") that name exactly one indexed table are planned
+with a regex and a schema index lookup, and run through run_comprehensive_dq_assessment
+directly - no LLM round-trips. Anything else returns no plan and goes to the agent.
+Exploratory requests ("quick nulls on ...", "estimate duplicates in ...") are answered from a
+small table sample, with confidence intervals, instead of a full scan.
+"""
+import re
+from typing import Any, Dict, List, Optional
+from src.agent.reporting_tools import run_comprehensive_dq_assessment
+from src.reporting.report_generator import DataQualityReportGenerator
+
+# Check phrases and the assessment checks they map to
+CHECK_ALIASES = {
+    'duplicates': ['duplicates'],
+    'duplicate': ['duplicates'],
+    'duplicate rows': ['duplicates'],
+    'duplicate records': ['duplicates'],
+    'duplicate check': ['duplicates'],
+    'dups': ['duplicates'],
+    'dupes': ['duplicates'],
+    'nulls': ['null_values'],
+    'null values': ['null_values'],
+    'null check': ['null_values'],
+    'missing values': ['null_values'],
+    'missing data': ['null_values'],
+    'stats': ['descriptive_stats'],
+    'statistics': ['descriptive_stats'],
+    'descriptive stats': ['descriptive_stats'],
+    'descriptive statistics': ['descriptive_stats'],
+    'profile': ['descriptive_stats'],
+    'all checks': ['duplicates', 'null_values', 'descriptive_stats'],
+    'assessment': ['duplicates', 'null_values', 'descriptive_stats'],
+    'full assessment': ['duplicates', 'null_values', 'descriptive_stats'],
+    'comprehensive assessment': ['duplicates', 'null_values', 'descriptive_stats'],
+    'dq assessment': ['duplicates', 'null_values', 'descriptive_stats'],
+    'data quality assessment': ['duplicates', 'null_values', 'descriptive_stats'],
+}
+
+# Percentage of the table sampled for exploratory requests
+EXPLORATORY_SAMPLE_PERCENT = 1
+
+# "[quick|rough|estimate|sampled] <check>[, <check> and <check>] on|in|for|of [table] <name>"
+_REQUEST_PATTERN = re.compile(
+    r"^\s*(?:please\s+)?(?:(?:run|check|find|show|get|do)\s+(?:(?:for|the|a)\s+)?)?"
+    r"(?:(?P<exploratory>quick|rough|estimated?|sampled?|approximate)\s+)?"
+    r"(?P<checks>[a-z ,&]+?)\s+(?:on|in|for|of)\s+(?:the\s+)?(?:table\s+)?"
+    r"(?P<table>[A-Za-z0-9_$]+(?:\.[A-Za-z0-9_$]+){0,2})"
+    r"(?:\s+table)?\s*[?.!]*\s*$",
+    re.IGNORECASE
+)
+_CHECK_SEPARATOR = re.compile(r"\s*(?:,|&|\band\b|\bplus\b)\s*")
+
+
+def _parse_checks(phrase: str) -> Optional[List[str]]:
+    """Map a check phrase like 'nulls and duplicates' to assessment checks (None if any part is unknown)."""
+    checks: List[str] = []
+    for part in _CHECK_SEPARATOR.split(phrase.lower().strip()):
+        if not part:
+            continue
+        mapped = CHECK_ALIASES.get(' '.join(part.split()))
+        if mapped is None:
+            return None
+        checks.extend(check for check in mapped if check not in checks)
+    return checks or None
+
+
+def plan_fast_path(query: str, schema_indexer) -> Optional[Dict[str, Any]]:
+    """
+    Plan a request without the LLM if it names one check set and exactly one indexed table.
+
+    Args:
+        query: User's request
+        schema_indexer: SchemaIndexer used to resolve the table name
+
+    Returns:
+        Dict with dataset_id, connector_type, checks and sample_percent (0 = full scan), or
+        None if the request is not unambiguous and should go to the agent
+    """
+    match = _REQUEST_PATTERN.match(query)
+    if not match:
+        return None
+
+    checks = _parse_checks(match.group('checks'))
+    if not checks:
+        return None
+
+    # The name must resolve to exactly one indexed table through the exact-name lookup
+    tables = schema_indexer.search_tables(match.group('table'), top_k=2, min_relevance=0.0)
+    exact = [table for table in tables if table.get('match') == 'exact']
+    if len(exact) != 1:
+        return None
+
+    return {
+        'dataset_id': exact[0]['full_name'],
+        'connector_type': exact[0]['connector_type'],
+        'checks': checks,
+        'sample_percent': EXPLORATORY_SAMPLE_PERCENT if match.group('exploratory') else 0
+    }
+
+
+def run_fast_path(query: str, plan: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Execute a fast-path plan with run_comprehensive_dq_assessment.
+
+    Returns:
+        Dict shaped like the agent's result ('input', 'output') plus 'fast_path': True,
+        the plan and the raw assessment
+    """
+    assessment = run_comprehensive_dq_assessment(
+        dataset_id=plan['dataset_id'],
+        connector_type=plan['connector_type'],
+        checks_to_run=','.join(plan['checks']),
+        sample_percent=plan.get('sample_percent', 0)
+    )
+
+    if assessment.get('status') == 'success':
+        output = DataQualityReportGenerator().generate_markdown_report(assessment['assessment_results'])
+    else:
+        output = f"Data quality assessment of {plan['dataset_id']} failed: {assessment.get('error', 'Unknown error')}"
+
+    return {
+        'input': query,
+        'output': output,
+        'fast_path': True,
+        'plan': plan,
+        'assessment': assessment
+    }
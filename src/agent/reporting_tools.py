@@ -3,12 +3,16 @@
 Data Quality Reporting Tools for Agent Integration
 """
 import json
-from typing import Dict, Any, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Union
 from src.reporting import DataQualityReportGenerator
+from src.data_quality.session import DatasetSession, REPORT_SAMPLE_DUPLICATES
+from src.reporting.orchestrator import assess_tables
 
 
 def run_comprehensive_dq_assessment(dataset_id: str, connector_type: str = 'postgres',
-                                   checks_to_run: str = 'duplicates,null_values,descriptive_stats') -> Dict[str, Any]:
+                                   checks_to_run: str = 'duplicates,null_values,descriptive_stats',
+                                   use_cache: bool = True, columns: str = '', filters: str = '',
+                                   sample_percent: float = 0) -> Dict[str, Any]:
     """
     Run a comprehensive data quality assessment and return the raw assessment results.
 
@@ -20,62 +24,94 @@ def run_comprehensive_dq_assessment(dataset_id: str, connector_type: str = 'post
         dataset_id: Full table name (e.g., 'DATABASE.SCHEMA.TABLE' for Snowflake or 'schema.table' for postgres)
         connector_type: Database type - 'snowflake' or 'postgres' (REQUIRED - use the connector type from the context)
         checks_to_run: Comma-separated list of checks: 'duplicates', 'null_values', 'descriptive_stats' (default: all)
+        use_cache: Reuse cached results while the table is unchanged (set False to force a re-scan)
+        columns: Optional comma-separated column names to assess (only these columns are read)
+        filters: Optional JSON object limiting the rows assessed: {"column": value} for equality (a list
+                 means any of), or {"column": {"operator": value}} with =, !=, <, <=, >, >=, in, not in,
+                 like, e.g. '{"order_date": {">=": "2024-01-01"}, "region": "EU"}'
+        sample_percent: Optional percentage of the table to sample (e.g. 1) for fast estimates with
+                        95% confidence intervals; 0 assesses every row
 
     Returns:
         Dictionary containing complete assessment results that can be cached and reused
     """
     try:
-        # Import the individual DQ check functions directly to avoid DataQualityReportGenerator overhead
-        from src.data_quality.checks import check_dataset_duplicates, check_dataset_null_values, check_dataset_descriptive_stats
-
-        # Map check names to functions
-        available_checks = {
-            'duplicates': check_dataset_duplicates,
-            'null_values': check_dataset_null_values,
-            'descriptive_stats': check_dataset_descriptive_stats
-        }
-
         # Parse checks to run
         check_list = [check.strip() for check in checks_to_run.split(',')]
 
-        # Execute each check directly (single execution)
-        check_results = {}
-        for check_name in check_list:
-            if check_name in available_checks:
-                print(f"Running {check_name} check...")
-                check_function = available_checks[check_name]
-                result = check_function(dataset_id, connector_type=connector_type)
-                check_results[check_name] = result
-            else:
-                print(f"Warning: Unknown check '{check_name}' skipped")
-
-        # Use DataQualityReportGenerator to create assessment structure from pre-computed results
-        generator = DataQualityReportGenerator()
-        assessment_results = generator.create_assessment_from_results(
-            check_results=check_results,
-            dataset_id=dataset_id,
-            connector_type=connector_type
-        )
+        # Load the dataset once and execute each check against the same DataFrame
+        with DatasetSession(dataset_id, connector_type=connector_type, use_cache=use_cache,
+                            sample_duplicates=REPORT_SAMPLE_DUPLICATES, **_load_kwargs(columns, filters, sample_percent)) as session:
+            check_results = session.run_checks(check_list)
+
+        return _assessment_response(check_results, dataset_id, connector_type, check_list)
 
-        # Return the complete assessment results for caching/reuse
+    except Exception as e:
         return {
-            'assessment_results': assessment_results,
-            'assessment_results_json': json.dumps(assessment_results, indent=2, default=str),
-            'summary': {
-                'dataset_id': dataset_id,
-                'connector_type': connector_type,
-                'checks_executed': check_list,
-                'total_checks': assessment_results['summary']['passed_checks'] +
-                               assessment_results['summary']['failed_checks'] +
-                               assessment_results['summary']['error_checks'],
-                'passed_checks': assessment_results['summary']['passed_checks'],
-                'failed_checks': assessment_results['summary']['failed_checks'],
-                'error_checks': assessment_results['summary']['error_checks']
-            },
-            'status': 'success',
-            'message': 'Assessment completed. Use assessment_results_json for report generation without re-execution.'
+            'dataset_id': dataset_id,
+            'error': str(e),
+            'status': 'error'
         }
 
+
+def _load_kwargs(columns: str = '', filters: Union[str, Dict[str, Any], None] = None,
+                 sample_percent: float = 0, sample_method: str = 'row') -> Dict[str, Any]:
+    """
+    DatasetSession load_kwargs for the optional column/row restrictions and sampling of an assessment
+    (filters may be given as a JSON object string, as agent tools receive them).
+    """
+    load_kwargs: Dict[str, Any] = {}
+    column_list = [column.strip() for column in columns.split(',') if column.strip()]
+    if column_list:
+        load_kwargs['columns'] = column_list
+    if isinstance(filters, str):
+        filters = json.loads(filters) if filters.strip() else None
+        if filters is not None and not isinstance(filters, dict):
+            raise ValueError("filters must be a JSON object of {column: value}")
+    if filters:
+        load_kwargs['filters'] = filters
+    if sample_percent:
+        load_kwargs['sample_percent'] = sample_percent
+        load_kwargs['sample_method'] = sample_method
+    return load_kwargs
+
+
+async def arun_comprehensive_dq_assessment(dataset_id: str, connector_type: str = 'postgres',
+                                           checks_to_run: str = 'duplicates,null_values,descriptive_stats',
+                                           use_cache: bool = True, columns: str = '',
+                                           filters: Optional[Dict[str, Any]] = None, sample_percent: float = 0,
+                                           sample_method: str = 'row',
+                                           on_check: Optional[Callable[[str, Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+    """
+    Async variant of run_comprehensive_dq_assessment (not an agent tool).
+
+    The table is loaded through the connector's async API, so many assessments can share one
+    event loop.
+
+    Args:
+        dataset_id: Full table name
+        connector_type: Database type - 'snowflake' or 'postgres'
+        checks_to_run: Comma-separated list of checks (default: all)
+        use_cache: Reuse cached results while the table is unchanged
+        columns: Optional comma-separated column names to assess
+        filters: Optional row filters {column: value}; a list value means IN and an
+                 {operator: value} dict a comparison (see BaseConnector.build_select_query)
+        sample_percent: Optional percentage of the table to sample (0 = every row)
+        sample_method: 'row' or 'block' sampling
+        on_check: Called with (check_name, result) as each check completes (e.g. to stream progress)
+
+    Returns:
+        Same dictionary as run_comprehensive_dq_assessment
+    """
+    try:
+        check_list = [check.strip() for check in checks_to_run.split(',')]
+
+        async with DatasetSession(dataset_id, connector_type=connector_type, use_cache=use_cache,
+                                  sample_duplicates=REPORT_SAMPLE_DUPLICATES, **_load_kwargs(columns, filters, sample_percent, sample_method)) as session:
+            check_results = await session.arun_checks(check_list, on_check=on_check)
+
+        return _assessment_response(check_results, dataset_id, connector_type, check_list)
+
     except Exception as e:
         return {
             'dataset_id': dataset_id,
@@ -84,6 +120,99 @@ def run_comprehensive_dq_assessment(dataset_id: str, connector_type: str = 'post
         }
 
 
+def _assessment_response(check_results: Dict[str, Any], dataset_id: str, connector_type: str,
+                         check_list: List[str]) -> Dict[str, Any]:
+    """Build the assessment tools' response from per-check results."""
+    # Use DataQualityReportGenerator to create assessment structure from pre-computed results
+    generator = DataQualityReportGenerator()
+    assessment_results = generator.create_assessment_from_results(
+        check_results=check_results,
+        dataset_id=dataset_id,
+        connector_type=connector_type
+    )
+
+    # Return the complete assessment results for caching/reuse
+    return {
+        'assessment_results': assessment_results,
+        'assessment_results_json': json.dumps(assessment_results, indent=2, default=str),
+        'summary': {
+            'dataset_id': dataset_id,
+            'connector_type': connector_type,
+            'checks_executed': check_list,
+            'total_checks': assessment_results['summary']['passed_checks'] +
+                           assessment_results['summary']['failed_checks'] +
+                           assessment_results['summary']['error_checks'],
+            'passed_checks': assessment_results['summary']['passed_checks'],
+            'failed_checks': assessment_results['summary']['failed_checks'],
+            'error_checks': assessment_results['summary']['error_checks'],
+            'cached_checks': assessment_results['metadata']['cached_checks']
+        },
+        'status': 'success',
+        'message': 'Assessment completed. Use assessment_results_json for report generation without re-execution.'
+    }
+
+
+def run_multi_table_dq_assessment(dataset_ids: str, connector_type: str = 'postgres',
+                                  checks_to_run: str = 'duplicates,null_values,descriptive_stats',
+                                  use_cache: bool = True) -> Dict[str, Any]:
+    """
+    Run the same data quality checks on several tables at once.
+
+    The tables are assessed concurrently, so this is much faster than calling
+    run_comprehensive_dq_assessment once per table. Use it when the user asks about
+    more than one table of the same data source.
+
+    Args:
+        dataset_ids: Comma-separated full table names (e.g., 'DB.SCHEMA.ORDERS,DB.SCHEMA.CUSTOMERS')
+        connector_type: Database type - 'snowflake' or 'postgres' (REQUIRED - use the connector type from the context)
+        checks_to_run: Comma-separated list of checks: 'duplicates', 'null_values', 'descriptive_stats' (default: all)
+        use_cache: Reuse cached results while a table is unchanged (set False to force a re-scan)
+
+    Returns:
+        Dictionary with one summary per table (in the order given) and the overall status
+    """
+    datasets = [dataset_id.strip() for dataset_id in dataset_ids.split(',') if dataset_id.strip()]
+    if not datasets:
+        return {
+            'dataset_id': dataset_ids,
+            'error': 'No dataset ids given',
+            'status': 'error'
+        }
+
+    tasks = [(dataset_id, connector_type, checks_to_run) for dataset_id in datasets]
+    outcomes = sorted(assess_tables(tasks, use_cache=use_cache), key=lambda outcome: outcome['index'])
+
+    tables = []
+    for outcome in outcomes:
+        if outcome['status'] != 'success':
+            tables.append({
+                'dataset_id': outcome['dataset_id'],
+                'error': outcome['error'],
+                'status': 'error'
+            })
+            continue
+
+        summary = outcome['assessment_results']['summary']
+        tables.append({
+            'dataset_id': outcome['dataset_id'],
+            'status': 'success',
+            'passed_checks': summary['passed_checks'],
+            'failed_checks': summary['failed_checks'],
+            'error_checks': summary['error_checks'],
+            'cached_checks': outcome['assessment_results']['metadata']['cached_checks'],
+            'report': _create_summary_report(outcome['assessment_results'])
+        })
+
+    failed = sum(1 for table in tables if table['status'] != 'success')
+    return {
+        'tables': tables,
+        'connector_type': connector_type,
+        'assessed_tables': len(tables) - failed,
+        'failed_tables': failed,
+        'status': 'success' if failed < len(tables) else 'error'
+    }
+
+
 def generate_comprehensive_dq_report(dataset_id: str, connector_type: str = 'postgres',
                                    output_format: str = 'markdown') -> Dict[str, Any]:
     """
@@ -102,22 +231,10 @@ def generate_comprehensive_dq_report(dataset_id: str, connector_type: str = 'pos
         Dictionary containing the report content and summary statistics
     """
     try:
-        # Import the individual DQ check functions directly for optimized execution
-        from src.data_quality.checks import check_dataset_duplicates, check_dataset_null_values, check_dataset_descriptive_stats
-
-        # Map check names to functions
-        available_checks = {
-            'duplicates': check_dataset_duplicates,
-            'null_values': check_dataset_null_values,
-            'descriptive_stats': check_dataset_descriptive_stats
-        }
-
-        # Execute each check directly (single execution)
-        check_results = {}
-        for check_name, check_function in available_checks.items():
-            print(f"Running {check_name} check...")
-            result = check_function(dataset_id, connector_type=connector_type)
-            check_results[check_name] = result
+        # Load the dataset once and execute all checks against the same DataFrame
+        with DatasetSession(dataset_id, connector_type=connector_type,
+                            sample_duplicates=REPORT_SAMPLE_DUPLICATES) as session:
+            check_results = session.run_checks()
 
         # Initialize report generator and create assessment from pre-computed results
         generator = DataQualityReportGenerator()
@@ -186,22 +303,10 @@ def save_dq_report_to_file(dataset_id: str, connector_type: str = 'postgres',
         Dictionary containing file paths and summary information
     """
     try:
-        # Import the individual DQ check functions directly for optimized execution
-        from src.data_quality.checks import check_dataset_duplicates, check_dataset_null_values, check_dataset_descriptive_stats
-
-        # Map check names to functions
-        available_checks = {
-            'duplicates': check_dataset_duplicates,
-            'null_values': check_dataset_null_values,
-            'descriptive_stats': check_dataset_descriptive_stats
-        }
-
-        # Execute each check directly (single execution)
-        check_results = {}
-        for check_name, check_function in available_checks.items():
-            print(f"Running {check_name} check...")
-            result = check_function(dataset_id, connector_type=connector_type)
-            check_results[check_name] = result
+        # Load the dataset once and execute all checks against the same DataFrame
+        with DatasetSession(dataset_id, connector_type=connector_type,
+                            sample_duplicates=REPORT_SAMPLE_DUPLICATES) as session:
+            check_results = session.run_checks()
 
         # Initialize report generator and create assessment from pre-computed results
         generator = DataQualityReportGenerator()
@@ -406,14 +511,18 @@ OVERALL RESULTS:
     for check_name, result in check_results.items():
         status_emoji = "✅" if result['status'] == 'success' else "❌"
         check_title = check_name.replace('_', ' ').title()
-
-        if result['status'] == 'success':
-            if check_name == 'duplicates':
-                duplicate_qty = result.get('duplicate_qty', 0)
-                status_text = "PASS" if duplicate_qty == 0 else "FAIL"
-                report += f"{status_emoji} {check_title}: {status_text} ({duplicate_qty:,} duplicates)\n"
-
-            elif check_name == 'null_values':
+        if result.get('cached'):
+            check_title += " (cached)"
+
+        if check_name == 'duplicates' and 'error' not in result:
+            # The status already accounts for estimates whose interval includes zero
+            duplicate_qty = result.get('duplicate_qty', 0)
+            status_text = "PASS" if result['status'] == 'success' else "FAIL"
+            estimated = "estimated " if result.get('duplicate_qty_bounds') else ""
+            report += f"{status_emoji} {check_title}: {status_text} ({estimated}{duplicate_qty:,} duplicates)\n"
+
+        elif result['status'] == 'success':
+            if check_name == 'null_values':
                 columns_with_nulls = result.get('columns_with_nulls', 0)
                 status_text = "PASS" if columns_with_nulls == 0 else "FAIL"
                 report += f"{status_emoji} {check_title}: {status_text} ({columns_with_nulls} columns with nulls)\n"
@@ -436,6 +545,7 @@ OVERALL RESULTS:
 # Export the tools for agent integration
 REPORTING_TOOLS = [
     run_comprehensive_dq_assessment,
+    run_multi_table_dq_assessment,
     generate_comprehensive_dq_report,
     save_dq_report_to_file,
     generate_report_from_assessment_results,
@@ -3,31 +3,51 @@
 Enhanced agent planner with automatic table discovery via RAG.
 The agent uses embedded schema metadata to find the right tables.
 """
+import json
 import os
+import threading
+from functools import lru_cache
 from dotenv import load_dotenv
 load_dotenv()
 
-from langchain_huggingface import HuggingFaceEmbeddings
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain.agents import AgentExecutor, create_tool_calling_agent
 from langchain_core.tools import StructuredTool
 from src.data_quality.checks import DQ_TOOLS
 from src.agent.reporting_tools import REPORTING_TOOLS
-from src.retrieval.schema_indexer import SchemaIndexer
+from src.retrieval.schema_indexer import get_schema_indexer
+from src.agent.fast_path import plan_fast_path, run_fast_path
+
+# Connection pool of the HTTP client shared by every LLM call (keep-alive to the LLM endpoint)
+LLM_MAX_CONNECTIONS = 20
+LLM_TIMEOUT = 120.0
+
+_llm = None
+_agent = None
+_llm_lock = threading.Lock()
+_agent_lock = threading.Lock()
 
 
 def get_schema_aware_retriever():
-    """Initialize schema discovery for finding relevant tables."""
-    return SchemaIndexer()
+    """Get the process-wide schema indexer for finding relevant tables (model loaded once per process)."""
+    return get_schema_indexer()
 
 
 def create_dq_tool_wrapper(dq_function):
     """
     Create a wrapper function for DQ tools that adds connector support.
     """
-    def wrapper(dataset_id: str, connector_type: str = 'snowflake') -> dict:
-        return dq_function(dataset_id, connector_type=connector_type)
+    def wrapper(dataset_id: str, connector_type: str = 'snowflake', columns: str = '', filters: str = '',
+                sample_percent: float = 0) -> dict:
+        column_list = [column.strip() for column in columns.split(',') if column.strip()]
+        try:
+            filter_dict = json.loads(filters) if filters.strip() else None
+        except json.JSONDecodeError as e:
+            return {"dataset_id": dataset_id, "error": f"filters is not valid JSON: {e}", "status": "failure"}
+        return dq_function(dataset_id, connector_type=connector_type,
+                           columns=column_list or None, filters=filter_dict,
+                           sample_percent=sample_percent or None)
 
     # Preserve the original function's metadata
     wrapper.__name__ = dq_function.__name__
@@ -36,9 +56,11 @@ def create_dq_tool_wrapper(dq_function):
     return wrapper
 
 
-def create_smart_dq_agent():
+@lru_cache(maxsize=1)
+def get_dq_tools() -> tuple:
     """
-    Creates an enhanced LLM agent that can discover tables automatically.
+    Build the agent's tools once per process: DQ checks (wrapped for connector support)
+    followed by the reporting tools.
     """
     # Convert all DQ functions to tools supporting multiple connectors
     dq_tools = []
@@ -54,18 +76,27 @@ def create_smart_dq_agent():
             Args:
                 dataset_id: Full table name (e.g., 'DATABASE.SCHEMA.TABLE' for Snowflake or 'schema.table' for postgres)
                 connector_type: Database type - 'snowflake' or 'postgres' (REQUIRED - use the connector type from the context)
+                columns: Optional comma-separated column names to check (only these columns are read)
+                filters: Optional JSON object limiting the rows checked, e.g. '{"order_date": {">=": "2024-01-01"}, "region": "EU"}' (operators: =, !=, <, <=, >, >=, in, not in, like; a list value means any of)
+                sample_percent: Optional percentage of the table to sample (e.g. 1) for a fast estimate with 95% confidence intervals; 0 checks every row
             """
         elif 'null' in dq_function.__name__:
             description = """Analyze null values and missing data in a database table.
             Args:
                 dataset_id: Full table name (e.g., 'DATABASE.SCHEMA.TABLE' for Snowflake or 'schema.table' for postgres)
                 connector_type: Database type - 'snowflake' or 'postgres' (REQUIRED - use the connector type from the context)
+                columns: Optional comma-separated column names to check (only these columns are read)
+                filters: Optional JSON object limiting the rows checked, e.g. '{"order_date": {">=": "2024-01-01"}, "region": "EU"}' (operators: =, !=, <, <=, >, >=, in, not in, like; a list value means any of)
+                sample_percent: Optional percentage of the table to sample (e.g. 1) for a fast estimate with 95% confidence intervals; 0 checks every row
             """
         else:
             description = f"""Execute data quality check: {dq_function.__name__}
             Args:
                 dataset_id: Full table name (e.g., 'DATABASE.SCHEMA.TABLE' for Snowflake or 'schema.table' for postgres)
                 connector_type: Database type - 'snowflake' or 'postgres' (REQUIRED - use the connector type from the context)
+                columns: Optional comma-separated column names to check (only these columns are read)
+                filters: Optional JSON object limiting the rows checked, e.g. '{"order_date": {">=": "2024-01-01"}, "region": "EU"}' (operators: =, !=, <, <=, >, >=, in, not in, like; a list value means any of)
+                sample_percent: Optional percentage of the table to sample (e.g. 1) for a fast estimate with 95% confidence intervals; 0 checks every row
             """
 
         # Create structured tool
@@ -85,6 +116,12 @@ def create_smart_dq_agent():
         )
         dq_tools.append(tool)
 
+    return tuple(dq_tools)
+
+
+@lru_cache(maxsize=1)
+def get_agent_prompt() -> ChatPromptTemplate:
+    """The agent's system prompt and message layout (built once per process)."""
     # Define the enhanced prompt
     prompt = ChatPromptTemplate.from_messages([
         ("system",
@@ -97,8 +134,10 @@ def create_smart_dq_agent():
             - For "null values", "missing data", "nulls", "missing values" → use check_dataset_null_values
             - For "descriptive stats", "statistics", "data summary" → use check_dataset_descriptive_stats
             - For "comprehensive assessment", "full assessment", "all checks" → use run_comprehensive_dq_assessment (RECOMMENDED - most efficient)
+            - For the same checks on SEVERAL tables of one data source → use run_multi_table_dq_assessment (assesses them concurrently)
             - For "comprehensive report", "full report", "assessment report", "generate report" → use generate_comprehensive_dq_report
             - For "save report", "export report", "create files" → use save_dq_report_to_file
+            - For quick or exploratory questions ("roughly", "estimate", "quick look") → pass sample_percent=1 to the check tools and report the results as estimates with their confidence intervals
          3. The system will provide you with RELEVANT TABLES found via semantic search
          4. Each table shows its DATA SOURCE (SNOWFLAKE, POSTGRES, etc.) and Connector Type
          5. Select the most appropriate table from the provided options, MATCHING the data source the user asked about
@@ -210,28 +249,74 @@ def create_smart_dq_agent():
         MessagesPlaceholder(variable_name="agent_scratchpad"),
     ])
 
-    # Initialize LLM
-    llm = ChatOpenAI(
-        temperature=0,
-        model="l2-gpt-4o",
-        openai_api_key=os.getenv("OPENAI_API_KEY"),
-        openai_api_base=os.getenv("OPENAI_BASE_URL")
-    )
+    return prompt
+
+
+def get_llm() -> ChatOpenAI:
+    """
+    Shared chat model for the agent.
+
+    One httpx client (and its keep-alive connection pool) is reused for every request
+    instead of opening new TLS connections to the LLM endpoint per agent.
+    """
+    global _llm
+    with _llm_lock:
+        if _llm is None:
+            import httpx
+            http_client = httpx.Client(
+                limits=httpx.Limits(max_connections=LLM_MAX_CONNECTIONS,
+                                    max_keepalive_connections=LLM_MAX_CONNECTIONS),
+                timeout=LLM_TIMEOUT
+            )
+            _llm = ChatOpenAI(
+                temperature=0,
+                model="l2-gpt-4o",
+                openai_api_key=os.getenv("OPENAI_API_KEY"),
+                openai_api_base=os.getenv("OPENAI_BASE_URL"),
+                http_client=http_client
+            )
+        return _llm
+
+
+def create_smart_dq_agent():
+    """
+    Creates an enhanced LLM agent that can discover tables automatically.
+
+    Tools, prompt and LLM client are shared; use get_smart_dq_agent() to also reuse the
+    executor itself.
+    """
+    dq_tools = list(get_dq_tools())
 
     # Create agent with all DQ tools
-    agent = create_tool_calling_agent(llm, dq_tools, prompt)
+    agent = create_tool_calling_agent(get_llm(), dq_tools, get_agent_prompt())
     executor = AgentExecutor(agent=agent, tools=dq_tools, verbose=True)
 
     return executor
 
 
-def run_smart_dq_check(query: str, top_k_tables: int = 3):
+def get_smart_dq_agent():
+    """
+    Get the process-wide agent executor, building it on first use.
+
+    The executor keeps no per-request state (chat history is passed to invoke()), so it
+    can be invoked from several threads at once.
+    """
+    global _agent
+    with _agent_lock:
+        if _agent is None:
+            _agent = create_smart_dq_agent()
+        return _agent
+
+
+def run_smart_dq_check(query: str, top_k_tables: int = 3, use_fast_path: bool = True):
     """
     Run data quality check with automatic table discovery.
 
     Args:
         query: User's natural language query
         top_k_tables: Number of relevant tables to retrieve
+        use_fast_path: Run "<check> on <table>" requests that name exactly one indexed
+                       table directly, without the LLM agent
 
     Returns:
         Agent's response with DQ check results
@@ -247,6 +332,18 @@ def run_smart_dq_check(query: str, top_k_tables: int = 3):
 
     schema_indexer = get_schema_aware_retriever()
 
+    # Unambiguous "<check> on <table>" requests skip the LLM entirely
+    plan = plan_fast_path(query, schema_indexer) if use_fast_path else None
+    if plan:
+        print(f"Fast path: {', '.join(plan['checks'])} on [{plan['connector_type'].upper()}] {plan['dataset_id']}")
+        result = run_fast_path(query, plan)
+
+        print(f"\n{'='*70}")
+        print("RESULT")
+        print(f"{'='*70}\n")
+
+        return result
+
     # First get all potential matches to check best relevance
     all_matches = schema_indexer.search_tables(query, top_k=10, min_relevance=0.0)
 
@@ -297,7 +394,7 @@ def run_smart_dq_check(query: str, top_k_tables: int = 3):
     print("\nStep 3: Running agent with discovered tables...")
     print("-" * 70)
 
-    agent = create_smart_dq_agent()
+    agent = get_smart_dq_agent()
     result = agent.invoke({"input": full_input, "chat_history": []})
 
     print(f"\n{'='*70}")
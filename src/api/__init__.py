@@ -0,0 +1,5 @@
+# API module - HTTP service with a job queue for data quality assessments
+from .app import app, create_app
+from .jobs import Job, JobQueue, JobQueueFull
+
+__all__ = ['app', 'create_app', 'Job', 'JobQueue', 'JobQueueFull']
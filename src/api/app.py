@@ -0,0 +1,290 @@
+# src/api/app.py
+"""
+HTTP service for data quality assessments.
+
+Endpoints:
+    GET  /health                   Service and job queue status
+    GET  /tables/search?q=...      Hybrid table search over the schema index
+    POST /assessments              Queue an assessment of one table (returns a job)
+    POST /queries                  Queue a natural-language request for the agent (returns a job)
+    GET  /jobs/{job_id}            Job status and, once finished, its result
+    GET  /jobs/{job_id}/events     Job progress as Server-Sent Events
+
+The embedding model, schema vector store, agent and connector pools are loaded once at
+startup and shared by every request. Run with `python -m src.api.app` (host, port and queue
+limits come from the api section of settings.yaml).
+"""
+import asyncio
+import json
+import os
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Literal, Optional
+import yaml
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field
+from src.agent.reporting_tools import arun_comprehensive_dq_assessment
+from src.agent.smart_planner import get_smart_dq_agent, run_smart_dq_check
+from src.connectors.connector_factory import ConnectorFactory
+from src.data_quality.checks import DQ_CHECKS, smart_connector_detection
+from src.retrieval.schema_indexer import get_schema_indexer, warm_up_retrieval
+from .jobs import (
+    DEFAULT_JOB_RETENTION,
+    DEFAULT_JOB_WORKERS,
+    DEFAULT_MAX_QUEUED_JOBS,
+    TERMINAL_EVENTS,
+    Job,
+    JobQueue,
+    JobQueueFull,
+)
+
+# Loopback only by default; set api.host (e.g. 0.0.0.0) to serve other machines
+DEFAULT_API_HOST = '127.0.0.1'
+DEFAULT_API_PORT = 8000
+
+# Seconds between SSE keep-alive comments while a job is quiet
+SSE_KEEPALIVE_SECONDS = 15
+
+
+class AssessmentRequest(BaseModel):
+    # Unknown fields (e.g. a raw SQL 'where') are rejected with 422 rather than silently ignored
+    model_config = ConfigDict(extra='forbid')
+
+    dataset_id: str = Field(..., description="Full table name, e.g. 'PROD_SALES.PUBLIC.ORDERS' or 'public.orders'")
+    connector_type: Optional[str] = Field(None, description="'snowflake' or 'postgres' (auto-detected if omitted)")
+    checks: Optional[List[str]] = Field(None, description="Checks to run (default: all)")
+    use_cache: bool = Field(True, description="Reuse cached results while the table is unchanged")
+    columns: Optional[List[str]] = Field(None, description="Only assess these columns (default: all)")
+    filters: Optional[Dict[str, Any]] = Field(
+        None, description="Row filters {column: value}; a list value means IN, null means IS NULL, and an "
+                          "{operator: value} object a comparison, e.g. {\"order_date\": {\">=\": \"2024-01-01\"}}"
+    )
+    sample_percent: Optional[float] = Field(
+        None, gt=0, le=100, description="Estimate from a random sample of this percentage of the table"
+    )
+    sample_method: Literal['row', 'block'] = Field('row', description="'row' (Bernoulli) or 'block' sampling")
+
+
+class QueryRequest(BaseModel):
+    query: str = Field(..., description="Natural-language data quality request")
+    top_k_tables: int = Field(3, ge=1, le=10, description="Tables retrieved for the agent's context")
+
+
+def _load_settings() -> Dict[str, Any]:
+    """Load settings.yaml (empty if missing)."""
+    settings_path = os.path.join(os.path.dirname(__file__), '../../config/settings.yaml')
+    if not os.path.exists(settings_path):
+        return {}
+
+    with open(settings_path, 'r') as f:
+        return yaml.safe_load(f) or {}
+
+
+def _warm_up(settings: Dict[str, Any]) -> None:
+    """Load the embedding model, vector store, agent and one pooled connection per configured connector."""
+    warm_up_retrieval()
+
+    try:
+        get_smart_dq_agent()
+    except Exception as e:
+        print(f"Warning: Could not create the DQ agent at startup ({e}); /queries will retry on first use")
+
+    connector_types = [name for name, config in (settings.get('connectors') or {}).items() if config]
+    for connector_type in connector_types:
+        try:
+            with ConnectorFactory.connection(connector_type):
+                pass
+        except Exception as e:
+            print(f"Warning: Could not open a {connector_type} connection at startup: {e}")
+
+
+def _format_event(record: Dict[str, Any]) -> str:
+    """Serialise a job event as an SSE message."""
+    return f"id: {record['id']}\nevent: {record['event']}\ndata: {json.dumps(record['data'], default=str)}\n\n"
+
+
+async def _event_stream(job: Job) -> AsyncIterator[str]:
+    """Replay a job's events, then follow it until it completes or fails."""
+    queue = job.subscribe()
+    try:
+        while True:
+            try:
+                record = await asyncio.wait_for(queue.get(), timeout=SSE_KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            yield _format_event(record)
+            if record['event'] in TERMINAL_EVENTS:
+                return
+    finally:
+        job.unsubscribe(queue)
+
+
+async def _run_assessment(job: Job) -> Dict[str, Any]:
+    """Job runner: assess one table, emitting a check_completed event per check."""
+    params = job.params
+    checks = params['checks']
+    completed = 0
+
+    def on_check(check_name: str, result: Dict[str, Any]) -> None:
+        nonlocal completed
+        completed += 1
+        job.emit(
+            'check_completed',
+            check=check_name,
+            status=result.get('status'),
+            cached=result.get('cached', False),
+            completed=completed,
+            total=len(checks)
+        )
+
+    response = await arun_comprehensive_dq_assessment(
+        dataset_id=params['dataset_id'],
+        connector_type=params['connector_type'],
+        checks_to_run=','.join(checks),
+        use_cache=params['use_cache'],
+        columns=','.join(params['columns'] or []),
+        filters=params['filters'],
+        sample_percent=params['sample_percent'] or 0,
+        sample_method=params['sample_method'],
+        on_check=on_check
+    )
+    if response.get('status') != 'success':
+        raise RuntimeError(response.get('error', 'Unknown error'))
+
+    return {
+        'summary': response['summary'],
+        'assessment_results': json.loads(response['assessment_results_json'])
+    }
+
+
+async def _run_query(job: Job) -> Dict[str, Any]:
+    """Job runner: answer a natural-language request with the (blocking) agent on a worker thread."""
+    result = await asyncio.to_thread(run_smart_dq_check, job.params['query'], job.params['top_k_tables'])
+    return {
+        'output': result.get('output'),
+        'fast_path': result.get('fast_path', False)
+    }
+
+
+def _job_response(request: Request, job: Job) -> Dict[str, Any]:
+    return {
+        **job.to_dict(include_result=False),
+        'status_url': str(request.url_for('get_job', job_id=job.id)),
+        'events_url': str(request.url_for('get_job_events', job_id=job.id))
+    }
+
+
+def create_app(warm_up: Optional[bool] = None) -> FastAPI:
+    """
+    Build the FastAPI application.
+
+    Args:
+        warm_up: Load models, agent and connections at startup (default: api.warm_up in
+                 settings.yaml, true if unset)
+
+    Returns:
+        FastAPI app whose job queue starts and stops with the app's lifespan
+    """
+    settings = _load_settings()
+    api_settings = settings.get('api') or {}
+    if warm_up is None:
+        warm_up = api_settings.get('warm_up', True)
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        if warm_up:
+            await asyncio.to_thread(_warm_up, settings)
+        app.state.jobs = JobQueue(
+            workers=api_settings.get('workers', DEFAULT_JOB_WORKERS),
+            max_queued=api_settings.get('max_queued_jobs', DEFAULT_MAX_QUEUED_JOBS),
+            retention=api_settings.get('job_retention_seconds', DEFAULT_JOB_RETENTION)
+        )
+        await app.state.jobs.start()
+        try:
+            yield
+        finally:
+            await app.state.jobs.stop()
+            ConnectorFactory.close_all_pools()
+
+    app = FastAPI(title="Data Quality Agent API", lifespan=lifespan)
+
+    @app.get("/health")
+    async def health(request: Request) -> Dict[str, Any]:
+        return {'status': 'ok', 'jobs': request.app.state.jobs.get_stats()}
+
+    @app.get("/tables/search")
+    def search_tables(q: str, top_k: int = 5, min_relevance: float = 0.0) -> Dict[str, Any]:
+        # Plain def: FastAPI runs it on its thread pool, the event loop stays free
+        return {'query': q, 'tables': get_schema_indexer().search_tables(q, top_k=top_k, min_relevance=min_relevance)}
+
+    @app.post("/assessments", status_code=202)
+    async def submit_assessment(body: AssessmentRequest, request: Request) -> Dict[str, Any]:
+        checks = body.checks or list(DQ_CHECKS.keys())
+        unknown = [check for check in checks if check not in DQ_CHECKS]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown checks: {unknown}. Available checks: {list(DQ_CHECKS.keys())}")
+
+        params = {
+            'dataset_id': body.dataset_id,
+            'connector_type': body.connector_type or smart_connector_detection(body.dataset_id),
+            'checks': checks,
+            'use_cache': body.use_cache,
+            'columns': body.columns,
+            'filters': body.filters,
+            'sample_percent': body.sample_percent,
+            'sample_method': body.sample_method
+        }
+        try:
+            job = request.app.state.jobs.submit('assessment', params, _run_assessment)
+        except JobQueueFull as e:
+            raise HTTPException(status_code=429, detail=str(e))
+        return _job_response(request, job)
+
+    @app.post("/queries", status_code=202)
+    async def submit_query(body: QueryRequest, request: Request) -> Dict[str, Any]:
+        params = {'query': body.query, 'top_k_tables': body.top_k_tables}
+        try:
+            job = request.app.state.jobs.submit('query', params, _run_query)
+        except JobQueueFull as e:
+            raise HTTPException(status_code=429, detail=str(e))
+        return _job_response(request, job)
+
+    @app.get("/jobs/{job_id}", name='get_job')
+    async def get_job(job_id: str, request: Request) -> Dict[str, Any]:
+        job = request.app.state.jobs.get(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+        return job.to_dict()
+
+    @app.get("/jobs/{job_id}/events", name='get_job_events')
+    async def get_job_events(job_id: str, request: Request) -> StreamingResponse:
+        job = request.app.state.jobs.get(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+        return StreamingResponse(
+            _event_stream(job),
+            media_type='text/event-stream',
+            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+        )
+
+    return app
+
+
+app = create_app()
+
+
+def main() -> None:
+    """Run the service with uvicorn (host and port from the api section of settings.yaml)."""
+    import uvicorn
+
+    api_settings = _load_settings().get('api') or {}
+    uvicorn.run(
+        app,
+        host=api_settings.get('host', DEFAULT_API_HOST),
+        port=api_settings.get('port', DEFAULT_API_PORT)
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+# src/api/jobs.py
+"""
+In-process job queue for the API service.
+
+Submitted jobs wait in an asyncio queue and are run by a fixed number of worker tasks, so at
+most `workers` assessments are in flight however many requests arrive; beyond `max_queued`
+waiting jobs new submissions are refused. Every job keeps an ordered list of progress events
+that subscribers (the SSE endpoint) replay and then follow live.
+"""
+import asyncio
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+# Assessments run at the same time
+DEFAULT_JOB_WORKERS = 4
+
+# Jobs waiting for a worker before submissions are refused
+DEFAULT_MAX_QUEUED_JOBS = 100
+
+# Seconds a finished job (and its result) stays retrievable
+DEFAULT_JOB_RETENTION = 3600
+
+# Events that end a job's event stream
+TERMINAL_EVENTS = ('completed', 'failed')
+
+
+class JobQueueFull(RuntimeError):
+    """Raised when a job is submitted while max_queued jobs are already waiting."""
+
+
+class Job:
+    """
+    One submitted unit of work, its state and its progress events.
+
+    All methods must be called on the event loop thread that runs the JobQueue.
+    """
+
+    def __init__(self, kind: str, params: Dict[str, Any]):
+        """
+        Args:
+            kind: Job type (e.g. 'assessment', 'query')
+            params: Request parameters, echoed back in job status
+        """
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.params = params
+        self.status = 'queued'
+        self.result: Optional[Any] = None
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.events: List[Dict[str, Any]] = []
+        self._subscribers: List[asyncio.Queue] = []
+
+    @property
+    def finished(self) -> bool:
+        """Whether the job has completed or failed."""
+        return self.status in ('succeeded', 'failed')
+
+    def emit(self, event: str, **data) -> None:
+        """Record a progress event and deliver it to every subscriber."""
+        record = {
+            'id': len(self.events),
+            'event': event,
+            'data': {'job_id': self.id, 'timestamp': time.time(), **data}
+        }
+        self.events.append(record)
+        for queue in self._subscribers:
+            queue.put_nowait(record)
+        if event in TERMINAL_EVENTS:
+            self._subscribers = []
+
+    def subscribe(self) -> asyncio.Queue:
+        """
+        Follow the job's events.
+
+        Returns:
+            Queue pre-filled with every past event, then receiving new ones until a terminal event
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        for record in self.events:
+            queue.put_nowait(record)
+        if not self.finished:
+            self._subscribers.append(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        """Stop delivering events to a queue returned by subscribe()."""
+        if queue in self._subscribers:
+            self._subscribers.remove(queue)
+
+    def to_dict(self, include_result: bool = True) -> Dict[str, Any]:
+        """Job status as a JSON-serialisable dict."""
+        status = {
+            'job_id': self.id,
+            'kind': self.kind,
+            'status': self.status,
+            'params': self.params,
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+            'events': len(self.events)
+        }
+        if self.error is not None:
+            status['error'] = self.error
+        if include_result and self.result is not None:
+            status['result'] = self.result
+        return status
+
+
+class JobQueue:
+    """
+    Bounded worker pool behind a FIFO job queue.
+
+    Example:
+        queue = JobQueue(workers=4)
+        await queue.start()
+        job = queue.submit('assessment', {'dataset_id': 'public.orders'}, run_assessment)
+        ...
+        await queue.stop()
+    """
+
+    def __init__(self, workers: int = DEFAULT_JOB_WORKERS, max_queued: int = DEFAULT_MAX_QUEUED_JOBS,
+                 retention: float = DEFAULT_JOB_RETENTION):
+        """
+        Args:
+            workers: Jobs run at the same time
+            max_queued: Jobs allowed to wait for a worker
+            retention: Seconds finished jobs are kept for status and result lookups
+        """
+        self.workers = max(1, workers)
+        self.max_queued = max_queued
+        self.retention = retention
+        self._jobs: Dict[str, Job] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker_tasks: List[asyncio.Task] = []
+
+    async def start(self) -> None:
+        """Start the worker tasks on the running event loop."""
+        self._queue = asyncio.Queue()
+        self._worker_tasks = [asyncio.create_task(self._work()) for _ in range(self.workers)]
+
+    async def stop(self) -> None:
+        """Cancel the worker tasks (running jobs are abandoned)."""
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+
+    @property
+    def pending(self) -> int:
+        """Jobs waiting for a worker."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def submit(self, kind: str, params: Dict[str, Any], runner: Callable[[Job], Awaitable[Any]]) -> Job:
+        """
+        Queue a job.
+
+        Args:
+            kind: Job type
+            params: Request parameters
+            runner: Coroutine function run by a worker with the job; its return value becomes
+                    the job result, an exception fails the job
+
+        Returns:
+            The queued Job
+
+        Raises:
+            JobQueueFull: If max_queued jobs are already waiting
+        """
+        if self._queue is None:
+            raise RuntimeError("JobQueue.start() has not been called")
+        if self.pending >= self.max_queued:
+            raise JobQueueFull(f"{self.pending} jobs are already waiting; try again later")
+
+        self._prune()
+        job = Job(kind, params)
+        self._jobs[job.id] = job
+        self._queue.put_nowait((job, runner))
+        job.emit('queued', position=self.pending)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Look up a job by id (None if unknown or expired)."""
+        return self._jobs.get(job_id)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Worker count and job counts by status."""
+        counts: Dict[str, int] = {}
+        for job in self._jobs.values():
+            counts[job.status] = counts.get(job.status, 0) + 1
+        return {'workers': self.workers, 'max_queued': self.max_queued, 'pending': self.pending, 'jobs': counts}
+
+    def _prune(self) -> None:
+        """Forget finished jobs older than the retention period."""
+        cutoff = time.time() - self.retention
+        expired = [job_id for job_id, job in self._jobs.items() if job.finished and job.finished_at < cutoff]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    async def _work(self) -> None:
+        while True:
+            job, runner = await self._queue.get()
+            job.status = 'running'
+            job.started_at = time.time()
+            job.emit('started')
+            try:
+                job.result = await runner(job)
+                job.status = 'succeeded'
+                job.finished_at = time.time()
+                job.emit('completed', seconds=round(job.finished_at - job.started_at, 3))
+            except asyncio.CancelledError:
+                job.status = 'failed'
+                job.error = 'Service shutting down'
+                job.finished_at = time.time()
+                job.emit('failed', error=job.error)
+                raise
+            except Exception as e:
+                job.status = 'failed'
+                job.error = str(e)
+                job.finished_at = time.time()
+                job.emit('failed', error=job.error)
+            finally:
+                self._queue.task_done()
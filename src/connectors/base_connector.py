@@ -1,12 +1,44 @@
 # src/connectors/base_connector.py
+import asyncio
+import math
+import re
 from abc import ABC, abstractmethod
+from datetime import date
+from decimal import Decimal
 import pandas as pd
-from typing import Dict, Any, Optional
+from typing import Dict, Any, AsyncIterator, Iterator, List, Optional
+
+# Default number of rows per batch for stream_batches()
+DEFAULT_BATCH_ROWS = 100_000
+
+_PLAIN_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_$]*$")
+_QUOTED_IDENTIFIER = re.compile(r'^"(?:[^"]|"")+"$')
+
+# Table sampling methods: 'row' keeps each row independently with the given probability
+# (Bernoulli), 'block' keeps whole storage blocks/pages (faster, but rows stored together are
+# sampled together)
+SAMPLE_METHODS = ('row', 'block')
+
+# Seed used for samples unless another is given, so repeated samples return the same rows
+DEFAULT_SAMPLE_SEED = 42
+
+# Comparison operators accepted in {column: {operator: value}} filters, with their SQL form
+FILTER_OPERATORS = {
+    '=': '=', '!=': '<>', '<>': '<>', '<': '<', '<=': '<=', '>': '>', '>=': '>=',
+    'in': 'IN', 'not in': 'NOT IN', 'like': 'LIKE', 'not like': 'NOT LIKE'
+}
 
 
 class BaseConnector(ABC):
     """Abstract base class for all data source connectors."""
 
+    # SQL dialect spoken by the data source (used for push-down execution), None if not SQL
+    dialect: Optional[str] = None
+
+    # True if aconnect/aload_data/astream_batches use a native async driver; otherwise the
+    # default implementations below run the blocking methods on a worker thread
+    native_async: bool = False
+
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize the connector with configuration.
@@ -32,6 +64,172 @@ class BaseConnector(ABC):
         """
         Load data from the data source.
 
+        Args:
+            dataset_id: Identifier for the dataset (table name, file path, etc.)
+            **kwargs: Additional parameters specific to the connector (SQL connectors accept
+                      query, limit, columns, filters and the sample_* options; see
+                      build_select_query)
+
+        Returns:
+            DataFrame containing the loaded data
+        """
+        pass
+
+    def stream_batches(self, dataset_id: str, batch_rows: int = DEFAULT_BATCH_ROWS,
+                       query: Optional[str] = None, limit: Optional[int] = None,
+                       columns: Optional[List[str]] = None, filters: Optional[Dict[str, Any]] = None, sample_percent: Optional[float] = None,
+                       sample_method: str = 'row',
+                       sample_seed: Optional[int] = DEFAULT_SAMPLE_SEED) -> Iterator[pd.DataFrame]:
+        """
+        Load data from the data source as a sequence of bounded-size DataFrames.
+
+        Connectors should override this with a server-side cursor so that only one batch
+        is held in memory at a time. This default implementation loads everything with
+        load_data() and slices it, so it is correct but not memory-bounded.
+
+        Args:
+            dataset_id: Identifier for the dataset (table name, file path, etc.)
+            batch_rows: Maximum number of rows per yielded DataFrame
+            query: Optional custom SQL query (overrides dataset_id, columns and filters)
+            limit: Optional row limit
+            columns: Optional columns to read (default: all)
+            filters: Optional {column: value} filters (see build_select_query)
+            sample_percent: Optional percentage of the table to sample (see table_sample_clause)
+            sample_method: 'row' or 'block' sampling
+            sample_seed: Seed making the sample repeatable (None = a different sample each time)
+
+        Yields:
+            DataFrames with at most batch_rows rows each
+        """
+        df = self.load_data(dataset_id, query=query, limit=limit, columns=columns, filters=filters,
+                            sample_percent=sample_percent, sample_method=sample_method, sample_seed=sample_seed)
+        for start in range(0, len(df), batch_rows):
+            yield df.iloc[start:start + batch_rows]
+
+    def quote_identifier(self, column: str) -> str:
+        """
+        Column reference for generated SQL.
+
+        Plain names (letters, digits, _ and $) are left unquoted so the source applies its own
+        case folding ('email' finds Snowflake's EMAIL and PostgreSQL's email); names that are
+        already double-quoted are used as is; anything else is quoted verbatim.
+        """
+        if _PLAIN_IDENTIFIER.match(column) or _QUOTED_IDENTIFIER.match(column):
+            return column
+        return '"' + column.replace('"', '""') + '"'
+
+    def quote_literal(self, value: Any) -> str:
+        """SQL literal for a filter value."""
+        if value is None:
+            return 'NULL'
+        if isinstance(value, bool):
+            return 'TRUE' if value else 'FALSE'
+        if isinstance(value, (int, float, Decimal)):
+            if not math.isfinite(value):
+                raise ValueError(f"Filter values must be finite numbers, got {value}")
+            return str(value)
+        if isinstance(value, date):
+            value = value.isoformat()
+        return "'" + str(value).replace("'", "''") + "'"
+
+    def _filter_predicate(self, column: str, value: Any) -> str:
+        """
+        Predicate for one filter: IS NULL for None, IN (...) for lists, = for other values, and
+        one comparison per entry for a dict of {operator: value} (see FILTER_OPERATORS).
+        """
+        col = self.quote_identifier(column)
+        if isinstance(value, dict):
+            if not value:
+                raise ValueError(f"Empty filter for column {column}")
+            return ' AND '.join(self._comparison(col, operator, operand) for operator, operand in value.items())
+        if value is None:
+            return f"{col} IS NULL"
+        if isinstance(value, (list, tuple, set)):
+            return self._comparison(col, 'in', value)
+        return f"{col} = {self.quote_literal(value)}"
+
+    def _comparison(self, col: str, operator: str, operand: Any) -> str:
+        """'<col> <operator> <literal>' for one operator of a dict filter."""
+        sql_operator = FILTER_OPERATORS.get(str(operator).strip().lower())
+        if sql_operator is None:
+            raise ValueError(f"Unknown filter operator: {operator}. Available operators: {list(FILTER_OPERATORS)}")
+        if sql_operator in ('IN', 'NOT IN'):
+            if not isinstance(operand, (list, tuple, set)):
+                operand = [operand]
+            if not operand:
+                return "1 = 0" if sql_operator == 'IN' else "1 = 1"
+            return f"{col} {sql_operator} ({', '.join(self.quote_literal(item) for item in operand)})"
+        if operand is None:
+            if sql_operator not in ('=', '<>'):
+                raise ValueError(f"Filter operator {operator} can't be compared with NULL")
+            return f"{col} IS NULL" if sql_operator == '=' else f"{col} IS NOT NULL"
+        return f"{col} {sql_operator} {self.quote_literal(operand)}"
+
+    def _where_clause(self, filters: Optional[Dict[str, Any]] = None) -> str:
+        """' WHERE ...' combining the filters with AND (empty if there are none)."""
+        predicates = [self._filter_predicate(column, value) for column, value in (filters or {}).items()]
+        return f" WHERE {' AND '.join(predicates)}" if predicates else ""
+
+    def table_sample_clause(self, percent: float, method: str = 'row', seed: Optional[int] = None) -> str:
+        """
+        Dialect clause placed after the table name to read a random sample of it.
+
+        Args:
+            percent: Percentage of rows (or blocks) to keep, in (0, 100]
+            method: 'row' (each row independently) or 'block' (whole storage blocks)
+            seed: Seed making the sample repeatable, or None
+
+        Returns:
+            SQL fragment, e.g. 'TABLESAMPLE BERNOULLI (1) REPEATABLE (42)'
+        """
+        raise NotImplementedError(f"Table sampling not implemented for {type(self).__name__}")
+
+    def _sample_clause(self, percent: Optional[float], method: str = 'row', seed: Optional[int] = None) -> str:
+        """' <sample clause>' for build_select_query (empty if no sample was requested)."""
+        if percent is None:
+            return ""
+        if not 0 < percent <= 100:
+            raise ValueError(f"sample_percent must be in (0, 100], got {percent}")
+        if method not in SAMPLE_METHODS:
+            raise ValueError(f"Unknown sample_method: {method}. Available methods: {list(SAMPLE_METHODS)}")
+        return f" {self.table_sample_clause(percent, method, seed)}"
+
+    def build_select_query(self, dataset_id: str, query: Optional[str] = None, limit: Optional[int] = None,
+                           columns: Optional[List[str]] = None, filters: Optional[Dict[str, Any]] = None, sample_percent: Optional[float] = None,
+                           sample_method: str = 'row', sample_seed: Optional[int] = DEFAULT_SAMPLE_SEED) -> str:
+        """
+        SQL for load_data/stream_batches: the custom query if given, else a SELECT of the requested
+        columns (default *) from the table or a random sample of it, with the filters and an
+        optional LIMIT.
+
+        Row filters are structured so every value goes through quote_literal: {column: value}
+        means = (None means IS NULL, a list means IN), and {column: {operator: value}} applies
+        the FILTER_OPERATORS comparisons, e.g. {'order_date': {'>=': '2024-01-01'}, 'region': ['EU', 'US']}.
+        """
+        if query:
+            return query
+        projection = ', '.join(self.quote_identifier(column) for column in columns) if columns else '*'
+        sample = self._sample_clause(sample_percent, sample_method, sample_seed)
+        sql_query = f"SELECT {projection} FROM {dataset_id}{sample}{self._where_clause(filters)}"
+        if limit:
+            sql_query += f" LIMIT {int(limit)}"
+        return sql_query
+
+    async def aconnect(self) -> None:
+        """Establish the connection without blocking the event loop."""
+        await asyncio.to_thread(self.connect)
+
+    async def adisconnect(self) -> None:
+        """Close the connection without blocking the event loop."""
+        await asyncio.to_thread(self.disconnect)
+
+    async def aload_data(self, dataset_id: str, **kwargs) -> pd.DataFrame:
+        """
+        Async variant of load_data().
+
+        This default runs load_data() on a worker thread; connectors with an async driver
+        override it.
+
         Args:
             dataset_id: Identifier for the dataset (table name, file path, etc.)
             **kwargs: Additional parameters specific to the connector
@@ -39,6 +237,87 @@ class BaseConnector(ABC):
         Returns:
             DataFrame containing the loaded data
         """
+        return await asyncio.to_thread(self.load_data, dataset_id, **kwargs)
+
+    async def astream_batches(self, dataset_id: str, batch_rows: int = DEFAULT_BATCH_ROWS,
+                              query: Optional[str] = None, limit: Optional[int] = None,
+                              columns: Optional[List[str]] = None, filters: Optional[Dict[str, Any]] = None, sample_percent: Optional[float] = None,
+                              sample_method: str = 'row',
+                              sample_seed: Optional[int] = DEFAULT_SAMPLE_SEED) -> AsyncIterator[pd.DataFrame]:
+        """
+        Async variant of stream_batches().
+
+        This default advances stream_batches() on a worker thread, one batch at a time, so
+        memory stays bounded the same way; connectors with an async driver override it.
+
+        Args:
+            dataset_id: Identifier for the dataset (table name, file path, etc.)
+            batch_rows: Maximum number of rows per yielded DataFrame
+            query: Optional custom SQL query (overrides dataset_id, columns and filters)
+            limit: Optional row limit
+            columns: Optional columns to read (default: all)
+            filters: Optional {column: value} filters (see build_select_query)
+            sample_percent: Optional percentage of the table to sample (see table_sample_clause)
+            sample_method: 'row' or 'block' sampling
+            sample_seed: Seed making the sample repeatable (None = a different sample each time)
+
+        Yields:
+            DataFrames with at most batch_rows rows each
+        """
+        batches = self.stream_batches(dataset_id, batch_rows=batch_rows, query=query, limit=limit,
+                                      columns=columns, filters=filters,
+                                      sample_percent=sample_percent, sample_method=sample_method,
+                                      sample_seed=sample_seed)
+        exhausted = object()
+        try:
+            while True:
+                batch = await asyncio.to_thread(next, batches, exhausted)
+                if batch is exhausted:
+                    break
+                yield batch
+        finally:
+            await asyncio.to_thread(batches.close)
+
+    def describe_columns(self, dataset_id: str) -> List[Dict[str, Any]]:
+        """
+        Get column names and data types for a dataset.
+
+        Args:
+            dataset_id: Identifier for the dataset (table name)
+
+        Returns:
+            List of dicts with 'COLUMN_NAME' and 'DATA_TYPE' keys, in column order
+        """
+        raise NotImplementedError(f"Column description not implemented for {type(self).__name__}")
+
+    async def adescribe_columns(self, dataset_id: str) -> List[Dict[str, Any]]:
+        """
+        Async variant of describe_columns().
+
+        This default runs describe_columns() on a worker thread; connectors with an async driver
+        override it.
+        """
+        return await asyncio.to_thread(self.describe_columns, dataset_id)
+
+    def get_table_version(self, dataset_id: str) -> Optional[str]:
+        """
+        Cheap token that changes whenever the table's contents change (used to key cached check results).
+
+        Args:
+            dataset_id: Identifier for the dataset (table name)
+
+        Returns:
+            Version token, or None if the source can't provide one (results are then not cached)
+        """
+        return None
+
+    def reset(self) -> None:
+        """
+        Return an open connection to a clean state before it is reused (e.g. by a ConnectionPool).
+
+        The default does nothing; connectors with transactional sessions should end any open
+        transaction here.
+        """
         pass
 
     @abstractmethod
@@ -59,3 +338,12 @@ class BaseConnector(ABC):
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
         self.disconnect()
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await self.aconnect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.adisconnect()
@@ -0,0 +1,194 @@
+# src/connectors/connection_pool.py
+"""
+Process-wide pool of connected connectors.
+
+Opening a connector costs a TCP/TLS handshake plus authentication (seconds per login on
+Snowflake). A ConnectionPool keeps connected connectors around after use and hands them
+out again, so repeated loads, push-down queries and schema discovery calls share a small
+number of live sessions instead of logging in every time.
+"""
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Any, Iterator, List, Tuple
+from .base_connector import BaseConnector
+
+# Maximum number of connectors (idle + checked out) per pool
+DEFAULT_POOL_MAX_SIZE = 4
+
+# Seconds an idle connector is kept before it is closed
+DEFAULT_IDLE_TIMEOUT = 300.0
+
+# Idle connectors older than this many seconds are health-checked before being handed out
+DEFAULT_HEALTH_CHECK_AFTER = 30.0
+
+# Seconds checkout() waits for a free connector before giving up
+DEFAULT_CHECKOUT_TIMEOUT = 60.0
+
+
+class ConnectionPool:
+    """
+    Bounded pool of connected connectors for one connector type and configuration.
+
+    Connectors are checked out already connected and must be returned with checkin()
+    (or used through the connection() context manager) instead of being disconnected.
+
+    Example:
+        pool = ConnectionPool(lambda: PostgresConnector(config), max_size=4)
+        with pool.connection() as connector:
+            df = connector.load_data("public.customers")
+    """
+
+    def __init__(self, connector_factory: Callable[[], BaseConnector], max_size: int = DEFAULT_POOL_MAX_SIZE,
+                 idle_timeout: float = DEFAULT_IDLE_TIMEOUT, health_check_after: float = DEFAULT_HEALTH_CHECK_AFTER,
+                 checkout_timeout: float = DEFAULT_CHECKOUT_TIMEOUT):
+        """
+        Args:
+            connector_factory: Callable returning a new, not yet connected connector
+            max_size: Maximum number of open connectors
+            idle_timeout: Seconds an idle connector is kept open
+            health_check_after: Idle seconds after which test_connection() is run on checkout
+            checkout_timeout: Seconds to wait for a free connector before raising TimeoutError
+        """
+        if max_size < 1:
+            raise ValueError(f"max_size must be at least 1, got {max_size}")
+
+        self.connector_factory = connector_factory
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.health_check_after = health_check_after
+        self.checkout_timeout = checkout_timeout
+
+        self._idle: List[Tuple[BaseConnector, float]] = []  # (connector, returned_at), most recent last
+        self._checked_out = 0
+        self._condition = threading.Condition()
+        self.stats = {'created': 0, 'reused': 0, 'discarded': 0}
+
+    @property
+    def size(self) -> int:
+        """Number of open connectors (idle and checked out)."""
+        with self._condition:
+            return len(self._idle) + self._checked_out
+
+    def _close(self, connector: BaseConnector) -> None:
+        self.stats['discarded'] += 1
+        try:
+            connector.disconnect()
+        except Exception:
+            pass
+
+    def _evict_expired(self) -> List[BaseConnector]:
+        """Remove idle connectors past idle_timeout; caller closes them outside the lock."""
+        now = time.monotonic()
+        expired = [connector for connector, returned_at in self._idle if now - returned_at > self.idle_timeout]
+        self._idle = [(connector, returned_at) for connector, returned_at in self._idle
+                      if now - returned_at <= self.idle_timeout]
+        return expired
+
+    def checkout(self) -> BaseConnector:
+        """
+        Take a connected connector from the pool, creating one if there is room.
+
+        Returns:
+            A connected connector
+
+        Raises:
+            TimeoutError: If no connector became available within checkout_timeout
+        """
+        deadline = time.monotonic() + self.checkout_timeout
+        while True:
+            with self._condition:
+                expired = self._evict_expired()
+                candidate = None
+                if self._idle:
+                    candidate, returned_at = self._idle.pop()
+                    self._checked_out += 1
+                elif self._checked_out < self.max_size:
+                    self._checked_out += 1
+                    returned_at = None
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError(f"No connection available after {self.checkout_timeout:g}s "
+                                           f"(pool max_size={self.max_size})")
+                    self._condition.wait(remaining)
+                    continue
+
+            for connector in expired:
+                self._close(connector)
+
+            try:
+                if candidate is None:
+                    connector = self.connector_factory()
+                    connector.connect()
+                    self.stats['created'] += 1
+                    return connector
+
+                stale = time.monotonic() - returned_at > self.health_check_after
+                if stale and not candidate.test_connection():
+                    self._close(candidate)
+                    self._release_slot()
+                    continue
+                self.stats['reused'] += 1
+                return candidate
+            except Exception:
+                self._release_slot()
+                raise
+
+    def _release_slot(self) -> None:
+        with self._condition:
+            self._checked_out -= 1
+            self._condition.notify()
+
+    def checkin(self, connector: BaseConnector, discard: bool = False) -> None:
+        """
+        Return a checked-out connector to the pool.
+
+        Args:
+            connector: Connector obtained from checkout()
+            discard: Close the connector instead of keeping it (e.g. after an error)
+        """
+        if not discard:
+            try:
+                connector.reset()
+            except Exception:
+                discard = True
+
+        if discard:
+            self._close(connector)
+            self._release_slot()
+            return
+
+        with self._condition:
+            self._checked_out -= 1
+            self._idle.append((connector, time.monotonic()))
+            self._condition.notify()
+
+    @contextmanager
+    def connection(self) -> Iterator[BaseConnector]:
+        """Check out a connector for the duration of a with-block; it is discarded if the block raises."""
+        connector = self.checkout()
+        try:
+            yield connector
+        except GeneratorExit:
+            # A streaming generator closed early; the connector itself is still usable
+            self.checkin(connector)
+            raise
+        except BaseException:
+            self.checkin(connector, discard=True)
+            raise
+        else:
+            self.checkin(connector)
+
+    def close_all(self) -> None:
+        """Close every idle connector (checked-out connectors are left alone)."""
+        with self._condition:
+            idle = [connector for connector, _ in self._idle]
+            self._idle = []
+        for connector in idle:
+            self._close(connector)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Pool counters plus current idle/checked-out sizes."""
+        with self._condition:
+            return {**self.stats, 'idle': len(self._idle), 'checked_out': self._checked_out}
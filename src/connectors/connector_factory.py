@@ -1,7 +1,15 @@
 # src/connectors/connector_factory.py
 import os
-from typing import Dict, Any, Optional
+import json
+import atexit
+import asyncio
+import hashlib
+import threading
+import weakref
+from contextlib import asynccontextmanager, contextmanager
+from typing import Dict, Any, AsyncIterator, Iterator, Optional
 from .base_connector import BaseConnector
+from .connection_pool import ConnectionPool, DEFAULT_POOL_MAX_SIZE
 from .snowflake_connector import SnowflakeConnector
 from .postgres_connector import PostgresConnector
 import yaml
@@ -20,6 +28,14 @@ class ConnectorFactory:
         'postgresql': PostgresConnector,
     }
 
+    # Process-wide connection pools, keyed by connector type and configuration
+    _pools: Dict[str, ConnectionPool] = {}
+    _pools_lock = threading.Lock()
+
+    # Per event loop and connector type: limits concurrent native async connections
+    _async_limits: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]' = \
+        weakref.WeakKeyDictionary()
+
     @classmethod
     def create_connector(cls, connector_type: str, config: Optional[Dict[str, Any]] = None, verbose: bool = True) -> BaseConnector:
         """
@@ -50,6 +66,143 @@ class ConnectorFactory:
         connector_class = cls._connectors[connector_type]
         return connector_class(config, verbose=verbose)
 
+    @classmethod
+    def get_pool(cls, connector_type: str, config: Optional[Dict[str, Any]] = None,
+                 verbose: bool = False) -> ConnectionPool:
+        """
+        Get the shared connection pool for a connector type and configuration.
+
+        Pool limits come from the optional 'connection_pool' section of settings.yaml
+        (max_size, idle_timeout, health_check_after, checkout_timeout), overridable per
+        connector under connectors.<type>.connection_pool.
+
+        Args:
+            connector_type: Type of connector ('snowflake', 'postgres')
+            config: Configuration dictionary. If None, loads from settings.yaml and .env
+            verbose: Whether pooled connectors print connection/disconnection messages
+
+        Returns:
+            ConnectionPool shared by every caller with the same type and configuration
+        """
+        connector_type = connector_type.lower()
+        if config is None:
+            config = cls._load_config(connector_type)
+
+        # Credentials are part of the key, so hash it rather than keep it readable
+        key = hashlib.sha256(
+            json.dumps([connector_type, config], sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+        with cls._pools_lock:
+            if key not in cls._pools:
+                pool_settings = cls._load_pool_settings(connector_type)
+                cls._pools[key] = ConnectionPool(
+                    lambda: cls.create_connector(connector_type, config, verbose=verbose),
+                    **pool_settings
+                )
+            return cls._pools[key]
+
+    @classmethod
+    @contextmanager
+    def connection(cls, connector_type: str, config: Optional[Dict[str, Any]] = None,
+                   verbose: bool = False) -> Iterator[BaseConnector]:
+        """
+        Borrow a connected connector from the shared pool for the duration of a with-block.
+
+        Use this instead of `with create_connector(...)` to reuse logins across calls.
+        The connector must not be disconnected by the caller.
+
+        Example:
+            with ConnectorFactory.connection('snowflake') as connector:
+                df = connector.load_data("PROD_SALES.PUBLIC.INVOICES")
+        """
+        with cls.get_pool(connector_type, config, verbose=verbose).connection() as connector:
+            yield connector
+
+    @classmethod
+    @asynccontextmanager
+    async def aconnection(cls, connector_type: str, config: Optional[Dict[str, Any]] = None,
+                          verbose: bool = False) -> AsyncIterator[BaseConnector]:
+        """
+        Async counterpart of connection(): borrow a connected connector for an async with-block.
+
+        Connectors with a native async driver (PostgreSQL/asyncpg) open their own async
+        connection, at most the pool's max_size at a time per connector type and event loop.
+        Other connectors (Snowflake) are checked out of the shared blocking pool on a worker
+        thread, and their async methods run the blocking calls on worker threads.
+
+        Example:
+            async with ConnectorFactory.aconnection('postgres') as connector:
+                df = await connector.aload_data("public.orders")
+        """
+        connector_type = connector_type.lower()
+        connector_class = cls._connectors.get(connector_type)
+        if connector_class is None:
+            raise ValueError(
+                f"Unknown connector type: {connector_type}. "
+                f"Available types: {list(cls._connectors.keys())}"
+            )
+
+        if not connector_class.native_async:
+            pool = cls.get_pool(connector_type, config, verbose=verbose)
+            connector = await asyncio.to_thread(pool.checkout)
+            discard = False
+            try:
+                yield connector
+            except GeneratorExit:
+                # A streaming async generator closed early; the connector itself is still usable
+                raise
+            except BaseException:
+                discard = True
+                raise
+            finally:
+                await asyncio.to_thread(pool.checkin, connector, discard)
+            return
+
+        async with cls._async_limit(connector_type):
+            connector = cls.create_connector(connector_type, config, verbose=verbose)
+            await connector.aconnect()
+            try:
+                yield connector
+            finally:
+                await connector.adisconnect()
+
+    @classmethod
+    def _async_limit(cls, connector_type: str) -> asyncio.Semaphore:
+        """Semaphore bounding native async connections of a connector type on the running event loop."""
+        loop = asyncio.get_running_loop()
+        with cls._pools_lock:
+            limits = cls._async_limits.setdefault(loop, {})
+            if connector_type not in limits:
+                max_size = cls._load_pool_settings(connector_type).get('max_size', DEFAULT_POOL_MAX_SIZE)
+                limits[connector_type] = asyncio.Semaphore(max_size)
+            return limits[connector_type]
+
+    @classmethod
+    def close_all_pools(cls) -> None:
+        """Close every idle pooled connection (called automatically at interpreter exit)."""
+        with cls._pools_lock:
+            pools = list(cls._pools.values())
+        for pool in pools:
+            pool.close_all()
+
+    @classmethod
+    def _load_pool_settings(cls, connector_type: str) -> Dict[str, Any]:
+        """Load connection pool limits from settings.yaml."""
+        settings_path = os.path.join(os.path.dirname(__file__), '../../config/settings.yaml')
+        if not os.path.exists(settings_path):
+            return {}
+
+        with open(settings_path, 'r') as f:
+            settings = yaml.safe_load(f) or {}
+
+        pool_settings = dict(settings.get('connection_pool') or {})
+        connector_settings = (settings.get('connectors') or {}).get(connector_type) or {}
+        pool_settings.update(connector_settings.get('connection_pool') or {})
+
+        allowed = ('max_size', 'idle_timeout', 'health_check_after', 'checkout_timeout')
+        return {name: value for name, value in pool_settings.items() if name in allowed}
+
     @classmethod
     def _load_config(cls, connector_type: str) -> Dict[str, Any]:
         """Load connector configuration from settings.yaml and environment variables."""
@@ -104,3 +257,6 @@ class ConnectorFactory:
     def get_available_connectors(cls) -> list:
         """Return list of available connector types."""
         return list(cls._connectors.keys())
+
+
+atexit.register(ConnectorFactory.close_all_pools)
@@ -1,12 +1,16 @@
 # src/connectors/postgres_connector.py
+import uuid
 import pandas as pd
-from typing import Dict, Any, Optional
-from .base_connector import BaseConnector
+from typing import Dict, Any, AsyncIterator, Iterator, List, Optional
+from .base_connector import BaseConnector, DEFAULT_BATCH_ROWS, DEFAULT_SAMPLE_SEED
 
 
 class PostgresConnector(BaseConnector):
     """Connector for PostgreSQL database."""
 
+    dialect = 'postgres'
+    native_async = True
+
     def __init__(self, config: Dict[str, Any], verbose: bool = True):
         """
         Initialize PostgreSQL connector.
@@ -20,6 +24,7 @@ class PostgresConnector(BaseConnector):
         """
         super().__init__(config)
         self._cursor = None
+        self._async_connection = None
         self.verbose = verbose
 
     def connect(self) -> None:
@@ -54,14 +59,22 @@ class PostgresConnector(BaseConnector):
         if self.verbose:
             print("✓ Disconnected from PostgreSQL")
 
-    def load_data(self, dataset_id: str, query: Optional[str] = None, limit: Optional[int] = None) -> pd.DataFrame:
+    def load_data(self, dataset_id: str, query: Optional[str] = None, limit: Optional[int] = None,
+                  columns: Optional[List[str]] = None,
+                  filters: Optional[Dict[str, Any]] = None, sample_percent: Optional[float] = None,
+                  sample_method: str = 'row', sample_seed: Optional[int] = DEFAULT_SAMPLE_SEED) -> pd.DataFrame:
         """
         Load data from PostgreSQL table or custom query.
 
         Args:
             dataset_id: Table name (e.g., 'customers', 'schema.table')
-            query: Optional custom SQL query (overrides dataset_id)
+            query: Optional custom SQL query (overrides dataset_id, columns and filters)
             limit: Optional row limit
+            columns: Optional columns to read (default: all)
+            filters: Optional {column: value} filters (see BaseConnector.build_select_query)
+            sample_percent: Optional percentage of the table to sample
+            sample_method: 'row' or 'block' sampling (see table_sample_clause)
+            sample_seed: Seed making the sample repeatable (None = a different sample each time)
 
         Returns:
             DataFrame with the data
@@ -70,12 +83,10 @@ class PostgresConnector(BaseConnector):
             self.connect()
 
         try:
-            if query:
-                sql_query = query
-            else:
-                sql_query = f"SELECT * FROM {dataset_id}"
-                if limit:
-                    sql_query += f" LIMIT {limit}"
+            sql_query = self.build_select_query(dataset_id, query=query, limit=limit,
+                                                columns=columns, filters=filters,
+                                                sample_percent=sample_percent, sample_method=sample_method,
+                                                sample_seed=sample_seed)
 
             print(f"Executing query: {sql_query}")
             df = pd.read_sql_query(sql_query, self._connection)
@@ -85,6 +96,295 @@ class PostgresConnector(BaseConnector):
         except Exception as e:
             raise RuntimeError(f"Failed to load data from PostgreSQL: {str(e)}")
 
+    def stream_batches(self, dataset_id: str, batch_rows: int = DEFAULT_BATCH_ROWS,
+                       query: Optional[str] = None, limit: Optional[int] = None,
+                       columns: Optional[List[str]] = None,
+                       filters: Optional[Dict[str, Any]] = None, sample_percent: Optional[float] = None,
+                       sample_method: str = 'row', sample_seed: Optional[int] = DEFAULT_SAMPLE_SEED) -> Iterator[pd.DataFrame]:
+        """
+        Stream data from PostgreSQL in batches using a server-side (named) cursor.
+
+        Only one batch of rows is transferred and held in memory at a time.
+
+        Args:
+            dataset_id: Table name (e.g., 'customers', 'schema.table')
+            batch_rows: Maximum number of rows per yielded DataFrame
+            query: Optional custom SQL query (overrides dataset_id, columns and filters)
+            limit: Optional row limit
+            columns: Optional columns to read (default: all)
+            filters: Optional {column: value} filters (see BaseConnector.build_select_query)
+            sample_percent: Optional percentage of the table to sample
+            sample_method: 'row' or 'block' sampling (see table_sample_clause)
+            sample_seed: Seed making the sample repeatable (None = a different sample each time)
+
+        Yields:
+            DataFrames with at most batch_rows rows each
+        """
+        if not self._cursor:
+            self.connect()
+
+        sql_query = self.build_select_query(dataset_id, query=query, limit=limit,
+                                            columns=columns, filters=filters,
+                                            sample_percent=sample_percent, sample_method=sample_method,
+                                            sample_seed=sample_seed)
+
+        print(f"Streaming query: {sql_query}")
+        stream_cursor = self._connection.cursor(name=f"dq_stream_{uuid.uuid4().hex[:12]}")
+        stream_cursor.itersize = batch_rows
+
+        total_rows = 0
+        batch_count = 0
+        try:
+            stream_cursor.execute(sql_query)
+            while True:
+                rows = stream_cursor.fetchmany(batch_rows)
+                if not rows:
+                    break
+                columns = [desc[0] for desc in stream_cursor.description]
+                total_rows += len(rows)
+                batch_count += 1
+                # coerce_float converts NUMERIC (Decimal) values to float, as read_sql_query does in load_data
+                yield pd.DataFrame.from_records(rows, columns=columns, coerce_float=True)
+        except Exception as e:
+            raise RuntimeError(f"Failed to stream data from PostgreSQL: {str(e)}")
+        finally:
+            stream_cursor.close()
+            # End the read transaction the named cursor lived in
+            self._connection.rollback()
+
+        print(f"✓ Streamed {total_rows} rows in {batch_count} batches from PostgreSQL")
+
+    async def aconnect(self) -> None:
+        """Establish an asyncpg connection to PostgreSQL."""
+        try:
+            import asyncpg
+
+            self._async_connection = await asyncpg.connect(
+                host=self.config.get('host', 'localhost'),
+                port=int(self.config.get('port', 5432)),
+                database=self.config.get('database'),
+                user=self.config.get('user'),
+                password=self.config.get('password')
+            )
+            if self.verbose:
+                print(f"✓ Connected to PostgreSQL (async): {self.config.get('database')}")
+        except ImportError:
+            raise ImportError(
+                "asyncpg is not installed. "
+                "Install it with: poetry add asyncpg"
+            )
+        except Exception as e:
+            raise ConnectionError(f"Failed to connect to PostgreSQL: {str(e)}")
+
+    async def adisconnect(self) -> None:
+        """Close the asyncpg connection."""
+        if self._async_connection is not None:
+            await self._async_connection.close()
+            self._async_connection = None
+        if self.verbose:
+            print("✓ Disconnected from PostgreSQL (async)")
+
+    async def aload_data(self, dataset_id: str, query: Optional[str] = None, limit: Optional[int] = None,
+                         columns: Optional[List[str]] = None,
+                         filters: Optional[Dict[str, Any]] = None, sample_percent: Optional[float] = None,
+                         sample_method: str = 'row', sample_seed: Optional[int] = DEFAULT_SAMPLE_SEED) -> pd.DataFrame:
+        """
+        Load data from a PostgreSQL table or custom query over asyncpg.
+
+        Args:
+            dataset_id: Table name (e.g., 'customers', 'schema.table')
+            query: Optional custom SQL query (overrides dataset_id, columns and filters)
+            limit: Optional row limit
+            columns: Optional columns to read (default: all)
+            filters: Optional {column: value} filters (see BaseConnector.build_select_query)
+            sample_percent: Optional percentage of the table to sample
+            sample_method: 'row' or 'block' sampling (see table_sample_clause)
+            sample_seed: Seed making the sample repeatable (None = a different sample each time)
+
+        Returns:
+            DataFrame with the data
+        """
+        if self._async_connection is None:
+            await self.aconnect()
+
+        try:
+            sql_query = self.build_select_query(dataset_id, query=query, limit=limit,
+                                                columns=columns, filters=filters,
+                                                sample_percent=sample_percent, sample_method=sample_method,
+                                                sample_seed=sample_seed)
+            print(f"Executing query: {sql_query}")
+
+            # A prepared statement exposes the column names even when no rows come back
+            statement = await self._async_connection.prepare(sql_query)
+            columns = [attribute.name for attribute in statement.get_attributes()]
+            records = await statement.fetch()
+            # coerce_float converts NUMERIC (Decimal) values to float, as read_sql_query does in load_data
+            df = pd.DataFrame.from_records([tuple(record) for record in records], columns=columns,
+                                           coerce_float=True)
+            print(f"✓ Loaded {len(df)} rows from PostgreSQL")
+            return df
+
+        except Exception as e:
+            raise RuntimeError(f"Failed to load data from PostgreSQL: {str(e)}")
+
+    async def astream_batches(self, dataset_id: str, batch_rows: int = DEFAULT_BATCH_ROWS,
+                              query: Optional[str] = None, limit: Optional[int] = None,
+                              columns: Optional[List[str]] = None,
+                              filters: Optional[Dict[str, Any]] = None, sample_percent: Optional[float] = None,
+                              sample_method: str = 'row', sample_seed: Optional[int] = DEFAULT_SAMPLE_SEED) -> AsyncIterator[pd.DataFrame]:
+        """
+        Stream data from PostgreSQL in batches through an asyncpg server-side cursor.
+
+        Only one batch of rows is transferred and held in memory at a time.
+
+        Args:
+            dataset_id: Table name (e.g., 'customers', 'schema.table')
+            batch_rows: Maximum number of rows per yielded DataFrame
+            query: Optional custom SQL query (overrides dataset_id, columns and filters)
+            limit: Optional row limit
+            columns: Optional columns to read (default: all)
+            filters: Optional {column: value} filters (see BaseConnector.build_select_query)
+            sample_percent: Optional percentage of the table to sample
+            sample_method: 'row' or 'block' sampling (see table_sample_clause)
+            sample_seed: Seed making the sample repeatable (None = a different sample each time)
+
+        Yields:
+            DataFrames with at most batch_rows rows each
+        """
+        if self._async_connection is None:
+            await self.aconnect()
+
+        sql_query = self.build_select_query(dataset_id, query=query, limit=limit,
+                                            columns=columns, filters=filters,
+                                            sample_percent=sample_percent, sample_method=sample_method,
+                                            sample_seed=sample_seed)
+        print(f"Streaming query: {sql_query}")
+
+        total_rows = 0
+        batch_count = 0
+        try:
+            # asyncpg cursors only exist inside a transaction
+            async with self._async_connection.transaction(readonly=True):
+                statement = await self._async_connection.prepare(sql_query)
+                columns = [attribute.name for attribute in statement.get_attributes()]
+                cursor = await statement.cursor()
+                while True:
+                    rows = await cursor.fetch(batch_rows)
+                    if not rows:
+                        break
+                    total_rows += len(rows)
+                    batch_count += 1
+                    yield pd.DataFrame.from_records([tuple(row) for row in rows], columns=columns,
+                                                    coerce_float=True)
+        except Exception as e:
+            raise RuntimeError(f"Failed to stream data from PostgreSQL: {str(e)}")
+
+        print(f"✓ Streamed {total_rows} rows in {batch_count} batches from PostgreSQL")
+
+    def table_sample_clause(self, percent: float, method: str = 'row', seed: Optional[int] = None) -> str:
+        """TABLESAMPLE BERNOULLI (rows) or SYSTEM (pages), with REPEATABLE for repeatable samples."""
+        clause = f"TABLESAMPLE {'BERNOULLI' if method == 'row' else 'SYSTEM'} ({float(percent):g})"
+        if seed is not None:
+            clause += f" REPEATABLE ({int(seed)})"
+        return clause
+
+    def describe_columns(self, dataset_id: str) -> List[Dict[str, Any]]:
+        """
+        Get column names and data types from information_schema.
+
+        Args:
+            dataset_id: Table name ('table', 'schema.table' or 'database.schema.table')
+
+        Returns:
+            List of dicts with 'COLUMN_NAME' and 'DATA_TYPE' keys, in column order
+        """
+        if not self._cursor:
+            self.connect()
+
+        parts = dataset_id.split('.')
+        table_name = parts[-1]
+        schema = parts[-2] if len(parts) >= 2 else 'public'
+
+        self._cursor.execute(
+            """
+            SELECT column_name, data_type
+            FROM information_schema.columns
+            WHERE table_schema = %s
+                AND table_name = %s
+            ORDER BY ordinal_position
+            """,
+            (schema, table_name)
+        )
+        return [{'COLUMN_NAME': row[0], 'DATA_TYPE': row[1]} for row in self._cursor.fetchall()]
+
+    async def adescribe_columns(self, dataset_id: str) -> List[Dict[str, Any]]:
+        """
+        Get column names and data types from information_schema over asyncpg.
+
+        Args:
+            dataset_id: Table name ('table', 'schema.table' or 'database.schema.table')
+
+        Returns:
+            List of dicts with 'COLUMN_NAME' and 'DATA_TYPE' keys, in column order
+        """
+        if self._async_connection is None:
+            await self.aconnect()
+
+        parts = dataset_id.split('.')
+        table_name = parts[-1]
+        schema = parts[-2] if len(parts) >= 2 else 'public'
+
+        rows = await self._async_connection.fetch(
+            """
+            SELECT column_name, data_type
+            FROM information_schema.columns
+            WHERE table_schema = $1
+                AND table_name = $2
+            ORDER BY ordinal_position
+            """,
+            schema, table_name
+        )
+        return [{'COLUMN_NAME': row[0], 'DATA_TYPE': row[1]} for row in rows]
+
+    def get_table_version(self, dataset_id: str) -> Optional[str]:
+        """
+        Version token from pg_stat_user_tables (inserted/updated/deleted tuple counters).
+
+        The statistics collector reports with a short delay, so changes made in the last
+        moments before a check may not be reflected yet.
+
+        Args:
+            dataset_id: Table name ('table', 'schema.table' or 'database.schema.table')
+
+        Returns:
+            Token string, or None if the relation has no statistics (views, unknown tables)
+        """
+        if not self._cursor:
+            self.connect()
+
+        parts = dataset_id.split('.')
+        table_name = parts[-1]
+        schema = parts[-2] if len(parts) >= 2 else 'public'
+
+        self._cursor.execute(
+            """
+            SELECT relid, n_tup_ins, n_tup_upd, n_tup_del, n_live_tup
+            FROM pg_stat_user_tables
+            WHERE schemaname = %s
+                AND relname = %s
+            """,
+            (schema, table_name)
+        )
+        row = self._cursor.fetchone()
+        if row is None:
+            return None
+        return '|'.join(str(value) for value in row)
+
+    def reset(self) -> None:
+        """End the implicit transaction opened by psycopg2 so a pooled connection doesn't sit idle in transaction."""
+        if self._connection:
+            self._connection.rollback()
+
     def test_connection(self) -> bool:
         """Test PostgreSQL connection."""
         try:
@@ -92,7 +392,8 @@ class PostgresConnector(BaseConnector):
                 self.connect()
             self._cursor.execute("SELECT version()")
             result = self._cursor.fetchone()
-            print(f"✓ PostgreSQL connection test successful. Version: {result[0]}")
+            if self.verbose:
+                print(f"✓ PostgreSQL connection test successful. Version: {result[0]}")
             return True
         except Exception as e:
             print(f"✗ PostgreSQL connection test failed: {str(e)}")
@@ -3,18 +3,106 @@
 Automatic schema discovery and metadata extraction for data sources.
 Discovers tables, columns, and metadata to help the agent select appropriate datasets.
 """
+import hashlib
+import threading
 import pandas as pd
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, List, Any, Optional, Tuple
 from .connector_factory import ConnectorFactory
+from .connection_pool import DEFAULT_POOL_MAX_SIZE
 import json
 
+# Maximum concurrent sample queries per connector type, shared by all SchemaDiscovery instances
+# (further capped at the connector's connection pool max_size, since each query borrows a connection)
+SAMPLE_CONCURRENCY = {
+    'snowflake': 8,
+    'postgres': 4,
+}
+DEFAULT_SAMPLE_CONCURRENCY = 4
+
+_sample_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+_sample_executors: Dict[str, ThreadPoolExecutor] = {}
+_sample_lock = threading.Lock()
+
+
+def sample_concurrency(connector_type: str) -> int:
+    """Concurrent sample queries allowed for a connector type: SAMPLE_CONCURRENCY, at most the pool size."""
+    limit = SAMPLE_CONCURRENCY.get(connector_type, DEFAULT_SAMPLE_CONCURRENCY)
+    pool_size = ConnectorFactory._load_pool_settings(connector_type).get('max_size', DEFAULT_POOL_MAX_SIZE)
+    return max(1, min(limit, pool_size))
+
+
+def _sample_semaphore(connector_type: str) -> threading.BoundedSemaphore:
+    """Process-wide semaphore limiting concurrent sample queries for a connector type."""
+    with _sample_lock:
+        if connector_type not in _sample_semaphores:
+            _sample_semaphores[connector_type] = threading.BoundedSemaphore(sample_concurrency(connector_type))
+        return _sample_semaphores[connector_type]
+
+
+def _sample_executor(connector_type: str) -> ThreadPoolExecutor:
+    """
+    Process-wide thread pool for sample queries of a connector type.
+
+    Shared by every caller (e.g. the per-schema workers of SchemaIndexer), so parallel sampling
+    never runs more threads than sample_concurrency() allows.
+    """
+    with _sample_lock:
+        if connector_type not in _sample_executors:
+            _sample_executors[connector_type] = ThreadPoolExecutor(
+                max_workers=sample_concurrency(connector_type), thread_name_prefix=f'schema-sample-{connector_type}'
+            )
+        return _sample_executors[connector_type]
+
+
+def table_fingerprint(table_info: Dict[str, Any], columns: List[Dict[str, Any]]) -> str:
+    """
+    Fingerprint of the catalog metadata that ends up in a table's index document.
+
+    Covers column names and types, the table comment and LAST_ALTERED, so a changed
+    fingerprint means the table's document needs to be rebuilt.
+
+    Args:
+        table_info: Table metadata dictionary (as returned by discover_tables)
+        columns: Column metadata dictionaries (as returned by get_table_columns)
+
+    Returns:
+        Hex sha256 digest
+    """
+    payload = {
+        'columns': [[col.get('COLUMN_NAME'), col.get('DATA_TYPE'), col.get('COLUMN_COMMENT')] for col in columns],
+        'comment': table_info.get('TABLE_COMMENT'),
+        'last_altered': table_info.get('LAST_ALTERED'),
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
 
 class SchemaDiscovery:
     """Discovers and extracts metadata from data sources."""
 
     def __init__(self, connector_type: str = 'snowflake'):
         self.connector_type = connector_type
-        self.connector = ConnectorFactory.create_connector(connector_type, verbose=False)
+        self._local = threading.local()
+
+    @contextmanager
+    def _connection(self):
+        """
+        Borrow a connected connector from the shared pool, so discovery calls reuse one login.
+
+        Nested calls on the same thread reuse the connector already borrowed by the outer call.
+        """
+        active = getattr(self._local, 'connector', None)
+        if active is not None:
+            yield active
+            return
+
+        with ConnectorFactory.connection(self.connector_type) as connector:
+            self._local.connector = connector
+            try:
+                yield connector
+            finally:
+                self._local.connector = None
 
     def discover_snowflake_tables(
         self,
@@ -33,9 +121,9 @@ class SchemaDiscovery:
         Returns:
             List of table metadata dictionaries
         """
-        with self.connector:
+        with self._connection() as connector:
             # Get current database/schema if not specified
-            cursor = self.connector._cursor
+            cursor = connector._cursor
 
             if not database:
                 cursor.execute("SELECT CURRENT_DATABASE()")
@@ -94,8 +182,8 @@ class SchemaDiscovery:
         Returns:
             List of table metadata dictionaries
         """
-        with self.connector:
-            cursor = self.connector._cursor
+        with self._connection() as connector:
+            cursor = connector._cursor
 
             if not database:
                 cursor.execute("SELECT current_database()")
@@ -204,8 +292,8 @@ class SchemaDiscovery:
         schema: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """Get Snowflake column information."""
-        with self.connector:
-            cursor = self.connector._cursor
+        with self._connection() as connector:
+            cursor = connector._cursor
 
             if not database:
                 cursor.execute("SELECT CURRENT_DATABASE()")
@@ -246,8 +334,8 @@ class SchemaDiscovery:
         schema: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """Get PostgreSQL column information."""
-        with self.connector:
-            cursor = self.connector._cursor
+        with self._connection() as connector:
+            cursor = connector._cursor
 
             if not database:
                 cursor.execute("SELECT current_database()")
@@ -286,6 +374,80 @@ class SchemaDiscovery:
 
             return column_info
 
+    def get_schema_columns(
+        self,
+        database: Optional[str] = None,
+        schema: Optional[str] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get column information for every table in a schema with a single catalog query.
+
+        Args:
+            database: Database name (None = current)
+            schema: Schema name (None = current)
+
+        Returns:
+            Dict mapping table name to its column metadata dictionaries (same keys as get_table_columns)
+        """
+        with self._connection() as connector:
+            cursor = connector._cursor
+
+            if self.connector_type == 'snowflake':
+                if not database:
+                    cursor.execute("SELECT CURRENT_DATABASE()")
+                    database = cursor.fetchone()[0]
+
+                if not schema:
+                    cursor.execute("SELECT CURRENT_SCHEMA()")
+                    schema = cursor.fetchone()[0]
+
+                query = f"""
+                SELECT
+                    TABLE_NAME,
+                    COLUMN_NAME,
+                    DATA_TYPE,
+                    IS_NULLABLE,
+                    COLUMN_DEFAULT,
+                    COMMENT as column_comment
+                FROM {database}.INFORMATION_SCHEMA.COLUMNS
+                WHERE TABLE_SCHEMA = '{schema}'
+                ORDER BY TABLE_NAME, ORDINAL_POSITION
+                """
+                cursor.execute(query)
+
+            elif self.connector_type == 'postgres':
+                if not schema:
+                    schema = 'public'
+
+                query = """
+                SELECT
+                    table_name AS "TABLE_NAME",
+                    column_name AS "COLUMN_NAME",
+                    data_type AS "DATA_TYPE",
+                    is_nullable AS "IS_NULLABLE",
+                    column_default AS "COLUMN_DEFAULT",
+                    NULL AS "COLUMN_COMMENT"
+                FROM information_schema.columns
+                WHERE table_schema = %s
+                ORDER BY table_name, ordinal_position
+                """
+                cursor.execute(query, (schema,))
+
+            else:
+                raise NotImplementedError(f"Column discovery not implemented for {self.connector_type}")
+
+            columns = [desc[0] for desc in cursor.description]
+            rows = cursor.fetchall()
+
+        # Group rows by table in memory (rows arrive ordered by table and ordinal position)
+        columns_by_table: Dict[str, List[Dict[str, Any]]] = {}
+        for row in rows:
+            col_dict = dict(zip(columns, row))
+            table_name = col_dict.pop('TABLE_NAME')
+            columns_by_table.setdefault(table_name, []).append(col_dict)
+
+        return columns_by_table
+
     def get_table_sample(
         self,
         table_name: str,
@@ -305,8 +467,8 @@ class SchemaDiscovery:
         Returns:
             DataFrame with sample data
         """
-        with self.connector:
-            cursor = self.connector._cursor
+        with self._connection() as connector:
+            cursor = connector._cursor
 
             if self.connector_type == 'snowflake':
                 if not database:
@@ -370,6 +532,34 @@ class SchemaDiscovery:
         # Get columns
         columns = self.get_table_columns(table_name, database, schema)
 
+        sample_df = None
+        if include_sample:
+            try:
+                # Use provided limit or default to 3
+                limit = getattr(include_sample, '__self__', {}).get('sample_row_limit', 3) if isinstance(include_sample, bool) else 3
+                sample_df = self.get_table_sample(table_name, database, schema, limit=limit)
+            except Exception as e:
+                sample_df = e
+
+        return self.build_table_metadata_document(table_info, columns, sample_df)
+
+    def build_table_metadata_document(
+        self,
+        table_info: Dict[str, Any],
+        columns: List[Dict[str, Any]],
+        sample: Any = None
+    ) -> str:
+        """
+        Build the metadata document for a table from already discovered metadata.
+
+        Args:
+            table_info: Table metadata dictionary (as returned by discover_tables)
+            columns: Column metadata dictionaries (as returned by get_table_columns)
+            sample: Sample rows DataFrame, the exception raised while sampling, or None to omit
+
+        Returns:
+            Formatted metadata document as string
+        """
         # Build document
         doc_parts = []
 
@@ -397,16 +587,11 @@ class SchemaDiscovery:
             doc_parts.append(col_desc)
 
         # Sample data (optional)
-        if include_sample:
-            try:
-                # Use provided limit or default to 3
-                limit = getattr(include_sample, '__self__', {}).get('sample_row_limit', 3) if isinstance(include_sample, bool) else 3
-                sample_df = self.get_table_sample(table_name, database, schema, limit=limit)
-                if not sample_df.empty:
-                    doc_parts.append("\nSAMPLE DATA:")
-                    doc_parts.append(sample_df.to_string(index=False))
-            except Exception as e:
-                doc_parts.append(f"\nSample data unavailable: {str(e)}")
+        if isinstance(sample, Exception):
+            doc_parts.append(f"\nSample data unavailable: {str(sample)}")
+        elif sample is not None and not sample.empty:
+            doc_parts.append("\nSAMPLE DATA:")
+            doc_parts.append(sample.to_string(index=False))
 
         # Metadata
         doc_parts.append(f"\nCreated: {table_info.get('CREATED', 'N/A')}")
@@ -414,33 +599,61 @@ class SchemaDiscovery:
 
         return "\n".join(doc_parts)
 
-    def discover_all_table_metadata(
+    def discover_catalog(
         self,
         database: Optional[str] = None,
         schema: Optional[str] = None,
-        include_sample: bool = False,
-        sample_row_limit: int = 3,
         max_tables: Optional[int] = None
-    ) -> List[Dict[str, str]]:
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, List[Dict[str, Any]]]]:
         """
-        Discover all tables and create metadata documents for each.
+        Fetch the tables and columns of a schema with one catalog query each.
 
         Args:
             database: Database to scan
             schema: Schema to scan
+            max_tables: Maximum number of tables to return
+
+        Returns:
+            Tuple of (table metadata dictionaries, dict mapping table name to its columns)
+        """
+        # One borrowed connection for both catalog queries
+        with self._connection():
+            tables = self.discover_tables(database, schema)
+
+            if max_tables:
+                tables = tables[:max_tables]
+
+            if not tables:
+                return [], {}
+
+            columns_by_table = self.get_schema_columns(tables[0]['DATABASE_NAME'], tables[0]['SCHEMA_NAME'])
+
+        return tables, columns_by_table
+
+    def build_metadata_documents(
+        self,
+        tables: List[Dict[str, Any]],
+        columns_by_table: Dict[str, List[Dict[str, Any]]],
+        include_sample: bool = False,
+        sample_row_limit: int = 3,
+        sample_workers: int = 1
+    ) -> List[Dict[str, str]]:
+        """
+        Create metadata documents for already discovered tables.
+
+        Args:
+            tables: Table metadata dictionaries (as returned by discover_catalog)
+            columns_by_table: Dict mapping table name to its columns (as returned by discover_catalog)
             include_sample: Include sample data in metadata
             sample_row_limit: Number of sample rows per table
-            max_tables: Maximum number of tables to process
+            sample_workers: 1 fetches samples sequentially, more on the shared sampling pool
 
         Returns:
-            List of dicts with 'table_name' and 'metadata' keys
+            List of dicts with 'table_name', 'full_name', 'metadata' and 'fingerprint' keys
         """
-        # Store sample_row_limit for use in create_table_metadata_document
-        self._sample_row_limit = sample_row_limit
-        tables = self.discover_tables(database, schema)
-
-        if max_tables:
-            tables = tables[:max_tables]
+        samples = {}
+        if include_sample:
+            samples = self._fetch_samples(tables, sample_row_limit, sample_workers)
 
         metadata_docs = []
 
@@ -450,20 +663,87 @@ class SchemaDiscovery:
             print(f"  [{i}/{len(tables)}] Processing {table_name}...")
 
             try:
-                metadata = self.create_table_metadata_document(
-                    table_name,
-                    database,
-                    schema,
-                    include_sample
-                )
+                columns = columns_by_table.get(table_name, [])
+                metadata = self.build_table_metadata_document(table, columns, samples.get(table_name))
 
                 metadata_docs.append({
                     'table_name': table_name,
                     'full_name': f"{table['DATABASE_NAME']}.{table['SCHEMA_NAME']}.{table_name}",
-                    'metadata': metadata
+                    'metadata': metadata,
+                    'fingerprint': table_fingerprint(table, columns)
                 })
             except Exception as e:
                 print(f"    ✗ Error processing {table_name}: {str(e)}")
                 continue
 
         return metadata_docs
+
+    def discover_all_table_metadata(
+        self,
+        database: Optional[str] = None,
+        schema: Optional[str] = None,
+        include_sample: bool = False,
+        sample_row_limit: int = 3,
+        max_tables: Optional[int] = None,
+        sample_workers: int = 1
+    ) -> List[Dict[str, str]]:
+        """
+        Discover all tables and create metadata documents for each.
+
+        Args:
+            database: Database to scan
+            schema: Schema to scan
+            include_sample: Include sample data in metadata
+            sample_row_limit: Number of sample rows per table
+            max_tables: Maximum number of tables to process
+            sample_workers: 1 fetches samples sequentially, more on the shared sampling pool
+
+        Returns:
+            List of dicts with 'table_name', 'full_name', 'metadata' and 'fingerprint' keys
+        """
+        # Store sample_row_limit for use in create_table_metadata_document
+        self._sample_row_limit = sample_row_limit
+
+        tables, columns_by_table = self.discover_catalog(database, schema, max_tables)
+        if not tables:
+            return []
+
+        return self.build_metadata_documents(
+            tables, columns_by_table, include_sample, sample_row_limit, sample_workers
+        )
+
+    def _fetch_samples(
+        self,
+        tables: List[Dict[str, Any]],
+        limit: int,
+        workers: int = 1
+    ) -> Dict[str, Any]:
+        """
+        Fetch sample rows for several tables.
+
+        Args:
+            tables: Table metadata dictionaries (as returned by discover_tables)
+            limit: Number of sample rows per table
+            workers: 1 fetches sequentially; more fetches on the connector type's shared sampling
+                     pool, whose size (sample_concurrency) caps concurrent queries process-wide
+
+        Returns:
+            Dict mapping table name to its sample DataFrame, or to the exception raised while sampling
+        """
+        semaphore = _sample_semaphore(self.connector_type)
+
+        def fetch(table: Dict[str, Any]) -> Any:
+            with semaphore:
+                try:
+                    # Each call borrows its own pooled connection (discarded if the query fails)
+                    return self.get_table_sample(
+                        table['TABLE_NAME'], table['DATABASE_NAME'], table['SCHEMA_NAME'], limit=limit
+                    )
+                except Exception as e:
+                    return e
+
+        if workers <= 1:
+            return {table['TABLE_NAME']: fetch(table) for table in tables}
+
+        executor = _sample_executor(self.connector_type)
+        return dict(zip([table['TABLE_NAME'] for table in tables], executor.map(fetch, tables)))
@@ -1,11 +1,40 @@
 import pandas as pd
-from typing import Dict, Any, Optional
-from .base_connector import BaseConnector
+from typing import Dict, Any, Iterator, List, Optional
+from .base_connector import BaseConnector, DEFAULT_BATCH_ROWS, DEFAULT_SAMPLE_SEED
+
+# snowflake.connector.errorcode: ER_NO_ARROW_RESULT (the result set is not in Arrow format) and
+# ER_NO_PYARROW (the connector's [pandas] extras are not installed)
+_ARROW_UNAVAILABLE_ERRNOS = (255001, 255002)
+
+
+def _arrow_unavailable(error: Exception) -> bool:
+    """Whether fetch_pandas_*() failed only because Arrow fetching is unavailable for this cursor."""
+    return getattr(error, 'errno', None) in _ARROW_UNAVAILABLE_ERRNOS
+
+
+def _normalize_arrow_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Give Arrow-fetched frames the dtypes the row-based fetch produces.
+
+    fetch_pandas_all() narrows NUMBER columns to the smallest integer type that fits (int8, int16,
+    ...) and may return float32, while fetchall() rows always become int64/float64 columns. Decimal
+    (scaled NUMBER) columns and NULLs (NaN/None) already match and are left as they are.
+    """
+    widened = {}
+    for column, dtype in df.dtypes.items():
+        if pd.api.types.is_integer_dtype(dtype) and not pd.api.types.is_extension_array_dtype(dtype) \
+                and dtype != 'int64':
+            widened[column] = 'int64'
+        elif pd.api.types.is_float_dtype(dtype) and dtype != 'float64':
+            widened[column] = 'float64'
+    return df.astype(widened) if widened else df
 
 
 class SnowflakeConnector(BaseConnector):
     """Connector for Snowflake data warehouse."""
 
+    dialect = 'snowflake'
+
     def __init__(self, config: Dict[str, Any], verbose: bool = True):
         """
         Initialize Snowflake connector.
@@ -59,44 +88,215 @@ class SnowflakeConnector(BaseConnector):
         if self._connection:
             self._connection.close()
 
-    def load_data(self, dataset_id: str, query: Optional[str] = None, limit: Optional[int] = None) -> pd.DataFrame:
+    def load_data(self, dataset_id: str, query: Optional[str] = None, limit: Optional[int] = None,
+                  columns: Optional[List[str]] = None,
+                  filters: Optional[Dict[str, Any]] = None, sample_percent: Optional[float] = None,
+                  sample_method: str = 'row', sample_seed: Optional[int] = DEFAULT_SAMPLE_SEED) -> pd.DataFrame:
         """
         Load data from Snowflake table or custom query.
 
         Args:
             dataset_id: Full table name ('DB.SCHEMA.TABLE') or just table name
-            query: Optional custom SQL query (overrides dataset_id)
+            query: Optional custom SQL query (overrides dataset_id, columns and filters)
             limit: Optional row limit
+            columns: Optional columns to read (default: all)
+            filters: Optional {column: value} filters (see BaseConnector.build_select_query)
+            sample_percent: Optional percentage of the table to sample
+            sample_method: 'row' or 'block' sampling (see table_sample_clause)
+            sample_seed: Seed making the sample repeatable (None = a different sample each time)
 
         Returns:
-            DataFrame with the data
+            DataFrame with the data. Fetched through Arrow (fetch_pandas_all) when the connector's
+            pandas extras are installed, with integer and float columns widened to int64/float64
+            as the row-based fetch returns them
         """
         if not self._cursor:
             self.connect()
 
         try:
-            if query:
-                sql_query = query
-            else:
-                # Simple table query
-                sql_query = f"SELECT * FROM {dataset_id}"
-                if limit:
-                    sql_query += f" LIMIT {limit}"
+            sql_query = self.build_select_query(dataset_id, query=query, limit=limit,
+                                                columns=columns, filters=filters,
+                                                sample_percent=sample_percent, sample_method=sample_method,
+                                                sample_seed=sample_seed)
 
             print(f"Executing query: {sql_query}")
             self._cursor.execute(sql_query)
 
-            # Fetch data and column names
-            columns = [desc[0] for desc in self._cursor.description]
-            data = self._cursor.fetchall()
+            try:
+                # Arrow-based fetch builds the DataFrame directly, without an intermediate list of rows
+                df = _normalize_arrow_dtypes(self._cursor.fetch_pandas_all())
+            except Exception as e:
+                # Fall back only when the pandas/pyarrow extras are unavailable or the result isn't Arrow
+                if not _arrow_unavailable(e):
+                    raise
+                columns = [desc[0] for desc in self._cursor.description]
+                data = self._cursor.fetchall()
+                df = pd.DataFrame(data, columns=columns)
 
-            df = pd.DataFrame(data, columns=columns)
             print(f"✓ Loaded {len(df)} rows from Snowflake")
             return df
 
         except Exception as e:
             raise RuntimeError(f"Failed to load data from Snowflake: {str(e)}")
 
+    def stream_batches(self, dataset_id: str, batch_rows: int = DEFAULT_BATCH_ROWS,
+                       query: Optional[str] = None, limit: Optional[int] = None,
+                       columns: Optional[List[str]] = None,
+                       filters: Optional[Dict[str, Any]] = None, sample_percent: Optional[float] = None,
+                       sample_method: str = 'row', sample_seed: Optional[int] = DEFAULT_SAMPLE_SEED) -> Iterator[pd.DataFrame]:
+        """
+        Stream data from Snowflake in batches.
+
+        Uses fetch_pandas_batches() (Arrow result chunks) when available, re-sliced to at most
+        batch_rows rows, and falls back to fetchmany() when the pandas extras are not installed
+        or the result is not in Arrow format. Arrow chunks get the same dtypes as fetchmany() rows.
+
+        Args:
+            dataset_id: Full table name ('DB.SCHEMA.TABLE') or just table name
+            batch_rows: Maximum number of rows per yielded DataFrame
+            query: Optional custom SQL query (overrides dataset_id, columns and filters)
+            limit: Optional row limit
+            columns: Optional columns to read (default: all)
+            filters: Optional {column: value} filters (see BaseConnector.build_select_query)
+            sample_percent: Optional percentage of the table to sample
+            sample_method: 'row' or 'block' sampling (see table_sample_clause)
+            sample_seed: Seed making the sample repeatable (None = a different sample each time)
+
+        Yields:
+            DataFrames with at most batch_rows rows each
+        """
+        if not self._cursor:
+            self.connect()
+
+        sql_query = self.build_select_query(dataset_id, query=query, limit=limit,
+                                            columns=columns, filters=filters,
+                                            sample_percent=sample_percent, sample_method=sample_method,
+                                            sample_seed=sample_seed)
+
+        print(f"Streaming query: {sql_query}")
+        try:
+            self._cursor.execute(sql_query)
+        except Exception as e:
+            raise RuntimeError(f"Failed to stream data from Snowflake: {str(e)}")
+
+        total_rows = 0
+        batch_count = 0
+
+        try:
+            arrow_batches = self._cursor.fetch_pandas_batches()
+        except Exception as e:
+            if not _arrow_unavailable(e):
+                raise RuntimeError(f"Failed to stream data from Snowflake: {str(e)}")
+            arrow_batches = None
+
+        if arrow_batches is not None:
+            for chunk in arrow_batches:
+                chunk = _normalize_arrow_dtypes(chunk)
+                for start in range(0, len(chunk), batch_rows):
+                    batch = chunk.iloc[start:start + batch_rows]
+                    total_rows += len(batch)
+                    batch_count += 1
+                    yield batch
+        else:
+            columns = [desc[0] for desc in self._cursor.description]
+            while True:
+                rows = self._cursor.fetchmany(batch_rows)
+                if not rows:
+                    break
+                total_rows += len(rows)
+                batch_count += 1
+                yield pd.DataFrame(rows, columns=columns)
+
+        print(f"✓ Streamed {total_rows} rows in {batch_count} batches from Snowflake")
+
+    def quote_literal(self, value: Any) -> str:
+        """SQL literal for a filter value (Snowflake string literals also treat backslash as an escape)."""
+        if isinstance(value, str):
+            value = value.replace('\\', '\\\\')
+        return super().quote_literal(value)
+
+    def table_sample_clause(self, percent: float, method: str = 'row', seed: Optional[int] = None) -> str:
+        """SAMPLE ROW (Bernoulli) or SAMPLE BLOCK (micro-partitions), with SEED for repeatable samples."""
+        clause = f"SAMPLE {'ROW' if method == 'row' else 'BLOCK'} ({float(percent):g})"
+        if seed is not None:
+            clause += f" SEED ({int(seed)})"
+        return clause
+
+    def describe_columns(self, dataset_id: str) -> List[Dict[str, Any]]:
+        """
+        Get column names and data types from INFORMATION_SCHEMA.
+
+        Args:
+            dataset_id: Full table name ('DB.SCHEMA.TABLE'), 'SCHEMA.TABLE' or just table name
+
+        Returns:
+            List of dicts with 'COLUMN_NAME' and 'DATA_TYPE' keys, in column order
+        """
+        database, schema, table_name = self._resolve_table(dataset_id)
+
+        # dataset_id can come from API requests: bind the names, quote the database identifier
+        self._cursor.execute(
+            f"""
+            SELECT COLUMN_NAME, DATA_TYPE
+            FROM {self.quote_identifier(database)}.INFORMATION_SCHEMA.COLUMNS
+            WHERE TABLE_SCHEMA = %s
+                AND TABLE_NAME = %s
+            ORDER BY ORDINAL_POSITION
+            """,
+            (schema, table_name)
+        )
+        return [{'COLUMN_NAME': row[0], 'DATA_TYPE': row[1]} for row in self._cursor.fetchall()]
+
+    def _resolve_table(self, dataset_id: str) -> tuple:
+        """Split a table name into (database, schema, table), filling in the session's current database/schema."""
+        if not self._cursor:
+            self.connect()
+
+        parts = dataset_id.split('.')
+        table_name = parts[-1].upper()
+
+        if len(parts) >= 2:
+            schema = parts[-2].upper()
+        else:
+            self._cursor.execute("SELECT CURRENT_SCHEMA()")
+            schema = self._cursor.fetchone()[0]
+
+        if len(parts) >= 3:
+            database = parts[-3]
+        else:
+            self._cursor.execute("SELECT CURRENT_DATABASE()")
+            database = self._cursor.fetchone()[0]
+
+        return database, schema, table_name
+
+    def get_table_version(self, dataset_id: str) -> Optional[str]:
+        """
+        Version token from INFORMATION_SCHEMA.TABLES (LAST_ALTERED and ROW_COUNT).
+
+        Args:
+            dataset_id: Full table name ('DB.SCHEMA.TABLE'), 'SCHEMA.TABLE' or just table name
+
+        Returns:
+            Token string, or None for views and unknown tables
+        """
+        database, schema, table_name = self._resolve_table(dataset_id)
+
+        # dataset_id can come from API requests: bind the names, quote the database identifier
+        self._cursor.execute(
+            f"""
+            SELECT LAST_ALTERED, ROW_COUNT
+            FROM {self.quote_identifier(database)}.INFORMATION_SCHEMA.TABLES
+            WHERE TABLE_SCHEMA = %s
+                AND TABLE_NAME = %s
+                AND TABLE_TYPE = 'BASE TABLE'
+            """,
+            (schema, table_name)
+        )
+        row = self._cursor.fetchone()
+        if row is None:
+            return None
+        return f"{row[0]}|{row[1]}"
+
     def test_connection(self) -> bool:
         """Test Snowflake connection."""
         try:
@@ -104,7 +304,8 @@ class SnowflakeConnector(BaseConnector):
                 self.connect()
             self._cursor.execute("SELECT CURRENT_VERSION()")
             result = self._cursor.fetchone()
-            print(f"✓ Snowflake connection test successful. Version: {result[0]}")
+            if self.verbose:
+                print(f"✓ Snowflake connection test successful. Version: {result[0]}")
             return True
         except Exception as e:
             print(f"✗ Snowflake connection test failed: {str(e)}")
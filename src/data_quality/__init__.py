@@ -1 +1,3 @@
 from .checks import *
+from .async_checks import *
+from .session import DatasetSession
@@ -0,0 +1,393 @@
+"""
+Streaming, mergeable accumulators for the null value and descriptive statistics checks.
+
+Each accumulator is updated one DataFrame chunk at a time and can be merged with another
+accumulator of the same kind, so tables that don't fit in memory can be profiled batch by
+batch, and partitions profiled in separate processes can be combined at the end.
+The final results have the same shape as check_dataset_null_values and
+check_dataset_descriptive_stats.
+"""
+import numpy as np
+import pandas as pd
+from typing import Dict, Any, Iterable, Optional
+from .pushdown import NULL_PLACEHOLDERS, PERCENTILES, CATEGORICAL_STATS, NUMERIC_STATS, DESCRIBE_ORDER
+from .sketches import HyperLogLog, DEFAULT_HLL_PRECISION
+
+# Maximum distinct values tracked per categorical column before frequencies become approximate
+DEFAULT_MAX_TRACKED_VALUES = 100_000
+
+# Reservoir size used for approximate quantiles (quantiles are exact below this many values)
+DEFAULT_QUANTILE_SAMPLE_SIZE = 10_000
+
+
+class ReservoirSample:
+    """Fixed-size uniform random sample of a stream of numbers, used for approximate quantiles."""
+
+    def __init__(self, size: int = DEFAULT_QUANTILE_SAMPLE_SIZE, seed: int = 0):
+        self.size = size
+        self.seen = 0
+        self.values = np.empty(0, dtype='float64')
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, values: np.ndarray) -> None:
+        """Add a batch of values (Algorithm R, vectorised over the batch)."""
+        values = np.asarray(values, dtype='float64')
+        if len(values) == 0:
+            return
+
+        # Fill the reservoir first
+        free = max(0, self.size - len(self.values))
+        if free:
+            self.values = np.concatenate([self.values, values[:free]])
+        remaining = values[free:]
+
+        if len(remaining):
+            # Item with global position i replaces a random slot with probability size / (i + 1)
+            positions = self.seen + free + np.arange(len(remaining))
+            slots = (self._rng.random(len(remaining)) * (positions + 1)).astype('int64')
+            keep = slots < self.size
+            self.values[slots[keep]] = remaining[keep]
+
+        self.seen += len(values)
+
+    def merge(self, other: 'ReservoirSample') -> 'ReservoirSample':
+        """Merge another reservoir into this one, weighting each side by how many values it saw."""
+        total = self.seen + other.seen
+        if total <= self.size:
+            self.values = np.concatenate([self.values, other.values])
+        elif total:
+            take_self = min(len(self.values), int(round(self.size * self.seen / total)))
+            take_other = min(len(other.values), self.size - take_self)
+            self.values = np.concatenate([
+                self._rng.choice(self.values, take_self, replace=False),
+                self._rng.choice(other.values, take_other, replace=False)
+            ])
+        self.seen = total
+        return self
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Linear-interpolated quantile of the sample (same method as pandas)."""
+        if len(self.values) == 0:
+            return None
+        return float(np.quantile(self.values, q))
+
+    @property
+    def is_exact(self) -> bool:
+        """Whether every value seen is still in the sample."""
+        return self.seen <= self.size
+
+
+class NullValueAccumulator:
+    """Per-column count of null, empty and placeholder values."""
+
+    def __init__(self):
+        self.total_rows = 0
+        self.null_counts: Dict[str, int] = {}
+
+    def update(self, batch: pd.DataFrame) -> None:
+        """Add one chunk of rows."""
+        self.total_rows += len(batch)
+        missing = (batch.isna() | batch.isin(NULL_PLACEHOLDERS)).sum()
+        for column, null_count in missing.items():
+            self.null_counts[column] = self.null_counts.get(column, 0) + int(null_count)
+
+    def merge(self, other: 'NullValueAccumulator') -> 'NullValueAccumulator':
+        """Merge another accumulator (e.g. from a different partition) into this one."""
+        self.total_rows += other.total_rows
+        for column, null_count in other.null_counts.items():
+            self.null_counts[column] = self.null_counts.get(column, 0) + null_count
+        return self
+
+    def to_result(self, dataset_id: str) -> Dict[str, Any]:
+        """Build a result dictionary in the check_dataset_null_values format."""
+        null_analysis = []
+        for column, null_count in self.null_counts.items():
+            if null_count > 0:
+                null_analysis.append({
+                    'column_name': column,
+                    'null_count': null_count,
+                    'null_percentage': float(np.round((null_count / self.total_rows) * 100, 2))
+                })
+
+        null_analysis.sort(key=lambda x: x['null_percentage'], reverse=True)
+
+        return {
+            "dataset_id": dataset_id,
+            "total_rows": self.total_rows,
+            "total_columns": len(self.null_counts),
+            "columns_with_nulls": len(null_analysis),
+            "null_analysis": null_analysis,
+            "status": "success"
+        }
+
+
+class ColumnStatsAccumulator:
+    """
+    Streaming statistics for a single column.
+
+    The column kind is decided from the first chunk with data, the same way pandas describe()
+    would: 'numeric', 'datetime' or 'categorical' (columns ending with "_id" are always categorical).
+    Numeric and datetime columns track count, mean and M2 (Welford/Chan), min, max and a reservoir
+    sample for quantiles. Categorical columns track count and value frequencies, plus a
+    HyperLogLog sketch for the distinct count when approximate=True.
+    """
+
+    def __init__(self, name: str, max_tracked_values: int = DEFAULT_MAX_TRACKED_VALUES,
+                 sample_size: int = DEFAULT_QUANTILE_SAMPLE_SIZE, seed: int = 0,
+                 approximate: bool = False, precision: int = DEFAULT_HLL_PRECISION):
+        self.name = name
+        self.kind: Optional[str] = 'categorical' if name.lower().endswith('_id') else None
+        self.max_tracked_values = max_tracked_values
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = None
+        self.max = None
+        self.value_counts: Dict[Any, int] = {}
+        self.truncated = False
+        self.reservoir = ReservoirSample(sample_size, seed=seed)
+        self.distinct_sketch = HyperLogLog(precision) if approximate else None
+
+    @staticmethod
+    def _infer_kind(series: pd.Series) -> str:
+        if pd.api.types.is_bool_dtype(series):
+            return 'categorical'
+        if pd.api.types.is_numeric_dtype(series):
+            return 'numeric'
+        if pd.api.types.is_datetime64_any_dtype(series):
+            return 'datetime'
+        return 'categorical'
+
+    def update(self, series: pd.Series) -> None:
+        """Add one chunk of values for this column."""
+        values = series.dropna()
+        if values.empty:
+            return
+
+        if self.kind is None:
+            self.kind = self._infer_kind(values)
+
+        if self.kind == 'categorical':
+            self._update_frequencies(values)
+        else:
+            self._update_moments(values)
+
+    def _to_float_array(self, values: pd.Series) -> np.ndarray:
+        """Numeric view of a chunk; datetimes become nanoseconds since the epoch."""
+        if self.kind == 'datetime':
+            values = pd.to_datetime(values, errors='coerce').dropna()
+            if getattr(values.dt, 'tz', None) is not None:
+                values = values.dt.tz_convert(None)
+            return values.astype('datetime64[ns]').astype('int64').to_numpy(dtype='float64')
+        return pd.to_numeric(values, errors='coerce').dropna().to_numpy(dtype='float64')
+
+    def _update_moments(self, values: pd.Series) -> None:
+        array = self._to_float_array(values)
+        n_batch = len(array)
+        if n_batch == 0:
+            return
+
+        batch_mean = float(array.mean())
+        batch_m2 = float(((array - batch_mean) ** 2).sum())
+        self._combine_moments(n_batch, batch_mean, batch_m2, float(array.min()), float(array.max()))
+        self.reservoir.update(array)
+
+    def _combine_moments(self, n_other: int, mean_other: float, m2_other: float,
+                         min_other: Optional[float], max_other: Optional[float]) -> None:
+        """Chan et al. parallel combination of count/mean/M2 plus min/max."""
+        if n_other == 0:
+            return
+        total = self.count + n_other
+        delta = mean_other - self.mean
+        self.mean += delta * n_other / total
+        self.m2 += m2_other + delta ** 2 * self.count * n_other / total
+        self.count = total
+        self.min = min_other if self.min is None else min(self.min, min_other)
+        self.max = max_other if self.max is None else max(self.max, max_other)
+
+    def _update_frequencies(self, values: pd.Series) -> None:
+        self.count += len(values)
+        for value, frequency in values.value_counts(sort=False).items():
+            self.value_counts[value] = self.value_counts.get(value, 0) + int(frequency)
+        self._prune_frequencies()
+        if self.distinct_sketch is not None:
+            self.distinct_sketch.update(values.astype(str))
+
+    def _prune_frequencies(self) -> None:
+        """Keep only the most frequent values once the tracking limit is exceeded."""
+        if len(self.value_counts) > self.max_tracked_values:
+            keep = sorted(self.value_counts.items(), key=lambda item: item[1], reverse=True)
+            self.value_counts = dict(keep[:self.max_tracked_values])
+            self.truncated = True
+
+    def merge(self, other: 'ColumnStatsAccumulator') -> 'ColumnStatsAccumulator':
+        """Merge another accumulator for the same column into this one."""
+        if self.kind is None:
+            self.kind = other.kind
+
+        if self.kind == 'categorical':
+            self.count += other.count
+            for value, frequency in other.value_counts.items():
+                self.value_counts[value] = self.value_counts.get(value, 0) + frequency
+            self.truncated = self.truncated or other.truncated
+            self._prune_frequencies()
+            if self.distinct_sketch is not None and other.distinct_sketch is not None:
+                self.distinct_sketch.merge(other.distinct_sketch)
+        else:
+            self._combine_moments(other.count, other.mean, other.m2, other.min, other.max)
+            self.reservoir.merge(other.reservoir)
+        return self
+
+    @property
+    def is_approximate(self) -> bool:
+        """Whether any reported statistic is an estimate rather than exact."""
+        if self.kind == 'categorical':
+            return self.truncated or self.distinct_sketch is not None
+        return not self.reservoir.is_exact
+
+    def _format_moment(self, value: Optional[float]) -> Any:
+        if value is None:
+            return None
+        if self.kind == 'datetime':
+            return str(pd.Timestamp(int(round(value))))
+        return float(value)
+
+    def to_stats(self) -> Dict[str, Any]:
+        """Statistics for this column, keyed like pandas describe()."""
+        if self.kind == 'categorical' or self.kind is None:
+            top, freq = None, None
+            if self.value_counts:
+                top, freq = max(self.value_counts.items(), key=lambda item: item[1])
+            unique = len(self.value_counts)
+            if self.distinct_sketch is not None:
+                unique = int(round(self.distinct_sketch.estimate()))
+            return {
+                'count': self.count,
+                'unique': unique,
+                'top': None if top is None else str(top),
+                'freq': freq
+            }
+
+        has_values = self.count > 0
+        stats = {
+            'count': float(self.count) if self.kind == 'numeric' else self.count,
+            'mean': self._format_moment(self.mean if has_values else None),
+            'std': float(np.sqrt(self.m2 / (self.count - 1))) if self.kind == 'numeric' and self.count > 1 else None,
+            'min': self._format_moment(self.min),
+        }
+        for name, q in PERCENTILES:
+            stats[name] = self._format_moment(self.reservoir.quantile(q))
+        stats['max'] = self._format_moment(self.max)
+        return stats
+
+
+class DescriptiveStatsAccumulator:
+    """Streaming equivalent of describe(include='all') over all columns of a dataset."""
+
+    def __init__(self, max_tracked_values: int = DEFAULT_MAX_TRACKED_VALUES,
+                 sample_size: int = DEFAULT_QUANTILE_SAMPLE_SIZE, seed: int = 0,
+                 approximate: bool = False, precision: int = DEFAULT_HLL_PRECISION):
+        self.max_tracked_values = max_tracked_values
+        self.sample_size = sample_size
+        self.seed = seed
+        self.approximate = approximate
+        self.precision = precision
+        self.columns: Dict[str, ColumnStatsAccumulator] = {}
+
+    def _column(self, name: str) -> ColumnStatsAccumulator:
+        if name not in self.columns:
+            self.columns[name] = ColumnStatsAccumulator(
+                name, self.max_tracked_values, self.sample_size, seed=self.seed + len(self.columns),
+                approximate=self.approximate, precision=self.precision
+            )
+        return self.columns[name]
+
+    def update(self, batch: pd.DataFrame) -> None:
+        """Add one chunk of rows."""
+        for column in batch.columns:
+            self._column(column).update(batch[column])
+
+    def merge(self, other: 'DescriptiveStatsAccumulator') -> 'DescriptiveStatsAccumulator':
+        """Merge another accumulator (e.g. from a different partition) into this one."""
+        for name, accumulator in other.columns.items():
+            self._column(name).merge(accumulator)
+        return self
+
+    def to_result(self, dataset_id: str) -> Dict[str, Any]:
+        """Build a result dictionary in the check_dataset_descriptive_stats format."""
+        column_stats = {name: acc.to_stats() for name, acc in self.columns.items()}
+
+        # Only emit the statistic rows pandas would produce for this mix of column types
+        has_numeric = any(acc.kind in ('numeric', 'datetime') for acc in self.columns.values())
+        has_categorical = any(acc.kind in ('categorical', None) for acc in self.columns.values())
+        stat_names = [
+            name for name in DESCRIBE_ORDER
+            if (has_categorical and name in CATEGORICAL_STATS) or (has_numeric and name in NUMERIC_STATS)
+        ]
+
+        stats_dict = {
+            name: {stat_name: stats.get(stat_name) for stat_name in stat_names}
+            for name, stats in column_stats.items()
+        }
+
+        result = {
+            "dataset_id": dataset_id,
+            "descriptive_stats": stats_dict,
+            "status": "success"
+        }
+
+        approximate_columns = [name for name, acc in self.columns.items() if acc.is_approximate]
+        if approximate_columns:
+            result["approximate_columns"] = approximate_columns
+
+        if self.approximate:
+            result["approximate"] = True
+            result["distinct_relative_error"] = round(HyperLogLog(self.precision).relative_error, 5)
+
+        return result
+
+
+def profile_null_values(batches: Iterable[pd.DataFrame], dataset_id: str) -> Dict[str, Any]:
+    """
+    Run the null value check over a stream of DataFrame chunks.
+
+    Args:
+        batches: Iterable of DataFrame chunks (e.g. from stream_data_by_id)
+        dataset_id: Dataset identifier to report
+
+    Returns:
+        Same dictionary shape as check_dataset_null_values
+    """
+    accumulator = NullValueAccumulator()
+    for batch in batches:
+        accumulator.update(batch)
+    return accumulator.to_result(dataset_id)
+
+
+def profile_descriptive_stats(batches: Iterable[pd.DataFrame], dataset_id: str,
+                              max_tracked_values: int = DEFAULT_MAX_TRACKED_VALUES,
+                              sample_size: int = DEFAULT_QUANTILE_SAMPLE_SIZE,
+                              approximate: bool = False) -> Dict[str, Any]:
+    """
+    Run the descriptive statistics check over a stream of DataFrame chunks.
+
+    Quantiles are exact up to sample_size values per column and estimated from a uniform
+    reservoir sample beyond that; categorical frequencies are exact up to max_tracked_values
+    distinct values per column. Columns with estimated statistics are listed under
+    'approximate_columns' in the result. With approximate=True, categorical distinct counts
+    come from HyperLogLog sketches and the result carries 'distinct_relative_error'.
+
+    Args:
+        batches: Iterable of DataFrame chunks (e.g. from stream_data_by_id)
+        dataset_id: Dataset identifier to report
+        max_tracked_values: Distinct values tracked per categorical column
+        sample_size: Reservoir size per numeric column
+        approximate: Estimate distinct counts with HyperLogLog
+
+    Returns:
+        Same dictionary shape as check_dataset_descriptive_stats
+    """
+    accumulator = DescriptiveStatsAccumulator(max_tracked_values, sample_size, approximate=approximate)
+    for batch in batches:
+        accumulator.update(batch)
+    return accumulator.to_result(dataset_id)
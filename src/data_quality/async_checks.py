@@ -0,0 +1,231 @@
+"""
+Asyncio variants of the data quality checks.
+
+Table I/O goes through the connectors' async API (asyncpg for PostgreSQL, worker threads for
+Snowflake), so one event loop can keep many assessments in flight. The pushdown engine runs
+its aggregate queries over the same async API; the pandas computations reuse the blocking check
+functions on worker threads, and streaming accumulators are fed from the async batch stream,
+so memory stays bounded as in the blocking 'streaming' engine.
+"""
+import asyncio
+import pandas as pd
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional
+from src.connectors.connector_factory import ConnectorFactory
+from src.connectors.base_connector import DEFAULT_BATCH_ROWS, DEFAULT_SAMPLE_SEED
+from .checks import (
+    _extrapolate,
+    _source_kwargs,
+    _validate_engine,
+    check_dataset_descriptive_stats,
+    check_dataset_duplicates,
+    check_dataset_null_values,
+    smart_connector_detection,
+)
+from .pushdown import apushdown_descriptive_stats, apushdown_duplicates, apushdown_null_values
+from .accumulators import profile_null_values, profile_descriptive_stats
+from .hash_dedup import count_duplicates_out_of_core, estimate_duplicates_approximate
+from .sampling import extrapolate_descriptive_stats, extrapolate_duplicates, extrapolate_null_values
+
+
+async def aload_data_by_id(dataset_id: str, connector_type: Optional[str] = None, raise_errors: bool = False,
+                           **kwargs) -> pd.DataFrame:
+    """
+    Async variant of load_data_by_id.
+
+    Args:
+        dataset_id: The identifier for the dataset (table name, file name, etc.)
+        connector_type: Type of connector to use ('snowflake', 'postgres'). Auto-detected if None
+        raise_errors: Re-raise connection/loading errors instead of returning an empty DataFrame
+        **kwargs: Additional parameters passed to the connector's aload_data method
+
+    Returns:
+        DataFrame containing the loaded data (empty if loading failed and raise_errors is False)
+    """
+    if connector_type is None:
+        connector_type = smart_connector_detection(dataset_id)
+
+    print(f"--- Loading data for: {dataset_id} using {connector_type.upper()} connector (async) ---")
+
+    try:
+        async with ConnectorFactory.aconnection(connector_type) as connector:
+            return await connector.aload_data(dataset_id, **kwargs)
+
+    except Exception as e:
+        print(f"Error loading data: {str(e)}")
+        if raise_errors:
+            raise
+        print("Returning empty DataFrame due to connection/data loading failure...")
+        return pd.DataFrame()
+
+
+async def astream_data_by_id(dataset_id: str, connector_type: Optional[str] = None,
+                             batch_rows: int = DEFAULT_BATCH_ROWS, **kwargs) -> AsyncIterator[pd.DataFrame]:
+    """
+    Async variant of stream_data_by_id. The connection is held until the generator is exhausted or closed.
+
+    Args:
+        dataset_id: The identifier for the dataset (table name, file name, etc.)
+        connector_type: Type of connector to use ('snowflake', 'postgres'). Auto-detected if None
+        batch_rows: Maximum number of rows per batch
+        **kwargs: Additional parameters passed to the connector's astream_batches method
+
+    Yields:
+        DataFrames with at most batch_rows rows each
+    """
+    if connector_type is None:
+        connector_type = smart_connector_detection(dataset_id)
+
+    print(f"--- Streaming data for: {dataset_id} using {connector_type.upper()} connector (async) ---")
+
+    async with ConnectorFactory.aconnection(connector_type) as connector:
+        async for batch in connector.astream_batches(dataset_id, batch_rows=batch_rows, **kwargs):
+            yield batch
+
+
+def _iterate_from_thread(batches: AsyncIterator[pd.DataFrame], loop: asyncio.AbstractEventLoop) -> Iterator[pd.DataFrame]:
+    """Blocking iterator over an async batch stream, for consumers running on a worker thread."""
+    async def next_batch():
+        return await batches.__anext__()
+
+    while True:
+        try:
+            yield asyncio.run_coroutine_threadsafe(next_batch(), loop).result()
+        except StopAsyncIteration:
+            return
+
+
+async def _profile_stream(profile: Callable[..., Dict[str, Any]], batches: AsyncIterator[pd.DataFrame],
+                          dataset_id: str, **kwargs) -> Dict[str, Any]:
+    """Run a blocking streaming profile (e.g. profile_null_values) on a worker thread over an async batch stream."""
+    loop = asyncio.get_running_loop()
+    try:
+        return await asyncio.to_thread(profile, _iterate_from_thread(batches, loop), dataset_id, **kwargs)
+    finally:
+        await batches.aclose()
+
+
+async def acheck_dataset_duplicates(dataset_id: str, connector_type: Optional[str] = None,
+                                    df: Optional[pd.DataFrame] = None, engine: str = 'pandas',
+                                    batch_rows: int = DEFAULT_BATCH_ROWS, sample_duplicates: int = 0,
+                                    approximate: bool = False, columns: Optional[List[str]] = None,
+                                    filters: Optional[Dict[str, Any]] = None, sample_percent: Optional[float] = None,
+                                    sample_method: str = 'row',
+                                    sample_seed: Optional[int] = DEFAULT_SAMPLE_SEED) -> Dict[str, Any]:
+    """
+    Async variant of check_dataset_duplicates (same arguments and result).
+
+    Returns:
+        Dict[str, Any]: A dictionary containing the status and the total quantity of duplicate rows found.
+    """
+    _validate_engine(engine)
+    source = _source_kwargs(columns, filters, sample_percent, sample_method, sample_seed)
+    if df is None and engine == 'pushdown':
+        result = await apushdown_duplicates(dataset_id, connector_type or smart_connector_detection(dataset_id),
+                                            approximate=approximate, **source)
+        return _extrapolate(extrapolate_duplicates, result, sample_percent, sample_method)
+    if df is None and engine == 'streaming':
+        try:
+            batches = astream_data_by_id(dataset_id, connector_type=connector_type, batch_rows=batch_rows, **source)
+            if approximate:
+                result = await _profile_stream(estimate_duplicates_approximate, batches, dataset_id)
+            else:
+                result = await _profile_stream(count_duplicates_out_of_core, batches, dataset_id,
+                                               sample_groups=sample_duplicates)
+            return _extrapolate(extrapolate_duplicates, result, sample_percent, sample_method)
+        except Exception as e:
+            return {
+                "dataset_id": dataset_id,
+                "error": str(e),
+                "status": "failure"
+            }
+
+    if df is None:
+        df = await aload_data_by_id(dataset_id, connector_type=connector_type, **source)
+
+    return await asyncio.to_thread(check_dataset_duplicates, dataset_id, connector_type, df=df,
+                                   sample_duplicates=sample_duplicates, approximate=approximate, columns=columns,
+                                   sample_percent=sample_percent, sample_method=sample_method)
+
+
+async def acheck_dataset_null_values(dataset_id: str, connector_type: Optional[str] = None,
+                                     df: Optional[pd.DataFrame] = None, engine: str = 'pandas',
+                                     batch_rows: int = DEFAULT_BATCH_ROWS, columns: Optional[List[str]] = None,
+                                     filters: Optional[Dict[str, Any]] = None, sample_percent: Optional[float] = None,
+                                     sample_method: str = 'row',
+                                     sample_seed: Optional[int] = DEFAULT_SAMPLE_SEED) -> Dict[str, Any]:
+    """
+    Async variant of check_dataset_null_values (same arguments and result).
+
+    Returns:
+        Dict[str, Any]: Null value analysis per column
+    """
+    _validate_engine(engine)
+    source = _source_kwargs(columns, filters, sample_percent, sample_method, sample_seed)
+    if df is None and engine == 'pushdown':
+        result = await apushdown_null_values(dataset_id, connector_type or smart_connector_detection(dataset_id),
+                                             **source)
+        return _extrapolate(extrapolate_null_values, result, sample_percent, sample_method)
+    if df is None and engine == 'streaming':
+        try:
+            batches = astream_data_by_id(dataset_id, connector_type=connector_type, batch_rows=batch_rows, **source)
+            result = await _profile_stream(profile_null_values, batches, dataset_id)
+            return _extrapolate(extrapolate_null_values, result, sample_percent, sample_method)
+        except Exception as e:
+            return {
+                "dataset_id": dataset_id,
+                "error": str(e),
+                "status": "failure"
+            }
+
+    if df is None:
+        df = await aload_data_by_id(dataset_id, connector_type=connector_type, **source)
+
+    return await asyncio.to_thread(check_dataset_null_values, dataset_id, connector_type, df=df, columns=columns,
+                                   sample_percent=sample_percent, sample_method=sample_method)
+
+
+async def acheck_dataset_descriptive_stats(dataset_id: str, connector_type: Optional[str] = None,
+                                           df: Optional[pd.DataFrame] = None, engine: str = 'pandas',
+                                           batch_rows: int = DEFAULT_BATCH_ROWS,
+                                           approximate: bool = False, columns: Optional[List[str]] = None,
+                                           filters: Optional[Dict[str, Any]] = None, sample_percent: Optional[float] = None,
+                                           sample_method: str = 'row',
+                                           sample_seed: Optional[int] = DEFAULT_SAMPLE_SEED) -> Dict[str, Any]:
+    """
+    Async variant of check_dataset_descriptive_stats (same arguments and result).
+
+    Returns:
+        Dict[str, Any]: Column-wise descriptive statistics
+    """
+    _validate_engine(engine)
+    source = _source_kwargs(columns, filters, sample_percent, sample_method, sample_seed)
+    if df is None and engine == 'pushdown':
+        result = await apushdown_descriptive_stats(dataset_id,
+                                                   connector_type or smart_connector_detection(dataset_id),
+                                                   approximate=approximate, **source)
+        return _extrapolate(extrapolate_descriptive_stats, result, sample_percent, sample_method)
+    if df is None and engine == 'streaming':
+        try:
+            batches = astream_data_by_id(dataset_id, connector_type=connector_type, batch_rows=batch_rows, **source)
+            result = await _profile_stream(profile_descriptive_stats, batches, dataset_id, approximate=approximate)
+            return _extrapolate(extrapolate_descriptive_stats, result, sample_percent, sample_method)
+        except Exception as e:
+            return {
+                "dataset_id": dataset_id,
+                "error": str(e),
+                "status": "failure"
+            }
+
+    if df is None:
+        df = await aload_data_by_id(dataset_id, connector_type=connector_type, **source)
+
+    return await asyncio.to_thread(check_dataset_descriptive_stats, dataset_id, connector_type, df=df,
+                                   columns=columns, sample_percent=sample_percent, sample_method=sample_method)
+
+
+# Check name -> async function mapping (mirrors DQ_CHECKS)
+ASYNC_DQ_CHECKS = {
+    'duplicates': acheck_dataset_duplicates,
+    'null_values': acheck_dataset_null_values,
+    'descriptive_stats': acheck_dataset_descriptive_stats
+}
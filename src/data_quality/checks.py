@@ -1,9 +1,20 @@
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, List, Optional
 import yaml
 import os
 from src.connectors.connector_factory import ConnectorFactory
+from src.connectors.base_connector import DEFAULT_BATCH_ROWS, DEFAULT_SAMPLE_SEED, SAMPLE_METHODS
+from .pushdown import pushdown_duplicates, pushdown_null_values, pushdown_descriptive_stats
+from .accumulators import profile_null_values, profile_descriptive_stats
+from .hash_dedup import count_duplicates_out_of_core, estimate_duplicates_approximate, find_duplicate_examples
+from .sampling import extrapolate_descriptive_stats, extrapolate_duplicates, extrapolate_null_values
+
+# Execution engines supported by the check functions:
+#   'pandas'    - load the rows and compute in pandas (default)
+#   'pushdown'  - compile the check into warehouse SQL and fetch only aggregates
+#   'streaming' - stream bounded-size chunks and merge per-chunk accumulators
+CHECK_ENGINES = ('pandas', 'pushdown', 'streaming')
 
 # Smart connector detection from settings
 def get_default_connector_type() -> str:
@@ -100,7 +111,8 @@ def smart_connector_detection(dataset_id: str) -> str:
 
     return 'snowflake'
 
-def load_data_by_id(dataset_id: str, connector_type: Optional[str] = None, **kwargs) -> pd.DataFrame:
+def load_data_by_id(dataset_id: str, connector_type: Optional[str] = None, raise_errors: bool = False,
+                    **kwargs) -> pd.DataFrame:
     """
     Loads data based on dataset ID with intelligent connector auto-detection.
 
@@ -108,6 +120,7 @@ def load_data_by_id(dataset_id: str, connector_type: Optional[str] = None, **kwa
         dataset_id: The identifier for the dataset (table name, file name, etc.)
         connector_type: Type of connector to use ('snowflake', 'postgres').
                        If None, uses smart auto-detection based on table patterns and available configs
+        raise_errors: Re-raise connection/loading errors instead of returning an empty DataFrame
         **kwargs: Additional parameters passed to the connector's load_data method
 
     Returns:
@@ -120,21 +133,90 @@ def load_data_by_id(dataset_id: str, connector_type: Optional[str] = None, **kwa
     print(f"--- Loading data for: {dataset_id} using {connector_type.upper()} connector ---")
 
     try:
-        # Create connector using factory
-        connector = ConnectorFactory.create_connector(connector_type)
-
-        # Use context manager to ensure proper connection cleanup
-        with connector:
+        # Borrow a connected connector from the shared pool (returned when the block exits)
+        with ConnectorFactory.connection(connector_type) as connector:
             df = connector.load_data(dataset_id, **kwargs)
             return df
 
     except Exception as e:
         print(f"Error loading data: {str(e)}")
+        if raise_errors:
+            raise
         # Return empty DataFrame to avoid masking real connectivity/data issues
         print("Returning empty DataFrame due to connection/data loading failure...")
         return pd.DataFrame()
 
-def check_dataset_duplicates(dataset_id: str, connector_type: Optional[str] = None) -> Dict[str, Any]:
+def stream_data_by_id(dataset_id: str, connector_type: Optional[str] = None,
+                      batch_rows: int = DEFAULT_BATCH_ROWS, **kwargs) -> Iterator[pd.DataFrame]:
+    """
+    Streams data based on dataset ID as bounded-size DataFrames.
+
+    Unlike load_data_by_id, the table is never fully materialised: the connector's
+    stream_batches() keeps at most one batch in memory, so peak memory stays flat
+    regardless of table size. The pooled connection is held until the generator is exhausted or closed.
+
+    Args:
+        dataset_id: The identifier for the dataset (table name, file name, etc.)
+        connector_type: Type of connector to use ('snowflake', 'postgres').
+                       If None, uses smart auto-detection based on table patterns and available configs
+        batch_rows: Maximum number of rows per batch
+        **kwargs: Additional parameters passed to the connector's stream_batches method
+
+    Yields:
+        DataFrames with at most batch_rows rows each
+    """
+    if connector_type is None:
+        connector_type = smart_connector_detection(dataset_id)
+
+    print(f"--- Streaming data for: {dataset_id} using {connector_type.upper()} connector ---")
+
+    with ConnectorFactory.connection(connector_type) as connector:
+        yield from connector.stream_batches(dataset_id, batch_rows=batch_rows, **kwargs)
+
+def _validate_engine(engine: str, supported: tuple = CHECK_ENGINES) -> None:
+    """Raise a ValueError for unknown or unsupported execution engines."""
+    if engine not in supported:
+        raise ValueError(f"Unknown engine: {engine}. Available engines: {list(supported)}")
+
+def _project_columns(df: pd.DataFrame, columns: Optional[List[str]]) -> pd.DataFrame:
+    """Select the requested columns of a pre-loaded DataFrame (matched case-insensitively)."""
+    if not columns:
+        return df
+    by_name = {str(col).lower(): col for col in df.columns}
+    missing = [column for column in columns if column.strip('"').lower() not in by_name]
+    if missing:
+        raise ValueError(f"Unknown columns: {missing}. Available columns: {list(df.columns)}")
+    return df[[by_name[column.strip('"').lower()] for column in columns]]
+
+def _source_kwargs(columns: Optional[List[str]], filters: Optional[Dict[str, Any]],
+                   sample_percent: Optional[float], sample_method: str, sample_seed: Optional[int]) -> Dict[str, Any]:
+    """Column, row and sampling restrictions passed to the loaders and push-down functions."""
+    # Validated here so a bad sample fails loudly instead of as an empty load
+    if sample_percent is not None and not 0 < sample_percent <= 100:
+        raise ValueError(f"sample_percent must be in (0, 100], got {sample_percent}")
+    if sample_method not in SAMPLE_METHODS:
+        raise ValueError(f"Unknown sample_method: {sample_method}. Available methods: {list(SAMPLE_METHODS)}")
+    return {
+        'columns': columns,
+        'filters': filters,
+        'sample_percent': sample_percent,
+        'sample_method': sample_method,
+        'sample_seed': sample_seed
+    }
+
+def _extrapolate(extrapolator, result: Dict[str, Any], sample_percent: Optional[float],
+                 sample_method: str) -> Dict[str, Any]:
+    """Turn a result computed on a sample into whole-table estimates (unchanged when not sampling)."""
+    if sample_percent is None:
+        return result
+    return extrapolator(result, sample_percent, sample_method)
+
+def check_dataset_duplicates(dataset_id: str, connector_type: Optional[str] = None,
+                             df: Optional[pd.DataFrame] = None, engine: str = 'pandas',
+                             batch_rows: int = DEFAULT_BATCH_ROWS, sample_duplicates: int = 0,
+                             approximate: bool = False, columns: Optional[List[str]] = None,
+                             filters: Optional[Dict[str, Any]] = None, sample_percent: Optional[float] = None,
+                             sample_method: str = 'row', sample_seed: Optional[int] = DEFAULT_SAMPLE_SEED) -> Dict[str, Any]:
     """
     Checks an entire dataset for duplicate rows and returns the total count of duplicates.
 
@@ -146,25 +228,88 @@ def check_dataset_duplicates(dataset_id: str, connector_type: Optional[str] = No
                          - 'SCHEMA.TABLE' or 'DATABASE.SCHEMA.TABLE'
         connector_type (str, optional): The data source connector to use ('snowflake', 'postgres').
                                        If not specified, uses default from settings.
+        df (pd.DataFrame, optional): Pre-loaded data for the dataset (e.g. from a DatasetSession).
+                                     If provided, no data is loaded from the source.
+        engine (str): Execution engine - 'pandas' (load rows, default), 'pushdown' (run the check
+                      as warehouse SQL and fetch only aggregates) or 'streaming' (hash rows chunk by chunk
+                      into on-disk buckets and count per bucket). Ignored when df is provided.
+        batch_rows (int): Rows per chunk for the 'streaming' engine
+        sample_duplicates (int): Number of duplicate groups to return as 'duplicate_examples'
+                                 (pandas engine, and streaming engine when not approximate; 0 = none)
+        approximate (bool): Estimate the distinct row count with HyperLogLog (APPROX_COUNT_DISTINCT on
+                            Snowflake) instead of an exact deduplication. The result then carries
+                            'approximate', 'method', 'relative_error' and 'duplicate_qty_bounds' (~95%).
+        columns (List[str], optional): Only read and check these columns; rows count as duplicates when these columns
+                                       match (e.g. a business key). Also applied to a pre-loaded df.
+        filters (Dict[str, Any], optional): Row filters {column: value}, a list value meaning IN and a
+                                            {operator: value} dict a comparison, e.g. {'region': 'EU',
+                                            'order_date': {'>=': '2024-01-01'}} (ignored when df is provided).
+        sample_percent (float, optional): Check a random sample of this percentage of the table
+                                          (e.g. 1 for a quick estimate) and extrapolate the result,
+                                          with 95% confidence intervals. With df, marks df as such a sample.
+        sample_method (str): 'row' (each row independently; statistically valid, default) or 'block'
+                             (whole storage blocks; faster but clustered)
+        sample_seed (int, optional): Seed making the sample repeatable (required by the 'pushdown' engine)
 
     Returns:
         Dict[str, Any]: A dictionary containing the status and the total quantity of duplicate rows found.
+                        Sampled results are whole-table estimates with 'sample_duplicate_qty',
+                        'duplicate_qty_bounds' and 'duplicate_percentage_ci' (see sampling.py).
     """
-    # 1. Load the data based on the ID provided by the LLM
-    df = load_data_by_id(dataset_id, connector_type=connector_type)
+    _validate_engine(engine)
+    source = _source_kwargs(columns, filters, sample_percent, sample_method, sample_seed)
+    if df is None and engine == 'pushdown':
+        result = pushdown_duplicates(dataset_id, connector_type or smart_connector_detection(dataset_id),
+                                     approximate=approximate, **source)
+        return _extrapolate(extrapolate_duplicates, result, sample_percent, sample_method)
+    if df is None and engine == 'streaming':
+        try:
+            batches = stream_data_by_id(dataset_id, connector_type=connector_type, batch_rows=batch_rows, **source)
+            if approximate:
+                result = estimate_duplicates_approximate(batches, dataset_id)
+            else:
+                result = count_duplicates_out_of_core(batches, dataset_id, sample_groups=sample_duplicates)
+            return _extrapolate(extrapolate_duplicates, result, sample_percent, sample_method)
+        except Exception as e:
+            return {
+                "dataset_id": dataset_id,
+                "error": str(e),
+                "status": "failure"
+            }
+
+    # 1. Load the data based on the ID provided by the LLM (unless already loaded)
+    if df is None:
+        df = load_data_by_id(dataset_id, connector_type=connector_type, **source)
+    else:
+        df = _project_columns(df, columns)
 
     # 2. Counting duplicates
-    total_rows = len(df)
-    duplicate_numb = total_rows - len(df.drop_duplicates())
+    if approximate:
+        result = estimate_duplicates_approximate([df], dataset_id)
+        duplicate_numb = result["duplicate_qty"]
+    else:
+        total_rows = len(df)
+        duplicate_numb = total_rows - len(df.drop_duplicates())
+
+        result = {
+            "dataset_id": dataset_id,
+            "total_rows": total_rows,
+            "duplicate_qty": duplicate_numb,
+            "status": "success" if duplicate_numb == 0 else "failure"
+        }
 
-    return {
-        "dataset_id": dataset_id,
-        "total_rows": total_rows,
-        "duplicate_qty": duplicate_numb,
-        "status": "success" if duplicate_numb == 0 else "failure"
-    }
+    # 3. Optionally collect sample duplicate groups for the report
+    if sample_duplicates:
+        result["duplicate_examples"] = find_duplicate_examples(df, sample_duplicates) if duplicate_numb else []
 
-def check_dataset_null_values(dataset_id: str, connector_type: Optional[str] = None) -> Dict[str, Any]:
+    return _extrapolate(extrapolate_duplicates, result, sample_percent, sample_method)
+
+def check_dataset_null_values(dataset_id: str, connector_type: Optional[str] = None,
+                              df: Optional[pd.DataFrame] = None, engine: str = 'pandas',
+                              batch_rows: int = DEFAULT_BATCH_ROWS, columns: Optional[List[str]] = None,
+                              filters: Optional[Dict[str, Any]] = None,
+                              sample_percent: Optional[float] = None, sample_method: str = 'row',
+                              sample_seed: Optional[int] = DEFAULT_SAMPLE_SEED) -> Dict[str, Any]:
     """
     Analyzes a dataset for null, missing, and empty values across all columns.
 
@@ -183,6 +328,23 @@ def check_dataset_null_values(dataset_id: str, connector_type: Optional[str] = N
                          - 'TABLE' for default schema
         connector_type (str, optional): The data source connector to use ('snowflake', 'postgres').
                                        If not specified, uses default from settings.yaml
+        df (pd.DataFrame, optional): Pre-loaded data for the dataset (e.g. from a DatasetSession).
+                                     If provided, no data is loaded from the source.
+        engine (str): Execution engine - 'pandas' (load rows, default), 'pushdown' (run the check
+                      as warehouse SQL and fetch only aggregates) or 'streaming' (process the table in
+                      bounded-size chunks with mergeable accumulators). Ignored when df is provided.
+        batch_rows (int): Rows per chunk for the 'streaming' engine
+        columns (List[str], optional): Only read and check these columns. Also applied to a
+                                       pre-loaded df.
+        filters (Dict[str, Any], optional): Row filters {column: value}, a list value meaning IN and a
+                                            {operator: value} dict a comparison, e.g. {'region': 'EU',
+                                            'order_date': {'>=': '2024-01-01'}} (ignored when df is provided).
+        sample_percent (float, optional): Check a random sample of this percentage of the table
+                                          (e.g. 1 for a quick estimate) and extrapolate the result,
+                                          with 95% confidence intervals. With df, marks df as such a sample.
+        sample_method (str): 'row' (each row independently; statistically valid, default) or 'block'
+                             (whole storage blocks; faster but clustered)
+        sample_seed (int, optional): Seed making the sample repeatable (required by the 'pushdown' engine)
 
     Returns:
         Dict[str, Any]: A dictionary containing:
@@ -194,6 +356,8 @@ def check_dataset_null_values(dataset_id: str, connector_type: Optional[str] = N
                 - null_count: Absolute number of null/missing values
                 - null_percentage: Percentage of null values (0-100)
             - status: 'success' if analysis completed, 'failure' if errors occurred
+            Sampled results are whole-table estimates with per-column 'null_percentage_ci'
+            (see sampling.py).
 
     Example:
         result = check_dataset_null_values("SALES.CUSTOMERS")
@@ -208,9 +372,29 @@ def check_dataset_null_values(dataset_id: str, connector_type: Optional[str] = N
         #   'status': 'success'
         # }
     """
+    _validate_engine(engine)
+    source = _source_kwargs(columns, filters, sample_percent, sample_method, sample_seed)
+    if df is None and engine == 'pushdown':
+        result = pushdown_null_values(dataset_id, connector_type or smart_connector_detection(dataset_id), **source)
+        return _extrapolate(extrapolate_null_values, result, sample_percent, sample_method)
+    if df is None and engine == 'streaming':
+        try:
+            batches = stream_data_by_id(dataset_id, connector_type=connector_type, batch_rows=batch_rows, **source)
+            return _extrapolate(extrapolate_null_values, profile_null_values(batches, dataset_id),
+                                sample_percent, sample_method)
+        except Exception as e:
+            return {
+                "dataset_id": dataset_id,
+                "error": str(e),
+                "status": "failure"
+            }
+
     try:
-        # 1. Load the data based on the ID provided by the LLM
-        df = load_data_by_id(dataset_id, connector_type=connector_type)
+        # 1. Load the data based on the ID provided by the LLM (unless already loaded)
+        if df is None:
+            df = load_data_by_id(dataset_id, connector_type=connector_type, **source)
+        else:
+            df = _project_columns(df, columns)
 
         # 2. Standardize null representations
         # Replace common null placeholders with pandas NaN for consistent analysis
@@ -242,7 +426,7 @@ def check_dataset_null_values(dataset_id: str, connector_type: Optional[str] = N
         # 4. Sort by null percentage (highest first) for prioritization
         null_analysis.sort(key=lambda x: x['null_percentage'], reverse=True)
 
-        return {
+        result = {
             "dataset_id": dataset_id,
             "total_rows": total_rows,
             "total_columns": len(df_clean.columns),
@@ -250,6 +434,7 @@ def check_dataset_null_values(dataset_id: str, connector_type: Optional[str] = N
             "null_analysis": null_analysis,
             "status": "success"
         }
+        return _extrapolate(extrapolate_null_values, result, sample_percent, sample_method)
 
     except Exception as e:
         return {
@@ -258,7 +443,13 @@ def check_dataset_null_values(dataset_id: str, connector_type: Optional[str] = N
             "status": "failure"
         }
 
-def check_dataset_descriptive_stats(dataset_id: str, connector_type: Optional[str] = None) -> Dict[str, Any]:
+def check_dataset_descriptive_stats(dataset_id: str, connector_type: Optional[str] = None,
+                                    df: Optional[pd.DataFrame] = None, engine: str = 'pandas',
+                                    batch_rows: int = DEFAULT_BATCH_ROWS, approximate: bool = False,
+                                    columns: Optional[List[str]] = None,
+                                    filters: Optional[Dict[str, Any]] = None, sample_percent: Optional[float] = None,
+                                    sample_method: str = 'row',
+                                    sample_seed: Optional[int] = DEFAULT_SAMPLE_SEED) -> Dict[str, Any]:
     """
     Provides comprehensive descriptive statistics for all columns in a dataset.
 
@@ -274,22 +465,66 @@ def check_dataset_descriptive_stats(dataset_id: str, connector_type: Optional[st
                          - 'TABLE' for default schema
         connector_type (str, optional): The data source connector to use ('snowflake', 'postgres').
                                        If not specified, uses default from settings.yaml
+        df (pd.DataFrame, optional): Pre-loaded data for the dataset (e.g. from a DatasetSession).
+                                     If provided, no data is loaded from the source.
+        engine (str): Execution engine - 'pandas' (load rows, default), 'pushdown' (run the check
+                      as warehouse SQL and fetch only aggregates) or 'streaming' (process the table in
+                      bounded-size chunks with mergeable accumulators). Ignored when df is provided.
+        batch_rows (int): Rows per chunk for the 'streaming' engine
+        approximate (bool): Estimate 'unique' counts with HyperLogLog (pushdown and streaming engines).
+                            The result then carries 'approximate' and 'distinct_relative_error'.
+        columns (List[str], optional): Only read and check these columns. Also applied to a
+                                       pre-loaded df.
+        filters (Dict[str, Any], optional): Row filters {column: value}, a list value meaning IN and a
+                                            {operator: value} dict a comparison, e.g. {'region': 'EU',
+                                            'order_date': {'>=': '2024-01-01'}} (ignored when df is provided).
+        sample_percent (float, optional): Check a random sample of this percentage of the table
+                                          (e.g. 1 for a quick estimate) and extrapolate the result,
+                                          with 95% confidence intervals. With df, marks df as such a sample.
+        sample_method (str): 'row' (each row independently; statistically valid, default) or 'block'
+                             (whole storage blocks; faster but clustered)
+        sample_seed (int, optional): Seed making the sample repeatable (required by the 'pushdown' engine)
 
     Returns:
         Dict[str, Any]: A dictionary containing:
             - dataset_id: The identifier of the analyzed dataset
             - descriptive_stats: Dictionary with column-wise statistics from df.describe()
             - status: 'success' if analysis completed, 'failure' if errors occurred
+            Sampled results are marked 'sampled' with 'estimated_total_rows'.
 
     Note:
         Columns ending with "_id" (e.g., customer_id, product_id) are automatically converted
         to categorical type before analysis to ensure appropriate statistical treatment.
     """
+    _validate_engine(engine)
+    source = _source_kwargs(columns, filters, sample_percent, sample_method, sample_seed)
+    if df is None and engine == 'pushdown':
+        result = pushdown_descriptive_stats(dataset_id, connector_type or smart_connector_detection(dataset_id),
+                                            approximate=approximate, **source)
+        return _extrapolate(extrapolate_descriptive_stats, result, sample_percent, sample_method)
+    if df is None and engine == 'streaming':
+        try:
+            batches = stream_data_by_id(dataset_id, connector_type=connector_type, batch_rows=batch_rows, **source)
+            return _extrapolate(extrapolate_descriptive_stats,
+                                profile_descriptive_stats(batches, dataset_id, approximate=approximate),
+                                sample_percent, sample_method)
+        except Exception as e:
+            return {
+                "dataset_id": dataset_id,
+                "error": str(e),
+                "status": "failure"
+            }
+
     try:
-        # 1. Load the data based on the ID provided by the LLM
-        df = load_data_by_id(dataset_id, connector_type=connector_type)
+        # 1. Load the data based on the ID provided by the LLM (unless already loaded)
+        if df is None:
+            df = load_data_by_id(dataset_id, connector_type=connector_type, **source)
+        else:
+            df = _project_columns(df, columns)
 
         # 2. Cast columns ending with "_id" to categorical for proper statistical treatment
+        # (work on a copy so a shared, pre-loaded frame is left untouched)
+        df = df.copy()
         id_columns = [col for col in df.columns if col.lower().endswith('_id')]
         for col in id_columns:
             # Convert ID columns to categorical type
@@ -315,11 +550,12 @@ def check_dataset_descriptive_stats(dataset_id: str, connector_type: Optional[st
 
             stats_dict[col] = col_stats
 
-        return {
+        result = {
             "dataset_id": dataset_id,
             "descriptive_stats": stats_dict,
             "status": "success"
         }
+        return _extrapolate(extrapolate_descriptive_stats, result, sample_percent, sample_method)
 
     except Exception as e:
         return {
@@ -331,6 +567,13 @@ def check_dataset_descriptive_stats(dataset_id: str, connector_type: Optional[st
 # Available data quality check functions
 DQ_TOOLS = [check_dataset_duplicates, check_dataset_null_values, check_dataset_descriptive_stats]
 
+# Check name -> function mapping used by assessments and reports
+DQ_CHECKS = {
+    'duplicates': check_dataset_duplicates,
+    'null_values': check_dataset_null_values,
+    'descriptive_stats': check_dataset_descriptive_stats
+}
+
 if __name__ == '__main__':
     # Example execution:
     result1 = check_dataset_duplicates("test_data_set")
@@ -0,0 +1,328 @@
+"""
+Hash-based, out-of-core duplicate detection.
+
+Every row is reduced to a 64- or 128-bit digest with pandas' vectorised
+hash_pandas_object. Digests are spilled into hash-partitioned bucket files on disk,
+and duplicates are then counted one bucket at a time, so memory is bounded by the
+size of a single bucket rather than by the size of the table.
+"""
+import os
+import shutil
+import tempfile
+import numpy as np
+import pandas as pd
+from typing import Dict, Any, Iterable, List, Optional
+from .sketches import HyperLogLog, DEFAULT_HLL_PRECISION, approximate_duplicates_result
+
+# Number of on-disk buckets digests are partitioned into
+DEFAULT_NUM_PARTITIONS = 64
+
+# Number of leading digests kept in memory to recognise sample duplicate groups while streaming
+DEFAULT_SAMPLE_WINDOW = 1_000_000
+
+# Second hash key (must be 16 bytes), used for the upper 64 bits of 128-bit digests
+_SECOND_HASH_KEY = 'dq-duplicates-hi'
+
+# Mixed into every column hash of the upper 64 bits, so that half is computed independently
+# of the lower one for numeric columns too (their hashes don't depend on the hash key)
+_SECOND_HASH_SALT = np.uint64(0x9E3779B97F4A7C15)
+
+_NAN_BITS = np.array([np.nan]).view('int64')[0]
+
+
+def _canonical_numbers(values: pd.Series) -> tuple:
+    """
+    (payload, is_float) arrays giving equal numbers the same key whatever the column's dtype.
+
+    Integers keep their exact int64 value; floats holding an integer (including -0.0) use that
+    integer, and other floats (fractions, inf, NaN/NULL) their float64 bits, flagged is_float.
+    """
+    if pd.api.types.is_integer_dtype(values.dtype):
+        missing = values.isna().to_numpy()
+        if not missing.any():
+            return values.to_numpy(dtype='int64'), np.zeros(len(values), dtype=bool)
+        payload = values.fillna(0).to_numpy(dtype='int64')
+        return np.where(missing, _NAN_BITS, payload), missing
+
+    floats = values.to_numpy(dtype='float64', na_value=np.nan)
+    integral = np.isfinite(floats) & (np.floor(floats) == floats) & (np.abs(floats) < 2.0 ** 63)
+    as_integer = np.where(integral, floats, 0).astype('int64')
+    as_bits = np.where(np.isnan(floats), np.nan, floats).view('int64')
+    return np.where(integral, as_integer, as_bits), ~integral
+
+
+def _normalize_for_hashing(batch: pd.DataFrame) -> pd.DataFrame:
+    """
+    Give equal values the same representation in every chunk before hashing.
+
+    A chunk where an integer column contains a NULL arrives as float64, so 1 and 1.0 must hash
+    alike across chunks; numeric columns are therefore replaced by _canonical_numbers pairs,
+    which keeps integers beyond 2^53 exact and hashes -0.0 as 0.
+    """
+    columns: Dict[int, Any] = {}
+    for col in batch.columns:
+        values = batch[col]
+        if (pd.api.types.is_integer_dtype(values.dtype) or pd.api.types.is_float_dtype(values.dtype)) \
+                and not pd.api.types.is_bool_dtype(values.dtype):
+            payload, is_float = _canonical_numbers(values)
+            columns[len(columns)] = payload
+            columns[len(columns)] = is_float
+        else:
+            columns[len(columns)] = values.array
+    return pd.DataFrame(columns, copy=False)
+
+
+def hash_rows(batch: pd.DataFrame, digest_bits: int = 64) -> np.ndarray:
+    """
+    Hash every row of a DataFrame.
+
+    Args:
+        batch: Rows to hash
+        digest_bits: 64 or 128
+
+    Returns:
+        uint64 array of shape (n,) for 64-bit digests or (n, 2) for 128-bit digests
+    """
+    if digest_bits not in (64, 128):
+        raise ValueError(f"digest_bits must be 64 or 128, got {digest_bits}")
+
+    batch = _normalize_for_hashing(batch)
+    low = pd.util.hash_pandas_object(batch, index=False).to_numpy(dtype='uint64')
+    if digest_bits == 64:
+        return low
+
+    # Upper half: every column re-hashed with the second key (text) and salt (all types)
+    # before combining, so a collision of the lower half says nothing about this one
+    salted = pd.DataFrame({
+        position: pd.util.hash_pandas_object(batch[position], index=False,
+                                             hash_key=_SECOND_HASH_KEY).to_numpy(dtype='uint64') ^ _SECOND_HASH_SALT
+        for position in batch.columns
+    })
+    high = pd.util.hash_pandas_object(salted, index=False).to_numpy(dtype='uint64')
+    return np.column_stack([low, high])
+
+
+def find_duplicate_examples(df: pd.DataFrame, max_groups: int) -> List[Dict[str, Any]]:
+    """
+    Find sample duplicate groups in an in-memory DataFrame.
+
+    Args:
+        df: Data to search
+        max_groups: Maximum number of groups to return
+
+    Returns:
+        List of {'count': occurrences, 'row': row values} dicts, most repeated first
+    """
+    if max_groups <= 0 or df.empty:
+        return []
+
+    digests = pd.Series(hash_rows(df), index=df.index)
+    counts = digests.value_counts()
+    counts = counts[counts > 1].head(max_groups)
+
+    examples = []
+    for digest, count in counts.items():
+        row = df.loc[digests[digests == digest].index[0]]
+        examples.append({'count': int(count), 'row': row.to_dict()})
+    return examples
+
+
+class HashPartitionedDuplicateCounter:
+    """
+    Counts duplicate rows across a stream of DataFrame chunks with bounded memory.
+
+    Example:
+        counter = HashPartitionedDuplicateCounter(sample_groups=3)
+        for batch in stream_data_by_id("PROD_SALES.PUBLIC.INVOICES"):
+            counter.update(batch)
+        total_rows, duplicate_qty, examples = counter.finish()
+    """
+
+    def __init__(self, num_partitions: int = DEFAULT_NUM_PARTITIONS, digest_bits: int = 64,
+                 spill_dir: Optional[str] = None, sample_groups: int = 0,
+                 sample_window: int = DEFAULT_SAMPLE_WINDOW):
+        """
+        Args:
+            num_partitions: Number of on-disk digest buckets
+            digest_bits: 64 or 128 (128 makes hash collisions practically impossible)
+            spill_dir: Directory for bucket files (default: a new temporary directory)
+            sample_groups: Number of duplicate groups to capture as examples (0 = none)
+            sample_window: Number of leading digests kept in memory to spot example duplicates
+        """
+        if digest_bits not in (64, 128):
+            raise ValueError(f"digest_bits must be 64 or 128, got {digest_bits}")
+
+        self.num_partitions = num_partitions
+        self.digest_bits = digest_bits
+        self.sample_groups = sample_groups
+        self.sample_window = sample_window
+        self.total_rows = 0
+
+        self._owns_spill_dir = spill_dir is None
+        self._spill_dir = spill_dir or tempfile.mkdtemp(prefix='dq_duplicates_')
+        os.makedirs(self._spill_dir, exist_ok=True)
+
+        self._window = np.empty(0, dtype='uint64')
+        self._examples: Dict[int, Dict[str, Any]] = {}
+
+    def _partition_path(self, partition: int) -> str:
+        return os.path.join(self._spill_dir, f"bucket_{partition:04d}.bin")
+
+    def update(self, batch: pd.DataFrame) -> None:
+        """Hash one chunk of rows and spill the digests to their buckets."""
+        if batch.empty:
+            return
+
+        digests = hash_rows(batch, self.digest_bits)
+        keys = digests if self.digest_bits == 64 else digests[:, 0]
+        self.total_rows += len(batch)
+
+        if self.sample_groups and len(self._examples) < self.sample_groups:
+            self._capture_examples(batch, keys)
+
+        # Group the chunk's digests by bucket and append each group to its bucket file
+        partitions = keys % np.uint64(self.num_partitions)
+        order = np.argsort(partitions, kind='stable')
+        sorted_partitions = partitions[order]
+        boundaries = np.flatnonzero(np.diff(sorted_partitions)) + 1
+        for group in np.split(order, boundaries):
+            partition = int(partitions[group[0]])
+            with open(self._partition_path(partition), 'ab') as f:
+                np.ascontiguousarray(digests[group]).tofile(f)
+
+    def _capture_examples(self, batch: pd.DataFrame, keys: np.ndarray) -> None:
+        """Remember rows whose digest was already seen within the in-memory window or this chunk."""
+        repeated = np.isin(keys, self._window) | pd.Series(keys).duplicated().to_numpy()
+        for position in np.flatnonzero(repeated):
+            key = int(keys[position])
+            if key not in self._examples:
+                self._examples[key] = batch.iloc[position].to_dict()
+                if len(self._examples) >= self.sample_groups:
+                    break
+
+        room = self.sample_window - len(self._window)
+        if room > 0:
+            self._window = np.union1d(self._window, keys[:room])
+
+    def finish(self) -> tuple:
+        """
+        Count duplicates bucket by bucket and clean up the spill files.
+
+        Returns:
+            Tuple of (total_rows, duplicate_qty, duplicate_examples)
+        """
+        distinct_rows = 0
+        example_counts: Dict[int, int] = {}
+
+        try:
+            for partition in range(self.num_partitions):
+                path = self._partition_path(partition)
+                if not os.path.exists(path):
+                    continue
+
+                digests = np.fromfile(path, dtype='uint64')
+                if self.digest_bits == 128:
+                    digests = digests.reshape(-1, 2)
+                    unique, counts = np.unique(digests, axis=0, return_counts=True)
+                    unique_keys = unique[:, 0]
+                else:
+                    unique, counts = np.unique(digests, return_counts=True)
+                    unique_keys = unique
+                distinct_rows += len(unique)
+
+                for key in self._examples:
+                    matches = np.flatnonzero(unique_keys == np.uint64(key))
+                    if len(matches):
+                        example_counts[key] = int(counts[matches].max())
+        finally:
+            self.cleanup()
+
+        examples = [
+            {'count': example_counts.get(key, 2), 'row': row}
+            for key, row in self._examples.items()
+        ]
+        examples.sort(key=lambda example: example['count'], reverse=True)
+
+        return self.total_rows, self.total_rows - distinct_rows, examples
+
+    def cleanup(self) -> None:
+        """Remove the bucket files (and the spill directory if this counter created it)."""
+        if self._owns_spill_dir:
+            shutil.rmtree(self._spill_dir, ignore_errors=True)
+        else:
+            for partition in range(self.num_partitions):
+                path = self._partition_path(partition)
+                if os.path.exists(path):
+                    os.remove(path)
+
+
+def count_duplicates_out_of_core(batches: Iterable[pd.DataFrame], dataset_id: str,
+                                 sample_groups: int = 0, num_partitions: int = DEFAULT_NUM_PARTITIONS,
+                                 digest_bits: int = 64, spill_dir: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Run the duplicate check over a stream of DataFrame chunks.
+
+    Args:
+        batches: Iterable of DataFrame chunks (e.g. from stream_data_by_id)
+        dataset_id: Dataset identifier to report
+        sample_groups: Number of duplicate groups to return as 'duplicate_examples'
+        num_partitions: Number of on-disk digest buckets
+        digest_bits: 64 or 128
+        spill_dir: Directory for bucket files (default: a temporary directory)
+
+    Returns:
+        Same dictionary shape as check_dataset_duplicates
+    """
+    counter = HashPartitionedDuplicateCounter(
+        num_partitions=num_partitions,
+        digest_bits=digest_bits,
+        spill_dir=spill_dir,
+        sample_groups=sample_groups
+    )
+    try:
+        for batch in batches:
+            counter.update(batch)
+    except Exception:
+        counter.cleanup()
+        raise
+
+    total_rows, duplicate_numb, examples = counter.finish()
+
+    result = {
+        "dataset_id": dataset_id,
+        "total_rows": total_rows,
+        "duplicate_qty": duplicate_numb,
+        "status": "success" if duplicate_numb == 0 else "failure"
+    }
+    if sample_groups:
+        result["duplicate_examples"] = examples
+    return result
+
+
+def estimate_duplicates_approximate(batches: Iterable[pd.DataFrame], dataset_id: str,
+                                    precision: int = DEFAULT_HLL_PRECISION) -> Dict[str, Any]:
+    """
+    Estimate the duplicate row count with a HyperLogLog sketch over row digests.
+
+    Uses a fixed 2^precision bytes of memory and no disk, regardless of table size.
+
+    Args:
+        batches: Iterable of DataFrame chunks (a single in-memory DataFrame can be passed as [df])
+        dataset_id: Dataset identifier to report
+        precision: HyperLogLog precision (more registers = smaller error)
+
+    Returns:
+        Same dictionary shape as check_dataset_duplicates plus 'approximate', 'method',
+        'relative_error' and 'duplicate_qty_bounds'
+    """
+    sketch = HyperLogLog(precision)
+    total_rows = 0
+    for batch in batches:
+        if batch.empty:
+            continue
+        sketch.update_hashes(hash_rows(batch))
+        total_rows += len(batch)
+
+    return approximate_duplicates_result(
+        dataset_id, total_rows, sketch.estimate(), sketch.relative_error, method='hyperloglog'
+    )
@@ -0,0 +1,677 @@
+"""
+SQL push-down execution for data quality checks.
+
+Each check is compiled into warehouse SQL so that only aggregates leave the database
+instead of every row. Results keep the same dictionary shape as the pandas-based checks
+in checks.py, so RemediationAdvisor and ReportTemplates work unchanged.
+"""
+import numpy as np
+import pandas as pd
+from abc import ABC, abstractmethod
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from src.connectors.base_connector import BaseConnector, DEFAULT_SAMPLE_SEED
+from src.connectors.connector_factory import ConnectorFactory
+from .sketches import HyperLogLog, DEFAULT_HLL_PRECISION, approximate_duplicates_result
+
+# String values treated as missing, mirroring check_dataset_null_values
+NULL_PLACEHOLDERS = ['', 'NULL', 'null', '<NA>']
+
+# Quantiles reported by pandas describe()
+PERCENTILES = [('25%', 0.25), ('50%', 0.5), ('75%', 0.75)]
+
+# Statistic order of pandas describe(include='all')
+CATEGORICAL_STATS = ['count', 'unique', 'top', 'freq']
+NUMERIC_STATS = ['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max']
+DESCRIBE_ORDER = ['count', 'unique', 'top', 'freq', 'mean', 'std', 'min', '25%', '50%', '75%', 'max']
+
+
+class SQLDialect(ABC):
+    """SQL fragments that differ between warehouses."""
+
+    name = 'ansi'
+    text_type = 'VARCHAR'
+    numeric_types: set = set()
+    # Relative error of the native approximate distinct count (None if the warehouse has none)
+    approx_distinct_error: Optional[float] = None
+
+    def quote_identifier(self, identifier: str) -> str:
+        """Quote a column name exactly as stored in the catalog."""
+        return '"' + identifier.replace('"', '""') + '"'
+
+    def quote_literal(self, value: str) -> str:
+        """Quote a string literal."""
+        return "'" + value.replace("'", "''") + "'"
+
+    def cast_text(self, expression: str) -> str:
+        """Cast an expression to text so it can be compared with string placeholders."""
+        return f"CAST({expression} AS {self.text_type})"
+
+    def stddev(self, expression: str) -> str:
+        """Sample standard deviation (ddof=1, as in pandas)."""
+        return f"STDDEV_SAMP({expression})"
+
+    @abstractmethod
+    def percentile(self, expression: str, quantile: float) -> str:
+        """Percentile aggregate for the given quantile."""
+
+    def approx_count_distinct(self, expression: str) -> str:
+        """
+        Native approximate distinct count aggregate, used only when approx_distinct_error is set
+        (other dialects estimate distinct counts from HyperLogLog register scans).
+        """
+        raise NotImplementedError(f"No native approximate distinct count for dialect {self.name}")
+
+    @abstractmethod
+    def row_hash(self, alias: str) -> str:
+        """64-bit hash of a whole row of the table aliased as alias."""
+
+    @abstractmethod
+    def value_hash(self, expression: str) -> str:
+        """64-bit hash of a single value."""
+
+    def is_numeric(self, data_type: str) -> bool:
+        """Whether an information_schema data type is numeric."""
+        return data_type.split('(')[0].strip().upper() in self.numeric_types
+
+
+class PostgresDialect(SQLDialect):
+    """PostgreSQL dialect."""
+
+    name = 'postgres'
+    numeric_types = {'SMALLINT', 'INTEGER', 'BIGINT', 'NUMERIC', 'DECIMAL', 'REAL', 'DOUBLE PRECISION'}
+
+    def percentile(self, expression: str, quantile: float) -> str:
+        # percentile_cont interpolates linearly, matching pandas quantile()
+        return f"PERCENTILE_CONT({quantile}) WITHIN GROUP (ORDER BY {expression})"
+
+    def row_hash(self, alias: str) -> str:
+        return f"hashtextextended({alias}::text, 0)"
+
+    def value_hash(self, expression: str) -> str:
+        return f"hashtextextended({expression}::text, 0)"
+
+
+class SnowflakeDialect(SQLDialect):
+    """Snowflake dialect."""
+
+    name = 'snowflake'
+    numeric_types = {
+        'NUMBER', 'DECIMAL', 'NUMERIC', 'INT', 'INTEGER', 'BIGINT', 'SMALLINT', 'TINYINT', 'BYTEINT',
+        'FLOAT', 'FLOAT4', 'FLOAT8', 'DOUBLE', 'DOUBLE PRECISION', 'REAL'
+    }
+    # Documented average relative error of APPROX_COUNT_DISTINCT (HyperLogLog, 4096 registers)
+    approx_distinct_error = 0.01625
+
+    def percentile(self, expression: str, quantile: float) -> str:
+        return f"APPROX_PERCENTILE({expression}, {quantile})"
+
+    def approx_count_distinct(self, expression: str) -> str:
+        return f"APPROX_COUNT_DISTINCT({expression})"
+
+    def row_hash(self, alias: str) -> str:
+        return f"HASH({alias}.*)"
+
+    def value_hash(self, expression: str) -> str:
+        return f"HASH({expression})"
+
+
+SQL_DIALECTS = {
+    'postgres': PostgresDialect(),
+    'snowflake': SnowflakeDialect(),
+}
+
+
+def get_dialect(connector: BaseConnector) -> SQLDialect:
+    """Return the SQL dialect for a connector instance."""
+    if connector.dialect not in SQL_DIALECTS:
+        raise NotImplementedError(f"SQL push-down not implemented for {type(connector).__name__}")
+    return SQL_DIALECTS[connector.dialect]
+
+
+# ---------------------------------------------------------------------------
+# SQL compilation
+# ---------------------------------------------------------------------------
+
+def compile_duplicates_sql(source: str) -> str:
+    """Compile the duplicate check: total rows and distinct rows (NULLs compare equal, as in pandas)."""
+    return (
+        f"SELECT (SELECT COUNT(*) FROM {source} AS src) AS total_rows, "
+        f"(SELECT COUNT(*) FROM (SELECT DISTINCT * FROM {source} AS src) AS distinct_rows) AS distinct_rows"
+    )
+
+
+def compile_approx_duplicates_sql(dialect: SQLDialect, source: str) -> str:
+    """Compile the approximate duplicate check using the warehouse's native distinct estimator."""
+    return (
+        f"SELECT COUNT(*) AS total_rows, "
+        f"{dialect.approx_count_distinct(dialect.row_hash('t'))} AS distinct_rows FROM {source} AS t"
+    )
+
+
+def _hll_register_rank_sql(precision: int) -> str:
+    """Select list mapping a 64-bit hash column h to its HyperLogLog register and rank."""
+    remaining_bits = 64 - precision
+    mask = (1 << remaining_bits) - 1
+    return (
+        f"(h >> {remaining_bits}) & {(1 << precision) - 1} AS register, "
+        f"CASE WHEN h & {mask} = 0 THEN {remaining_bits + 1} "
+        f"ELSE {remaining_bits} - FLOOR(LOG(2, (h & {mask})::numeric))::int END AS rank"
+    )
+
+
+def compile_hll_registers_sql(dialect: SQLDialect, source: str, precision: int = DEFAULT_HLL_PRECISION) -> str:
+    """
+    Compile a HyperLogLog register scan for warehouses without a native estimator.
+
+    The warehouse hashes every row and aggregates down to at most 2^precision
+    (register, rank, rows) tuples, which are merged into a HyperLogLog sketch client-side.
+    """
+    return (
+        f"SELECT register, MAX(rank) AS rank, COUNT(*) AS row_count FROM ("
+        f"SELECT {_hll_register_rank_sql(precision)} "
+        f"FROM (SELECT {dialect.row_hash('t')} AS h FROM {source} AS t) AS hashed"
+        f") AS ranked GROUP BY register"
+    )
+
+
+def compile_column_hll_registers_sql(dialect: SQLDialect, source: str, columns: List[str],
+                                     precision: int = DEFAULT_HLL_PRECISION) -> str:
+    """
+    Compile a per-column HyperLogLog register scan (approximate distinct counts without a native estimator).
+
+    Non-null values of every column are hashed and tagged with the column's position, so the
+    result has at most 2^precision (column_index, register, rank) rows per column.
+    """
+    hashed = ' UNION ALL '.join(
+        f"SELECT {i} AS column_index, {dialect.value_hash(dialect.quote_identifier(column))} AS h "
+        f"FROM {source} AS src WHERE {dialect.quote_identifier(column)} IS NOT NULL"
+        for i, column in enumerate(columns)
+    )
+    return (
+        f"SELECT column_index, register, MAX(rank) AS rank FROM ("
+        f"SELECT column_index, {_hll_register_rank_sql(precision)} FROM ({hashed}) AS hashed"
+        f") AS ranked GROUP BY column_index, register"
+    )
+
+
+def compile_null_counts_sql(dialect: SQLDialect, source: str, columns: List[str]) -> str:
+    """Compile the null check: row count plus one missing-value counter per column."""
+    placeholders = ', '.join(dialect.quote_literal(value) for value in NULL_PLACEHOLDERS)
+    select_parts = ["COUNT(*) AS total_rows"]
+    for i, column in enumerate(columns):
+        col = dialect.quote_identifier(column)
+        select_parts.append(
+            f"SUM(CASE WHEN {col} IS NULL OR {dialect.cast_text(col)} IN ({placeholders}) "
+            f"THEN 1 ELSE 0 END) AS null_{i}"
+        )
+    return f"SELECT {', '.join(select_parts)} FROM {source} AS src"
+
+
+def compile_stats_sql(dialect: SQLDialect, source: str, columns: List[Tuple[str, bool]],
+                      approximate: bool = False) -> Tuple[str, List[Tuple[str, str]]]:
+    """
+    Compile the aggregate part of the descriptive stats check.
+
+    Args:
+        dialect: SQL dialect
+        source: Table reference to aggregate over
+        columns: List of (column_name, is_numeric) tuples
+        approximate: Use the dialect's approximate distinct count for 'unique'; dialects without
+                     one leave 'unique' out (see compile_column_hll_registers_sql)
+
+    Returns:
+        Tuple of (sql, output layout) where layout lists the (column_name, stat_name)
+        of every selected expression in order
+    """
+    select_parts = []
+    layout = []
+    for column, is_numeric in columns:
+        col = dialect.quote_identifier(column)
+        expressions = [('count', f"COUNT({col})")]
+        if is_numeric:
+            expressions += [
+                ('mean', f"AVG({col})"),
+                ('std', dialect.stddev(col)),
+                ('min', f"MIN({col})"),
+            ]
+            expressions += [(name, dialect.percentile(col, q)) for name, q in PERCENTILES]
+            expressions.append(('max', f"MAX({col})"))
+        elif not approximate:
+            expressions.append(('unique', f"COUNT(DISTINCT {col})"))
+        elif dialect.approx_distinct_error is not None:
+            expressions.append(('unique', dialect.approx_count_distinct(col)))
+
+        for stat_name, expression in expressions:
+            select_parts.append(f"{expression} AS s_{len(layout)}")
+            layout.append((column, stat_name))
+
+    return f"SELECT {', '.join(select_parts)} FROM {source} AS src", layout
+
+
+def compile_top_values_sql(dialect: SQLDialect, source: str, columns: List[str]) -> str:
+    """
+    Compile the most frequent value (top/freq) lookup for several categorical columns as one query.
+
+    Each column gets a grouped subquery limited to its top value; the subqueries are combined
+    with UNION ALL and tagged with the column's position, so the result has at most one
+    (column_index, top_value, freq) row per column.
+    """
+    subqueries = []
+    for i, column in enumerate(columns):
+        col = dialect.quote_identifier(column)
+        subqueries.append(
+            f"SELECT {i} AS column_index, top_value, freq FROM ("
+            f"SELECT {dialect.cast_text(col)} AS top_value, COUNT(*) AS freq FROM {source} AS src "
+            f"WHERE {col} IS NOT NULL GROUP BY {col} ORDER BY freq DESC LIMIT 1"
+            f") AS top_{i}"
+        )
+    return ' UNION ALL '.join(subqueries)
+
+
+# ---------------------------------------------------------------------------
+# Execution
+# ---------------------------------------------------------------------------
+#
+# Every check is planned in two I/O-free steps around the warehouse round-trips: a plan function
+# takes the connector and the table's column metadata and returns the SQL to run plus a finish
+# function turning the fetched frames into the result. _run_plan executes a plan over the
+# blocking connector API and _arun_plan over the async one, so both share the same SQL and
+# result shapes.
+
+# (queries to run, function turning their result frames into the check result)
+PushdownPlan = Tuple[List[str], Callable[[List[pd.DataFrame]], Dict[str, Any]]]
+
+
+def _to_native(value: Any) -> Any:
+    """Convert a value fetched from the warehouse to a JSON-friendly Python type."""
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    if isinstance(value, Decimal):
+        return float(value)
+    if hasattr(value, 'item'):  # numpy scalar
+        return value.item()
+    return value
+
+
+def _first_row(df: pd.DataFrame) -> List[Any]:
+    """First row of an aggregate query's result as a list of native values."""
+    if df.empty:
+        return []
+    return [_to_native(value) for value in df.iloc[0].tolist()]
+
+
+def _check_columns(columns: List[Dict[str, Any]], dataset_id: str) -> List[Dict[str, Any]]:
+    """Fail clearly if the table has no visible columns."""
+    if not columns:
+        raise ValueError(f"No columns found for {dataset_id}")
+    return columns
+
+
+def _select_columns(columns: List[Dict[str, Any]], requested: Optional[List[str]], dataset_id: str) -> List[Dict[str, Any]]:
+    """Restrict column metadata to the requested columns (matched case-insensitively, in request order)."""
+    if not requested:
+        return columns
+    by_name = {col['COLUMN_NAME'].lower(): col for col in columns}
+    missing = [column for column in requested if column.strip('"').lower() not in by_name]
+    if missing:
+        raise ValueError(f"Unknown columns for {dataset_id}: {missing}")
+    return [by_name[column.strip('"').lower()] for column in requested]
+
+
+def _source(connector: BaseConnector, dataset_id: str, columns: Optional[List[str]] = None,
+            filters: Optional[Dict[str, Any]] = None,
+            sample_percent: Optional[float] = None, sample_method: str = 'row',
+            sample_seed: Optional[int] = DEFAULT_SAMPLE_SEED) -> str:
+    """
+    Relation the aggregates run over: the table itself, or a subquery applying the column
+    projection (catalog names, quoted exactly), the table sample and the filters.
+    """
+    if not (columns or filters or sample_percent is not None):
+        return dataset_id
+    if sample_percent is not None and sample_seed is None:
+        # The compiled SQL reads the source more than once; every read must see the same sample
+        raise ValueError("Push-down sampling needs a sample_seed")
+    if columns:
+        dialect = get_dialect(connector)
+        columns = [dialect.quote_identifier(column) for column in columns]
+    sql_query = connector.build_select_query(dataset_id, columns=columns, filters=filters,
+                                             sample_percent=sample_percent, sample_method=sample_method,
+                                             sample_seed=sample_seed)
+    return f"({sql_query})"
+
+
+def _estimate_from_registers(registers: pd.DataFrame, precision: int) -> Tuple[int, HyperLogLog]:
+    """Build a HyperLogLog sketch from a register scan; returns (total_rows, sketch)."""
+    sketch = HyperLogLog(precision)
+    if not registers.empty:
+        registers.columns = [col.lower() for col in registers.columns]
+        index = registers['register'].astype('int64').to_numpy()
+        sketch.registers[index] = registers['rank'].astype('uint8').to_numpy()
+    total_rows = int(registers['row_count'].sum()) if not registers.empty else 0
+    return total_rows, sketch
+
+
+def _estimate_column_distincts(registers: pd.DataFrame, columns: List[str], precision: int) -> Dict[str, float]:
+    """Build one HyperLogLog sketch per column from a per-column register scan; returns {column: estimate}."""
+    sketches = {column: HyperLogLog(precision) for column in columns}
+    for column_index, register, rank in registers.itertuples(index=False, name=None):
+        sketches[columns[int(column_index)]].registers[int(register)] = int(rank)
+    return {column: sketch.estimate() for column, sketch in sketches.items()}
+
+
+def _failure(dataset_id: str, error: Exception) -> Dict[str, Any]:
+    """Result of a push-down check that could not run."""
+    return {
+        "dataset_id": dataset_id,
+        "error": str(error),
+        "status": "failure"
+    }
+
+
+def _run_plan(connector_type: str, dataset_id: str, plan: Callable[..., PushdownPlan],
+              needs_columns: bool) -> Dict[str, Any]:
+    """Execute a push-down plan over a pooled connector's blocking API."""
+    try:
+        with ConnectorFactory.connection(connector_type) as connector:
+            described = _check_columns(connector.describe_columns(dataset_id), dataset_id) if needs_columns else []
+            queries, finish = plan(connector, described)
+            frames = [connector.load_data(dataset_id, query=sql) for sql in queries]
+        return finish(frames)
+
+    except Exception as e:
+        return _failure(dataset_id, e)
+
+
+async def _arun_plan(connector_type: str, dataset_id: str, plan: Callable[..., PushdownPlan],
+                     needs_columns: bool) -> Dict[str, Any]:
+    """Execute a push-down plan over the connector's async API (asyncpg for PostgreSQL)."""
+    try:
+        async with ConnectorFactory.aconnection(connector_type) as connector:
+            described = (_check_columns(await connector.adescribe_columns(dataset_id), dataset_id)
+                         if needs_columns else [])
+            queries, finish = plan(connector, described)
+            frames = [await connector.aload_data(dataset_id, query=sql) for sql in queries]
+        return finish(frames)
+
+    except Exception as e:
+        return _failure(dataset_id, e)
+
+
+def _duplicates_plan(dataset_id: str, approximate: bool, columns: Optional[List[str]],
+                     **source_kwargs) -> Callable[..., PushdownPlan]:
+    """Plan the duplicate check: exact SELECT DISTINCT, native APPROX_COUNT_DISTINCT or a HyperLogLog register scan."""
+    def plan(connector: BaseConnector, described: List[Dict[str, Any]]) -> PushdownPlan:
+        dialect = get_dialect(connector)
+        selected = [col['COLUMN_NAME'] for col in _select_columns(described, columns, dataset_id)] if columns else None
+        source = _source(connector, dataset_id, columns=selected, **source_kwargs)
+
+        if not approximate:
+            def finish(frames: List[pd.DataFrame]) -> Dict[str, Any]:
+                total_rows, distinct_rows = _first_row(frames[0])
+                total_rows = int(total_rows or 0)
+                duplicate_numb = total_rows - int(distinct_rows or 0)
+                return {
+                    "dataset_id": dataset_id,
+                    "total_rows": total_rows,
+                    "duplicate_qty": duplicate_numb,
+                    "status": "success" if duplicate_numb == 0 else "failure"
+                }
+            return [compile_duplicates_sql(source)], finish
+
+        if dialect.approx_distinct_error is not None:
+            def finish_native(frames: List[pd.DataFrame]) -> Dict[str, Any]:
+                total_rows, distinct_rows = _first_row(frames[0])
+                return approximate_duplicates_result(
+                    dataset_id, int(total_rows or 0), float(distinct_rows or 0),
+                    dialect.approx_distinct_error, method='APPROX_COUNT_DISTINCT'
+                )
+            return [compile_approx_duplicates_sql(dialect, source)], finish_native
+
+        def finish_sketch(frames: List[pd.DataFrame]) -> Dict[str, Any]:
+            total_rows, sketch = _estimate_from_registers(frames[0], DEFAULT_HLL_PRECISION)
+            return approximate_duplicates_result(
+                dataset_id, total_rows, sketch.estimate(), sketch.relative_error, method='hyperloglog'
+            )
+        return [compile_hll_registers_sql(dialect, source)], finish_sketch
+
+    return plan
+
+
+def _null_values_plan(dataset_id: str, columns: Optional[List[str]], **source_kwargs) -> Callable[..., PushdownPlan]:
+    """Plan the null check: one aggregate query with a missing-value counter per column."""
+    def plan(connector: BaseConnector, described: List[Dict[str, Any]]) -> PushdownPlan:
+        dialect = get_dialect(connector)
+        selected = [col['COLUMN_NAME'] for col in _select_columns(described, columns, dataset_id)]
+        source = _source(connector, dataset_id, **source_kwargs)
+
+        def finish(frames: List[pd.DataFrame]) -> Dict[str, Any]:
+            row = _first_row(frames[0])
+            total_rows = int(row[0] or 0)
+            null_analysis = []
+            for column, null_count in zip(selected, row[1:]):
+                null_count = int(null_count or 0)
+                if null_count > 0:
+                    null_analysis.append({
+                        'column_name': column,
+                        'null_count': null_count,
+                        'null_percentage': float(np.round((null_count / total_rows) * 100, 2))
+                    })
+
+            null_analysis.sort(key=lambda x: x['null_percentage'], reverse=True)
+
+            return {
+                "dataset_id": dataset_id,
+                "total_rows": total_rows,
+                "total_columns": len(selected),
+                "columns_with_nulls": len(null_analysis),
+                "null_analysis": null_analysis,
+                "status": "success"
+            }
+
+        return [compile_null_counts_sql(dialect, source, selected)], finish
+
+    return plan
+
+
+def _descriptive_stats_plan(dataset_id: str, approximate: bool, columns: Optional[List[str]],
+                            **source_kwargs) -> Callable[..., PushdownPlan]:
+    """
+    Plan the descriptive stats check: one aggregate query, one batched top-value query for the
+    categorical columns and, for approximate distinct counts without a native estimator, one
+    per-column HyperLogLog register scan.
+    """
+    def plan(connector: BaseConnector, described: List[Dict[str, Any]]) -> PushdownPlan:
+        dialect = get_dialect(connector)
+        selected = [
+            (col['COLUMN_NAME'],
+             dialect.is_numeric(col['DATA_TYPE']) and not col['COLUMN_NAME'].lower().endswith('_id'))
+            for col in _select_columns(described, columns, dataset_id)
+        ]
+        source = _source(connector, dataset_id, **source_kwargs)
+        categorical = [column for column, is_numeric in selected if not is_numeric]
+        sketch_distincts = approximate and dialect.approx_distinct_error is None and bool(categorical)
+
+        stats_sql, layout = compile_stats_sql(dialect, source, selected, approximate=approximate)
+        queries = [stats_sql]
+        if categorical:
+            queries.append(compile_top_values_sql(dialect, source, categorical))
+        if sketch_distincts:
+            queries.append(compile_column_hll_registers_sql(dialect, source, categorical))
+
+        def finish(frames: List[pd.DataFrame]) -> Dict[str, Any]:
+            collected: Dict[str, Dict[str, Any]] = {column: {} for column, _ in selected}
+            for (column, stat_name), value in zip(layout, _first_row(frames[0])):
+                collected[column][stat_name] = value
+
+            if categorical:
+                for column in categorical:
+                    collected[column]['top'] = None
+                    collected[column]['freq'] = None
+                for column_index, top_value, freq in frames[1].itertuples(index=False, name=None):
+                    column = categorical[int(column_index)]
+                    collected[column]['top'] = _to_native(top_value)
+                    collected[column]['freq'] = _to_native(freq)
+
+            if sketch_distincts:
+                for column, estimate in _estimate_column_distincts(frames[2], categorical,
+                                                                   DEFAULT_HLL_PRECISION).items():
+                    collected[column]['unique'] = round(estimate)
+
+            return _descriptive_stats_result(dataset_id, dialect, selected, collected, approximate)
+
+        return queries, finish
+
+    return plan
+
+
+def _descriptive_stats_result(dataset_id: str, dialect: SQLDialect, columns: List[Tuple[str, bool]],
+                              collected: Dict[str, Dict[str, Any]], approximate: bool) -> Dict[str, Any]:
+    """Shape collected per-column statistics like check_dataset_descriptive_stats."""
+    # Only emit the statistic rows pandas would produce for this mix of column types
+    has_numeric = any(is_numeric for _, is_numeric in columns)
+    has_categorical = any(not is_numeric for _, is_numeric in columns)
+    stat_names = [
+        name for name in DESCRIBE_ORDER
+        if (has_categorical and name in CATEGORICAL_STATS) or (has_numeric and name in NUMERIC_STATS)
+    ]
+
+    stats_dict = {}
+    for column, is_numeric in columns:
+        col_stats = {}
+        for stat_name in stat_names:
+            value = collected[column].get(stat_name)
+            if value is None:
+                col_stats[stat_name] = None
+            elif stat_name in ('unique', 'freq') or (stat_name == 'count' and not is_numeric):
+                col_stats[stat_name] = int(value)
+            elif is_numeric:
+                col_stats[stat_name] = float(value)
+            else:
+                col_stats[stat_name] = str(value)
+        stats_dict[column] = col_stats
+
+    result = {
+        "dataset_id": dataset_id,
+        "descriptive_stats": stats_dict,
+        "status": "success"
+    }
+    if approximate:
+        result["approximate"] = True
+        result["distinct_relative_error"] = (
+            dialect.approx_distinct_error if dialect.approx_distinct_error is not None
+            else round(HyperLogLog(DEFAULT_HLL_PRECISION).relative_error, 5)
+        )
+    return result
+
+
+def pushdown_duplicates(dataset_id: str, connector_type: str, approximate: bool = False,
+                        columns: Optional[List[str]] = None,
+                        filters: Optional[Dict[str, Any]] = None, sample_percent: Optional[float] = None,
+                        sample_method: str = 'row', sample_seed: Optional[int] = DEFAULT_SAMPLE_SEED) -> Dict[str, Any]:
+    """
+    Count duplicate rows inside the warehouse.
+
+    Args:
+        dataset_id: Full table identifier
+        connector_type: Connector to use ('snowflake', 'postgres')
+        approximate: Estimate the distinct row count with HyperLogLog instead of SELECT DISTINCT
+        columns: Rows are duplicates when these columns match (default: all)
+        filters: {column: value} row filters (see BaseConnector.build_select_query)
+        sample_percent: Aggregate over a sample of this percentage of the table
+        sample_method: 'row' or 'block' sampling
+        sample_seed: Seed of the sample (required when sampling)
+
+    Returns:
+        Same dictionary shape as check_dataset_duplicates
+    """
+    plan = _duplicates_plan(dataset_id, approximate, columns, filters=filters, sample_percent=sample_percent,
+                            sample_method=sample_method, sample_seed=sample_seed)
+    return _run_plan(connector_type, dataset_id, plan, needs_columns=bool(columns))
+
+
+async def apushdown_duplicates(dataset_id: str, connector_type: str, approximate: bool = False,
+                               columns: Optional[List[str]] = None,
+                               filters: Optional[Dict[str, Any]] = None, sample_percent: Optional[float] = None,
+                               sample_method: str = 'row',
+                               sample_seed: Optional[int] = DEFAULT_SAMPLE_SEED) -> Dict[str, Any]:
+    """Async variant of pushdown_duplicates (same arguments and result), run over the connector's async API."""
+    plan = _duplicates_plan(dataset_id, approximate, columns, filters=filters, sample_percent=sample_percent,
+                            sample_method=sample_method, sample_seed=sample_seed)
+    return await _arun_plan(connector_type, dataset_id, plan, needs_columns=bool(columns))
+
+
+def pushdown_null_values(dataset_id: str, connector_type: str, columns: Optional[List[str]] = None,
+                         filters: Optional[Dict[str, Any]] = None,
+                         sample_percent: Optional[float] = None, sample_method: str = 'row',
+                         sample_seed: Optional[int] = DEFAULT_SAMPLE_SEED) -> Dict[str, Any]:
+    """
+    Count null, empty and placeholder values per column inside the warehouse.
+
+    Args:
+        dataset_id: Full table identifier
+        connector_type: Connector to use ('snowflake', 'postgres')
+        columns: Only consider these columns (default: all)
+        filters: {column: value} row filters (see BaseConnector.build_select_query)
+        sample_percent: Aggregate over a sample of this percentage of the table
+        sample_method: 'row' or 'block' sampling
+        sample_seed: Seed of the sample (required when sampling)
+
+    Returns:
+        Same dictionary shape as check_dataset_null_values
+    """
+    plan = _null_values_plan(dataset_id, columns, filters=filters, sample_percent=sample_percent,
+                             sample_method=sample_method, sample_seed=sample_seed)
+    return _run_plan(connector_type, dataset_id, plan, needs_columns=True)
+
+
+async def apushdown_null_values(dataset_id: str, connector_type: str, columns: Optional[List[str]] = None,
+                                filters: Optional[Dict[str, Any]] = None,
+                                sample_percent: Optional[float] = None, sample_method: str = 'row',
+                                sample_seed: Optional[int] = DEFAULT_SAMPLE_SEED) -> Dict[str, Any]:
+    """Async variant of pushdown_null_values (same arguments and result), run over the connector's async API."""
+    plan = _null_values_plan(dataset_id, columns, filters=filters, sample_percent=sample_percent,
+                             sample_method=sample_method, sample_seed=sample_seed)
+    return await _arun_plan(connector_type, dataset_id, plan, needs_columns=True)
+
+
+def pushdown_descriptive_stats(dataset_id: str, connector_type: str, approximate: bool = False,
+                               columns: Optional[List[str]] = None,
+                               filters: Optional[Dict[str, Any]] = None, sample_percent: Optional[float] = None,
+                               sample_method: str = 'row', sample_seed: Optional[int] = DEFAULT_SAMPLE_SEED) -> Dict[str, Any]:
+    """
+    Compute describe(include='all')-style statistics inside the warehouse.
+
+    Numeric columns get count/mean/std/min/quartiles/max, all other columns (and columns
+    ending with "_id", as in the pandas check) get count/unique/top/freq.
+
+    Args:
+        dataset_id: Full table identifier
+        connector_type: Connector to use ('snowflake', 'postgres')
+        approximate: Estimate 'unique' with the warehouse's approximate distinct count, or with a
+                     HyperLogLog register scan where there is none (PostgreSQL)
+        columns: Only consider these columns (default: all)
+        filters: {column: value} row filters (see BaseConnector.build_select_query)
+        sample_percent: Aggregate over a sample of this percentage of the table
+        sample_method: 'row' or 'block' sampling
+        sample_seed: Seed of the sample (required when sampling)
+
+    Returns:
+        Same dictionary shape as check_dataset_descriptive_stats
+    """
+    plan = _descriptive_stats_plan(dataset_id, approximate, columns, filters=filters,
+                                   sample_percent=sample_percent, sample_method=sample_method,
+                                   sample_seed=sample_seed)
+    return _run_plan(connector_type, dataset_id, plan, needs_columns=True)
+
+
+async def apushdown_descriptive_stats(dataset_id: str, connector_type: str, approximate: bool = False,
+                                      columns: Optional[List[str]] = None,
+                                      filters: Optional[Dict[str, Any]] = None,
+                                      sample_percent: Optional[float] = None, sample_method: str = 'row',
+                                      sample_seed: Optional[int] = DEFAULT_SAMPLE_SEED) -> Dict[str, Any]:
+    """Async variant of pushdown_descriptive_stats (same arguments and result), run over the connector's async API."""
+    plan = _descriptive_stats_plan(dataset_id, approximate, columns, filters=filters,
+                                   sample_percent=sample_percent, sample_method=sample_method,
+                                   sample_seed=sample_seed)
+    return await _arun_plan(connector_type, dataset_id, plan, needs_columns=True)
@@ -0,0 +1,233 @@
+"""
+On-disk cache of data quality check results, keyed by table version.
+
+A cached result is reused only while the table's version token (Snowflake LAST_ALTERED and
+ROW_COUNT, Postgres pg_stat_user_tables counters) is unchanged, so repeated questions about
+an unchanged table are answered without scanning it again.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional
+import numpy as np
+import yaml
+from src.connectors.connector_factory import ConnectorFactory
+
+# Seconds a cached result stays valid even if the table version is unchanged
+DEFAULT_RESULT_TTL = 24 * 3600
+
+# Maximum number of cached results / total bytes on disk before the least recently used are evicted
+DEFAULT_MAX_ENTRIES = 1000
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+DEFAULT_CACHE_DIR = './.dq_cache'
+
+
+def _json_default(value: Any) -> Any:
+    """Convert numpy/pandas scalars in check results to JSON types."""
+    if isinstance(value, np.integer):
+        return int(value)
+    if isinstance(value, np.floating):
+        return float(value)
+    if isinstance(value, np.bool_):
+        return bool(value)
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return str(value)
+
+
+class CheckResultCache:
+    """
+    Disk-backed cache of check results, one JSON file per (connector, dataset, check, params).
+
+    Example:
+        cache = CheckResultCache()
+        version = get_table_version("public.orders", "postgres")
+        result = cache.get("postgres", "public.orders", "duplicates", {}, version)
+        if result is None:
+            result = check_dataset_duplicates("public.orders", connector_type="postgres")
+            cache.set("postgres", "public.orders", "duplicates", {}, version, result)
+    """
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR, ttl: Optional[float] = DEFAULT_RESULT_TTL,
+                 max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Args:
+            directory: Directory holding the cache files
+            ttl: Seconds an entry stays valid (None = until the table version changes)
+            max_entries: Maximum number of cached results
+            max_bytes: Maximum total size of the cache files
+        """
+        self.directory = directory
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(connector_type: str, dataset_id: str, check_name: str, params: Dict[str, Any]) -> str:
+        payload = json.dumps([connector_type, dataset_id.lower(), check_name, params], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, connector_type: str, dataset_id: str, check_name: str, params: Dict[str, Any],
+            version: Optional[str]) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached result.
+
+        Returns:
+            The cached result marked with 'cached': True and 'cached_at', or None on a miss,
+            an expired entry or a changed table version
+        """
+        if version is None:
+            return None
+
+        path = self._path(self._key(connector_type, dataset_id, check_name, params))
+        try:
+            with open(path, 'r') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        expired = self.ttl is not None and time.time() - entry.get('stored_at', 0) > self.ttl
+        if expired or entry.get('version') != version:
+            self._remove(path)
+            return None
+
+        # Touch the file so eviction is least-recently-used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        result = entry['result']
+        result['cached'] = True
+        result['cached_at'] = datetime.fromtimestamp(entry['stored_at']).isoformat()
+        return result
+
+    def set(self, connector_type: str, dataset_id: str, check_name: str, params: Dict[str, Any],
+            version: Optional[str], result: Dict[str, Any]) -> None:
+        """Store a result (results without a table version, or of a check that errored, are not cached)."""
+        if version is None or 'error' in result or result.get('status') not in ('success', 'failure'):
+            return
+
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(self._key(connector_type, dataset_id, check_name, params))
+        entry = {
+            'connector_type': connector_type,
+            'dataset_id': dataset_id,
+            'check': check_name,
+            'params': params,
+            'version': version,
+            'stored_at': time.time(),
+            'result': result
+        }
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(entry, f, default=_json_default)
+        os.replace(tmp_path, path)
+        self._evict()
+
+    def _remove(self, path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _evict(self) -> None:
+        """Remove expired entries, then least recently used ones until within max_entries and max_bytes."""
+        with self._lock:
+            try:
+                names = [name for name in os.listdir(self.directory) if name.endswith('.json')]
+            except OSError:
+                return
+
+            now = time.time()
+            files = []
+            for name in names:
+                path = os.path.join(self.directory, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                if self.ttl is not None and now - stat.st_mtime > self.ttl:
+                    self._remove(path)
+                else:
+                    files.append((stat.st_mtime, stat.st_size, path))
+
+            files.sort()
+            total_bytes = sum(size for _, size, _ in files)
+            while files and (len(files) > self.max_entries or total_bytes > self.max_bytes):
+                _, size, path = files.pop(0)
+                self._remove(path)
+                total_bytes -= size
+
+    def clear(self) -> None:
+        """Remove every cached result."""
+        with self._lock:
+            try:
+                names = os.listdir(self.directory)
+            except OSError:
+                return
+            for name in names:
+                if name.endswith('.json'):
+                    self._remove(os.path.join(self.directory, name))
+
+
+def get_table_version(dataset_id: str, connector_type: str) -> Optional[str]:
+    """
+    Ask the source for the table's current version token.
+
+    Returns:
+        Token string, or None if the connector can't provide one or the lookup failed
+    """
+    try:
+        with ConnectorFactory.connection(connector_type) as connector:
+            return connector.get_table_version(dataset_id)
+    except Exception as e:
+        print(f"Warning: Could not read table version of {dataset_id}: {e}")
+        return None
+
+
+_result_cache: Optional[CheckResultCache] = None
+_result_cache_lock = threading.Lock()
+
+
+def _load_cache_settings() -> Dict[str, Any]:
+    """Load result cache settings (result_cache section) from settings.yaml."""
+    settings_path = os.path.join(os.path.dirname(__file__), '../../config/settings.yaml')
+    if not os.path.exists(settings_path):
+        return {}
+
+    with open(settings_path, 'r') as f:
+        settings = yaml.safe_load(f) or {}
+    return dict(settings.get('result_cache') or {})
+
+
+def get_result_cache() -> Optional[CheckResultCache]:
+    """
+    Get the process-wide result cache configured in settings.yaml.
+
+    Returns:
+        CheckResultCache, or None if result_cache.enabled is false
+    """
+    global _result_cache
+    with _result_cache_lock:
+        if _result_cache is None:
+            settings = _load_cache_settings()
+            if not settings.get('enabled', True):
+                return None
+            _result_cache = CheckResultCache(
+                directory=settings.get('directory', DEFAULT_CACHE_DIR),
+                ttl=settings.get('ttl_seconds', DEFAULT_RESULT_TTL),
+                max_entries=settings.get('max_entries', DEFAULT_MAX_ENTRIES),
+                max_bytes=settings.get('max_bytes', DEFAULT_MAX_BYTES)
+            )
+        return _result_cache
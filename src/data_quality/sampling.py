@@ -0,0 +1,172 @@
+"""
+Whole-table estimates from checks run on a table sample (sample_percent).
+
+With row (Bernoulli) sampling every row is kept independently with probability q, so:
+- the table size is estimated as sample_rows / q,
+- a column's null fraction is a binomial proportion, reported with a Wilson score interval,
+- a duplicate pair survives only if both rows are kept (probability q^2), so duplicates seen in
+  the sample are scaled by 1 / q^2, with a Poisson score interval on the sample count.
+
+Block sampling reads whole pages / micro-partitions: it is faster, but rows stored together
+are kept or dropped together, so its intervals are too narrow and duplicates (often loaded
+side by side) can be badly overestimated.
+"""
+import math
+from typing import Any, Dict, Tuple
+
+# Normal quantile of the reported (two-sided 95%) confidence intervals
+CONFIDENCE_Z = 1.96
+CONFIDENCE_LEVEL = 0.95
+
+BLOCK_SAMPLE_NOTE = ("Block sample: rows stored together are sampled together, so intervals are "
+                     "optimistic and duplicate estimates may be biased; use sample_method='row' for valid intervals")
+
+
+def wilson_interval(successes: int, trials: int, z: float = CONFIDENCE_Z) -> Tuple[float, float]:
+    """
+    Wilson score interval for a binomial proportion.
+
+    Args:
+        successes: Observed successes (e.g. null values in the sample)
+        trials: Sample size
+        z: Normal quantile (1.96 for 95%)
+
+    Returns:
+        (low, high) bounds of the proportion, in [0, 1]
+    """
+    if trials <= 0:
+        return 0.0, 1.0
+    p = successes / trials
+    denominator = 1 + z * z / trials
+    centre = (p + z * z / (2 * trials)) / denominator
+    margin = z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / denominator
+    return max(0.0, centre - margin), min(1.0, centre + margin)
+
+
+def poisson_interval(count: int, z: float = CONFIDENCE_Z) -> Tuple[float, float]:
+    """Score interval for the mean of a Poisson count (upper bound z^2 when nothing was observed)."""
+    centre = count + z * z / 2
+    margin = z * math.sqrt(count + z * z / 4)
+    return max(0.0, centre - margin), centre + margin
+
+
+def _sample_fields(sample_rows: int, sample_percent: float, sample_method: str) -> Dict[str, Any]:
+    fields = {
+        "sampled": True,
+        "sample_percent": sample_percent,
+        "sample_method": sample_method,
+        "sample_rows": sample_rows,
+        "confidence_level": CONFIDENCE_LEVEL
+    }
+    if sample_method != 'row':
+        fields["sample_note"] = BLOCK_SAMPLE_NOTE
+    return fields
+
+
+def estimate_total_rows(sample_rows: int, sample_percent: float) -> int:
+    """Estimated table size behind a sample of sample_percent percent."""
+    return int(round(sample_rows * 100 / sample_percent))
+
+
+def extrapolate_null_values(result: Dict[str, Any], sample_percent: float, sample_method: str = 'row') -> Dict[str, Any]:
+    """
+    Scale a null_values result computed on a sample to the whole table.
+
+    total_rows and each null_count become whole-table estimates; null_percentage is unchanged
+    and gains 'null_percentage_ci'. The sample counts are kept as 'sample_rows' and
+    'sample_null_count'. 'clean_column_null_bound' is the upper bound on the null percentage
+    of columns that had no nulls in the sample.
+
+    Returns:
+        The result, updated in place (errors are returned unchanged)
+    """
+    if 'error' in result or 'total_rows' not in result:
+        return result
+
+    sample_rows = int(result['total_rows'])
+    total_rows = estimate_total_rows(sample_rows, sample_percent)
+    for col_info in result.get('null_analysis', []):
+        sample_nulls = int(col_info['null_count'])
+        low, high = wilson_interval(sample_nulls, sample_rows)
+        col_info['sample_null_count'] = sample_nulls
+        col_info['null_count'] = int(round(sample_nulls / sample_rows * total_rows)) if sample_rows else 0
+        col_info['null_percentage_ci'] = [round(low * 100, 2), round(high * 100, 2)]
+
+    result.update(_sample_fields(sample_rows, sample_percent, sample_method))
+    result['total_rows'] = total_rows
+    result['clean_column_null_bound'] = round(wilson_interval(0, sample_rows)[1] * 100, 4)
+    return result
+
+
+def extrapolate_duplicates(result: Dict[str, Any], sample_percent: float, sample_method: str = 'row') -> Dict[str, Any]:
+    """
+    Scale a duplicates result computed on a sample to the whole table.
+
+    Duplicate rows seen in a small sample are almost always pairs whose both rows were kept, so
+    duplicate_qty is estimated as sample_duplicates / q^2 (exact in expectation when duplicates
+    come in pairs; larger groups are overestimated). 'duplicate_qty_bounds' and
+    'duplicate_percentage_ci' give the 95% interval. Note that a 1% sample only sees a
+    duplicate pair with probability 1 in 10,000, so a clean sample bounds the duplicate rate
+    rather than proving there are none.
+
+    Approximate (HyperLogLog) results already carry 'duplicate_qty_bounds' for the sample. Those
+    are kept as 'sample_duplicate_qty_bounds' and widened by the sampling interval (the Poisson
+    interval below the low bound to the one above the high bound) before scaling, and the
+    status is recomputed from the widened interval.
+
+    Returns:
+        The result, updated in place (errors are returned unchanged)
+    """
+    if 'error' in result or 'total_rows' not in result:
+        return result
+
+    fraction = sample_percent / 100
+    sample_rows = int(result['total_rows'])
+    sample_duplicates = int(result['duplicate_qty'])
+    total_rows = estimate_total_rows(sample_rows, sample_percent)
+
+    def scale(count: float) -> int:
+        return min(total_rows, int(round(count / (fraction * fraction))))
+
+    sample_bounds = result.get('duplicate_qty_bounds')
+    if sample_bounds:
+        # Sketch error on the sample count, plus sampling error around either end of it
+        low = poisson_interval(int(sample_bounds[0]))[0]
+        high = poisson_interval(int(sample_bounds[1]))[1]
+        result['sample_duplicate_qty_bounds'] = list(sample_bounds)
+        result['status'] = "success" if scale(low) == 0 else "failure"
+    else:
+        low, high = poisson_interval(sample_duplicates)
+    duplicate_qty = scale(sample_duplicates)
+    bounds = [scale(low), scale(high)]
+
+    result.update(_sample_fields(sample_rows, sample_percent, sample_method))
+    result['total_rows'] = total_rows
+    result['sample_duplicate_qty'] = sample_duplicates
+    result['duplicate_qty'] = duplicate_qty
+    result['duplicate_qty_bounds'] = bounds
+    result['duplicate_percentage'] = round(duplicate_qty / total_rows * 100, 2) if total_rows else 0.0
+    result['duplicate_percentage_ci'] = [round(bound / total_rows * 100, 2) if total_rows else 0.0 for bound in bounds]
+    return result
+
+
+def extrapolate_descriptive_stats(result: Dict[str, Any], sample_percent: float,
+                                  sample_method: str = 'row') -> Dict[str, Any]:
+    """
+    Mark a descriptive_stats result as computed on a sample.
+
+    Means, percentiles and frequencies of a random sample estimate the table's directly, so
+    the statistics are left as measured; 'sample_rows' (the largest column count) and
+    'estimated_total_rows' are added.
+
+    Returns:
+        The result, updated in place (errors are returned unchanged)
+    """
+    if 'error' in result or 'descriptive_stats' not in result:
+        return result
+
+    counts = [stats.get('count') for stats in result['descriptive_stats'].values() if isinstance(stats, dict)]
+    sample_rows = int(max((count for count in counts if count is not None), default=0))
+    result.update(_sample_fields(sample_rows, sample_percent, sample_method))
+    result['estimated_total_rows'] = estimate_total_rows(sample_rows, sample_percent)
+    return result
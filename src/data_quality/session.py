@@ -0,0 +1,297 @@
+"""
+Dataset session for running several data quality checks against a single load of a table.
+"""
+import asyncio
+import pandas as pd
+from typing import Any, Callable, Dict, List, Optional
+from .checks import DQ_CHECKS, load_data_by_id, smart_connector_detection
+from .async_checks import ASYNC_DQ_CHECKS, aload_data_by_id
+from .result_cache import get_result_cache, get_table_version
+
+# load_kwargs that the check functions also accept: the pushdown and streaming engines apply them
+# to their own queries, and on a sampled load the checks extrapolate to the whole table
+CHECK_SOURCE_KWARGS = ('columns', 'filters', 'sample_percent', 'sample_method', 'sample_seed')
+
+# Duplicate groups collected as 'duplicate_examples' by sessions that feed a report
+REPORT_SAMPLE_DUPLICATES = 3
+
+
+class DatasetSession:
+    """
+    Loads a dataset once and runs any number of DQ checks against the same in-memory DataFrame.
+
+    Without a session every check calls load_data_by_id() on its own, so an assessment with
+    N checks opens N connections and scans the table N times. A session pays that cost once.
+
+    Example:
+        session = DatasetSession("stage_sales.public.customers", connector_type="postgres")
+        results = session.run_checks(['duplicates', 'null_values', 'descriptive_stats'])
+
+        # From a coroutine: the table is loaded through the connector's async API
+        async with DatasetSession("stage_sales.public.customers", connector_type="postgres") as session:
+            results = await session.arun_checks()
+    """
+
+    def __init__(self, dataset_id: str, connector_type: Optional[str] = None, engine: str = 'pandas',
+                 use_cache: bool = False, sample_duplicates: int = 0, **load_kwargs):
+        """
+        Initialize the session. Data is loaded lazily on first use.
+
+        Args:
+            dataset_id: Full table identifier (e.g. 'DATABASE.SCHEMA.TABLE' or 'schema.table')
+            connector_type: Connector to use ('snowflake', 'postgres'). Auto-detected if None
+            engine: 'pandas' to share one in-memory load, or 'pushdown' to run every check as
+                    warehouse SQL (nothing is loaded into memory)
+            use_cache: Reuse results cached on disk while the table version is unchanged, and
+                       cache new results (see result_cache.py)
+            sample_duplicates: Number of duplicate groups the duplicates check returns as
+                               'duplicate_examples' for reports (0 = none)
+            **load_kwargs: Additional parameters passed to the connector's load_data method, e.g.
+                           columns=['id', 'email'], filters={'region': 'EU'} or
+                           filters={'created_at': {'>=': '2024-01-01'}} to assess only part of the table, or
+                           sample_percent=1 to estimate from a 1% random sample
+        """
+        self.dataset_id = dataset_id
+        self.connector_type = connector_type or smart_connector_detection(dataset_id)
+        self.engine = engine
+        self.load_kwargs = load_kwargs
+        self.sample_duplicates = sample_duplicates
+        self.result_cache = get_result_cache() if use_cache else None
+        self._df: Optional[pd.DataFrame] = None
+        self._load_error: Optional[Exception] = None
+        self._table_version: Optional[str] = None
+        self._table_version_read = False
+
+    @property
+    def dataframe(self) -> pd.DataFrame:
+        """
+        The dataset contents, loaded from the source on first access.
+
+        Raises:
+            The loading error; a failed load is not retried within the session
+        """
+        if self._load_error is not None:
+            raise self._load_error
+        if self._df is None:
+            try:
+                self._df = load_data_by_id(self.dataset_id, connector_type=self.connector_type, raise_errors=True,
+                                           **self.load_kwargs)
+            except Exception as e:
+                self._load_error = e
+                raise
+        return self._df
+
+    @property
+    def table_version(self) -> Optional[str]:
+        """The table's version token, read from the source once per session."""
+        if not self._table_version_read:
+            self._table_version = get_table_version(self.dataset_id, self.connector_type)
+            self._table_version_read = True
+        return self._table_version
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the dataset has already been loaded."""
+        return self._df is not None
+
+    def run_check(self, check_name: str) -> Dict[str, Any]:
+        """
+        Run a single check against the session's DataFrame.
+
+        With use_cache=True a cached result for the current table version is returned
+        (marked 'cached': True) without loading the data.
+
+        Args:
+            check_name: One of 'duplicates', 'null_values', 'descriptive_stats'
+
+        Returns:
+            The check's result dictionary
+        """
+        if check_name not in DQ_CHECKS:
+            raise ValueError(f"Unknown check: {check_name}. Available checks: {list(DQ_CHECKS.keys())}")
+
+        if self.result_cache is None:
+            return self._execute_check(check_name)
+
+        params = self._cache_params(check_name)
+        cached = self.result_cache.get(self.connector_type, self.dataset_id, check_name, params, self.table_version)
+        if cached is not None:
+            return cached
+
+        result = self._execute_check(check_name)
+        if not self._loaded_empty_frame():
+            self.result_cache.set(self.connector_type, self.dataset_id, check_name, params, self.table_version, result)
+        return result
+
+    def _cache_params(self, check_name: str) -> Dict[str, Any]:
+        params = {'engine': self.engine, **self.load_kwargs}
+        if check_name == 'duplicates' and self.sample_duplicates:
+            params['sample_duplicates'] = self.sample_duplicates
+        return params
+
+    def _check_kwargs(self, check_name: str) -> Dict[str, Any]:
+        """Keyword arguments passed to the check function besides dataset, connector and data."""
+        check_kwargs = {key: value for key, value in self.load_kwargs.items() if key in CHECK_SOURCE_KWARGS}
+        if check_name == 'duplicates' and self.sample_duplicates:
+            check_kwargs['sample_duplicates'] = self.sample_duplicates
+        return check_kwargs
+
+    def _execute_check(self, check_name: str) -> Dict[str, Any]:
+        check_function = DQ_CHECKS[check_name]
+        source_kwargs = self._check_kwargs(check_name)
+        if self.engine != 'pandas':
+            return check_function(self.dataset_id, connector_type=self.connector_type, engine=self.engine,
+                                  **source_kwargs)
+        try:
+            df = self.dataframe
+        except Exception as e:
+            return self._load_failure(e)
+        return check_function(self.dataset_id, connector_type=self.connector_type, df=df, **source_kwargs)
+
+    def _load_failure(self, error: Exception) -> Dict[str, Any]:
+        """Result reported by every check of a session whose dataset could not be loaded."""
+        return {
+            "dataset_id": self.dataset_id,
+            "error": f"Failed to load data: {error}",
+            "status": "failure"
+        }
+
+    def _loaded_empty_frame(self) -> bool:
+        """Whether the load returned a frame without columns, whose results must never be cached."""
+        return self._df is not None and len(self._df.columns) == 0
+
+    def run_checks(self, checks: Optional[List[str]] = None,
+                   on_check: Optional[Callable[[str, Dict[str, Any]], None]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Run several checks against the session's DataFrame. Unknown check names are skipped.
+
+        Args:
+            checks: Check names to run (default: all available checks)
+            on_check: Called with (check_name, result) as each check completes (e.g. to report progress)
+
+        Returns:
+            Dict mapping check name to its result dictionary
+        """
+        if checks is None:
+            checks = list(DQ_CHECKS.keys())
+
+        check_results = {}
+        for check_name in checks:
+            if check_name in DQ_CHECKS:
+                print(f"Running {check_name} check...")
+                check_results[check_name] = self.run_check(check_name)
+                if on_check is not None:
+                    on_check(check_name, check_results[check_name])
+            else:
+                print(f"Warning: Unknown check '{check_name}' skipped")
+
+        return check_results
+
+    async def aload(self) -> pd.DataFrame:
+        """
+        Async variant of the dataframe property: load the dataset through the connector's async API.
+
+        Raises:
+            The loading error; a failed load is not retried within the session
+        """
+        if self._load_error is not None:
+            raise self._load_error
+        if self._df is None:
+            try:
+                self._df = await aload_data_by_id(self.dataset_id, connector_type=self.connector_type,
+                                                  raise_errors=True, **self.load_kwargs)
+            except Exception as e:
+                self._load_error = e
+                raise
+        return self._df
+
+    async def arun_check(self, check_name: str) -> Dict[str, Any]:
+        """
+        Async variant of run_check().
+
+        Checks run through ASYNC_DQ_CHECKS: the table is loaded with aload() and the pushdown
+        and streaming engines query the connector's async API; version lookups and the pandas
+        computation run on worker threads so the event loop stays free.
+
+        Args:
+            check_name: One of 'duplicates', 'null_values', 'descriptive_stats'
+
+        Returns:
+            The check's result dictionary
+        """
+        if check_name not in DQ_CHECKS:
+            raise ValueError(f"Unknown check: {check_name}. Available checks: {list(DQ_CHECKS.keys())}")
+
+        if self.result_cache is None:
+            return await self._aexecute_check(check_name)
+
+        params = self._cache_params(check_name)
+        version = await asyncio.to_thread(lambda: self.table_version)
+        cached = self.result_cache.get(self.connector_type, self.dataset_id, check_name, params, version)
+        if cached is not None:
+            return cached
+
+        result = await self._aexecute_check(check_name)
+        if not self._loaded_empty_frame():
+            self.result_cache.set(self.connector_type, self.dataset_id, check_name, params, version, result)
+        return result
+
+    async def _aexecute_check(self, check_name: str) -> Dict[str, Any]:
+        check_function = ASYNC_DQ_CHECKS[check_name]
+        source_kwargs = self._check_kwargs(check_name)
+        if self.engine != 'pandas':
+            return await check_function(self.dataset_id, connector_type=self.connector_type, engine=self.engine,
+                                        **source_kwargs)
+        try:
+            df = await self.aload()
+        except Exception as e:
+            return self._load_failure(e)
+        return await check_function(self.dataset_id, connector_type=self.connector_type, df=df, **source_kwargs)
+
+    async def arun_checks(self, checks: Optional[List[str]] = None,
+                          on_check: Optional[Callable[[str, Dict[str, Any]], None]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Async variant of run_checks(). Unknown check names are skipped.
+
+        Args:
+            checks: Check names to run (default: all available checks)
+            on_check: Called on the event loop with (check_name, result) as each check completes
+
+        Returns:
+            Dict mapping check name to its result dictionary
+        """
+        if checks is None:
+            checks = list(DQ_CHECKS.keys())
+
+        check_results = {}
+        for check_name in checks:
+            if check_name in DQ_CHECKS:
+                print(f"Running {check_name} check...")
+                check_results[check_name] = await self.arun_check(check_name)
+                if on_check is not None:
+                    on_check(check_name, check_results[check_name])
+            else:
+                print(f"Warning: Unknown check '{check_name}' skipped")
+
+        return check_results
+
+    def release(self) -> None:
+        """Drop the cached DataFrame (and any load error) so its memory can be reclaimed."""
+        self._df = None
+        self._load_error = None
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - releases the loaded data."""
+        self.release()
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit - releases the loaded data."""
+        self.release()
@@ -0,0 +1,123 @@
+"""
+Probabilistic sketches for approximate data quality checks.
+"""
+import numpy as np
+import pandas as pd
+from typing import Tuple
+
+# 2^14 registers: ~0.81% relative standard error in 16 KB per sketch
+DEFAULT_HLL_PRECISION = 14
+
+
+def _bit_length(values: np.ndarray) -> np.ndarray:
+    """Vectorised int.bit_length() for uint64 arrays (exact, via two 32-bit halves)."""
+    values = values.astype('uint64')
+    high = (values >> np.uint64(32)).astype('float64')
+    low = (values & np.uint64(0xFFFFFFFF)).astype('float64')
+    with np.errstate(divide='ignore'):
+        high_bits = np.where(high > 0, np.floor(np.log2(np.maximum(high, 1))) + 1 + 32, 0)
+        low_bits = np.where(low > 0, np.floor(np.log2(np.maximum(low, 1))) + 1, 0)
+    return np.where(high > 0, high_bits, low_bits).astype('int64')
+
+
+class HyperLogLog:
+    """
+    HyperLogLog cardinality sketch over 64-bit hashes.
+
+    Sketches are mergeable, so distinct counts can be estimated chunk by chunk or per
+    partition and combined at the end.
+    """
+
+    def __init__(self, precision: int = DEFAULT_HLL_PRECISION):
+        if not 4 <= precision <= 18:
+            raise ValueError(f"precision must be between 4 and 18, got {precision}")
+        self.precision = precision
+        self.num_registers = 1 << precision
+        self.registers = np.zeros(self.num_registers, dtype='uint8')
+
+    @property
+    def relative_error(self) -> float:
+        """Relative standard error of the estimate (1.04 / sqrt(m))."""
+        return float(1.04 / np.sqrt(self.num_registers))
+
+    def update_hashes(self, hashes: np.ndarray) -> None:
+        """Add a batch of 64-bit hashes."""
+        hashes = np.asarray(hashes, dtype='uint64')
+        if len(hashes) == 0:
+            return
+
+        remaining_bits = 64 - self.precision
+        index = (hashes >> np.uint64(remaining_bits)).astype('int64')
+        remainder = hashes & np.uint64((1 << remaining_bits) - 1)
+        # Position of the leftmost 1-bit in the remaining bits (remaining_bits + 1 if all zero)
+        rank = (remaining_bits - _bit_length(remainder) + 1).astype('uint8')
+        np.maximum.at(self.registers, index, rank)
+
+    def update(self, values: pd.Series) -> None:
+        """Add a batch of values (nulls are ignored)."""
+        values = values.dropna()
+        if not values.empty:
+            self.update_hashes(pd.util.hash_pandas_object(values, index=False).to_numpy(dtype='uint64'))
+
+    def merge(self, other: 'HyperLogLog') -> 'HyperLogLog':
+        """Merge another sketch with the same precision into this one."""
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches with different precision")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def estimate(self) -> float:
+        """Estimated number of distinct values."""
+        m = self.num_registers
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.power(2.0, -self.registers.astype('float64')))
+
+        # Small-range correction (linear counting)
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and zeros > 0:
+            return float(m * np.log(m / zeros))
+        return float(raw)
+
+    def bounds(self, z: float = 2.0) -> Tuple[float, float]:
+        """Estimate +/- z standard errors (z=2 is ~95% confidence)."""
+        estimate = self.estimate()
+        margin = z * self.relative_error * estimate
+        return max(0.0, estimate - margin), estimate + margin
+
+
+def approximate_duplicates_result(dataset_id: str, total_rows: int, distinct_estimate: float,
+                                  relative_error: float, method: str) -> dict:
+    """
+    Build a duplicate check result from an approximate distinct row count.
+
+    Args:
+        dataset_id: Dataset identifier
+        total_rows: Exact row count
+        distinct_estimate: Estimated number of distinct rows
+        relative_error: Relative standard error of distinct_estimate
+        method: Estimation method reported in the result
+
+    Returns:
+        Same dictionary shape as check_dataset_duplicates plus error bound fields. The status is
+        'failure' only when the interval excludes zero: on a duplicate-free table the estimate
+        itself is often a few rows above zero by sketch error alone.
+    """
+    distinct_estimate = min(float(distinct_estimate), float(total_rows))
+    margin = 2 * relative_error * distinct_estimate
+    duplicate_numb = max(0, int(round(total_rows - distinct_estimate)))
+    # ~95% interval for the number of duplicate rows
+    bounds = [
+        max(0, int(round(total_rows - distinct_estimate - margin))),
+        max(0, int(round(total_rows - distinct_estimate + margin)))
+    ]
+
+    return {
+        "dataset_id": dataset_id,
+        "total_rows": total_rows,
+        "duplicate_qty": duplicate_numb,
+        "status": "success" if bounds[0] == 0 else "failure",
+        "approximate": True,
+        "method": method,
+        "relative_error": round(float(relative_error), 5),
+        "duplicate_qty_bounds": bounds
+    }
@@ -8,16 +8,20 @@ This module provides comprehensive data quality reporting capabilities including
 - Summary statistics generation
 - Remediation recommendations
 - Multiple output formats (Markdown, HTML, JSON)
+- Concurrent assessment of several tables
 """
 
 from .report_generator import DataQualityReportGenerator
 from .report_templates import ReportTemplates
 from .remediation_advisor import RemediationAdvisor
 from .report_processor import SmartDQReportProcessor
+from .orchestrator import AssessmentOrchestrator, assess_tables
 
 __all__ = [
     'DataQualityReportGenerator',
     'ReportTemplates',
     'RemediationAdvisor',
-    'SmartDQReportProcessor'
+    'SmartDQReportProcessor',
+    'AssessmentOrchestrator',
+    'assess_tables'
 ]
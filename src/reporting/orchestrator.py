@@ -0,0 +1,164 @@
+# src/reporting/orchestrator.py
+"""
+Concurrent assessment of several tables.
+
+Each table's checks still share one load of the table (DatasetSession); different tables run
+in parallel on a bounded thread pool, with a separate concurrency cap per connector so one
+warehouse isn't flooded with more sessions than its connection pool allows. Results are
+yielded as soon as each table finishes, so a batch takes roughly as long as its slowest table.
+"""
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+from src.connectors.connection_pool import DEFAULT_POOL_MAX_SIZE
+from src.connectors.connector_factory import ConnectorFactory
+from src.data_quality.session import DatasetSession, REPORT_SAMPLE_DUPLICATES
+from .report_generator import DataQualityReportGenerator
+
+# Tables assessed at the same time across all connectors
+DEFAULT_MAX_WORKERS = 8
+
+# (dataset_id, connector_type, checks); checks may be a list, a comma-separated string or None (all)
+AssessmentTask = Tuple[str, str, Optional[Union[str, Sequence[str]]]]
+
+
+def _parse_checks(checks: Optional[Union[str, Sequence[str]]]) -> Optional[List[str]]:
+    if checks is None:
+        return None
+    if isinstance(checks, str):
+        return [check.strip() for check in checks.split(',') if check.strip()]
+    return list(checks)
+
+
+class AssessmentOrchestrator:
+    """
+    Runs assessments of many tables concurrently with per-connector limits.
+
+    Example:
+        orchestrator = AssessmentOrchestrator(max_workers=8, connector_limits={'postgres': 4})
+        tasks = [("public.orders", "postgres", None), ("PROD.PUBLIC.INVOICES", "snowflake", "duplicates")]
+        for outcome in orchestrator.run(tasks):
+            print(outcome['dataset_id'], outcome['status'], outcome['seconds'])
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS,
+                 connector_limits: Optional[Dict[str, int]] = None, use_cache: bool = True):
+        """
+        Args:
+            max_workers: Maximum number of tables assessed at once
+            connector_limits: Maximum concurrent tables per connector type (default: the
+                              connector's connection pool max_size)
+            use_cache: Serve unchanged tables from the check result cache
+        """
+        self.max_workers = max(1, max_workers)
+        self.connector_limits = dict(connector_limits or {})
+        self.use_cache = use_cache
+
+    def _limit(self, connector_type: str) -> int:
+        if connector_type not in self.connector_limits:
+            pool_settings = ConnectorFactory._load_pool_settings(connector_type)
+            self.connector_limits[connector_type] = pool_settings.get('max_size', DEFAULT_POOL_MAX_SIZE)
+        return max(1, self.connector_limits[connector_type])
+
+    def assess(self, dataset_id: str, connector_type: str,
+               checks: Optional[Union[str, Sequence[str]]] = None) -> Dict[str, Any]:
+        """
+        Assess one table.
+
+        Returns:
+            Dict with dataset_id, connector_type, status ('success' or 'error'), seconds, and
+            assessment_results (or error)
+        """
+        started = time.perf_counter()
+        try:
+            with DatasetSession(dataset_id, connector_type=connector_type, use_cache=self.use_cache,
+                                sample_duplicates=REPORT_SAMPLE_DUPLICATES) as session:
+                check_results = session.run_checks(_parse_checks(checks))
+            assessment_results = DataQualityReportGenerator().create_assessment_from_results(
+                check_results, dataset_id, connector_type
+            )
+            return {
+                'dataset_id': dataset_id,
+                'connector_type': connector_type,
+                'status': 'success',
+                'assessment_results': assessment_results,
+                'seconds': round(time.perf_counter() - started, 3)
+            }
+        except Exception as e:
+            return {
+                'dataset_id': dataset_id,
+                'connector_type': connector_type,
+                'status': 'error',
+                'error': str(e),
+                'seconds': round(time.perf_counter() - started, 3)
+            }
+
+    def run(self, tasks: Iterable[AssessmentTask]) -> Iterator[Dict[str, Any]]:
+        """
+        Assess every task, yielding each outcome as soon as it completes.
+
+        Tasks of a connector that is at its limit wait in a per-connector queue, so they
+        don't occupy worker threads that other connectors could use.
+
+        Args:
+            tasks: (dataset_id, connector_type, checks) tuples
+
+        Yields:
+            Outcome dicts as returned by assess(), in completion order (plus 'index', the
+            task's position in the input)
+        """
+        queues: Dict[str, Deque[Tuple[int, AssessmentTask]]] = {}
+        for index, task in enumerate(tasks):
+            queues.setdefault(task[1], deque()).append((index, task))
+
+        running: Dict[Future, Tuple[int, str]] = {}
+        in_flight: Dict[str, int] = {connector_type: 0 for connector_type in queues}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='dq-assess') as executor:
+            def schedule() -> None:
+                # Round-robin over connectors so no single connector starves the others
+                progressed = True
+                while progressed and len(running) < self.max_workers:
+                    progressed = False
+                    for connector_type, queue in queues.items():
+                        if len(running) >= self.max_workers:
+                            break
+                        if queue and in_flight[connector_type] < self._limit(connector_type):
+                            index, (dataset_id, _, checks) = queue.popleft()
+                            future = executor.submit(self.assess, dataset_id, connector_type, checks)
+                            running[future] = (index, connector_type)
+                            in_flight[connector_type] += 1
+                            progressed = True
+
+            schedule()
+            while running:
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, connector_type = running.pop(future)
+                    in_flight[connector_type] -= 1
+                    yield {**future.result(), 'index': index}
+                schedule()
+
+    def run_all(self, tasks: Iterable[AssessmentTask]) -> List[Dict[str, Any]]:
+        """Assess every task and return the outcomes in input order."""
+        outcomes = sorted(self.run(tasks), key=lambda outcome: outcome['index'])
+        return outcomes
+
+
+def assess_tables(tasks: Iterable[AssessmentTask], max_workers: int = DEFAULT_MAX_WORKERS,
+                  connector_limits: Optional[Dict[str, int]] = None, use_cache: bool = True) -> Iterator[Dict[str, Any]]:
+    """
+    Assess several tables concurrently, yielding results as they complete.
+
+    Args:
+        tasks: (dataset_id, connector_type, checks) tuples; checks may be None for all checks
+        max_workers: Maximum number of tables assessed at once
+        connector_limits: Maximum concurrent tables per connector type
+        use_cache: Serve unchanged tables from the check result cache
+
+    Yields:
+        Outcome dicts with dataset_id, connector_type, status, seconds, index and
+        assessment_results (or error)
+    """
+    return AssessmentOrchestrator(max_workers, connector_limits, use_cache).run(tasks)
@@ -7,6 +7,7 @@ import os
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 from src.data_quality.checks import check_dataset_duplicates, check_dataset_null_values, check_dataset_descriptive_stats
+from src.data_quality.session import DatasetSession, REPORT_SAMPLE_DUPLICATES
 from .report_templates import ReportTemplates
 from .remediation_advisor import RemediationAdvisor
 
@@ -31,7 +32,8 @@ class DataQualityReportGenerator:
         Execute a comprehensive data quality assessment by running all DQ checks directly.
 
         This method ensures data consistency by executing DQ checks once and using those
-        results as the single source of truth for all report sections.
+        results as the single source of truth for all report sections. The dataset is
+        loaded once and shared by all checks.
 
         Args:
             dataset_id: The dataset identifier (table name)
@@ -44,14 +46,14 @@ class DataQualityReportGenerator:
         if checks is None:
             checks = list(self.available_checks.keys())
 
-        # Execute DQ checks directly
+        # Execute DQ checks directly against a single load of the dataset
         check_results = {}
-        for check_name in checks:
-            if check_name in self.available_checks:
-                print(f"   Executing {check_name} check...")
-                check_results[check_name] = self.available_checks[check_name](
-                    dataset_id, connector_type=connector_type
-                )
+        with DatasetSession(dataset_id, connector_type=connector_type,
+                            sample_duplicates=REPORT_SAMPLE_DUPLICATES) as session:
+            for check_name in checks:
+                if check_name in self.available_checks:
+                    print(f"   Executing {check_name} check...")
+                    check_results[check_name] = session.run_check(check_name)
 
         # Create assessment from these reliable results
         return self.create_assessment_from_results(check_results, dataset_id, connector_type)
@@ -78,7 +80,9 @@ class DataQualityReportGenerator:
                 'connector_type': connector_type,
                 'timestamp': datetime.now().isoformat(),
                 'checks_requested': list(check_results.keys()),
-                'total_checks': len(check_results)
+                'total_checks': len(check_results),
+                'cached_checks': [name for name, result in check_results.items() if result.get('cached')],
+                'sampled_checks': [name for name, result in check_results.items() if result.get('sampled')]
             },
             'check_results': check_results,
             'summary': {
@@ -91,7 +95,7 @@ class DataQualityReportGenerator:
         # Analyze pre-computed results to build summary
         for check_name, result in check_results.items():
             if result['status'] == 'success':
-                if check_name == 'duplicates' and result.get('duplicate_qty', 0) == 0:
+                if check_name == 'duplicates':
                     assessment_results['summary']['passed_checks'] += 1
                 elif check_name == 'null_values' and result.get('columns_with_nulls', 0) == 0:
                     assessment_results['summary']['passed_checks'] += 1
@@ -5,8 +5,9 @@ Main processor for handling Smart DQ Check results and generating comprehensive
 import os
 import re
 from datetime import datetime
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 from .report_generator import DataQualityReportGenerator
+from .orchestrator import AssessmentOrchestrator, AssessmentTask, DEFAULT_MAX_WORKERS
 
 
 class SmartDQReportProcessor:
@@ -288,20 +289,19 @@ class SmartDQReportProcessor:
         Returns:
             Dictionary containing all check results
         """
-        from src.data_quality.checks import (
-            check_dataset_duplicates,
-            check_dataset_null_values,
-            check_dataset_descriptive_stats
-        )
+        from src.data_quality.session import DatasetSession, REPORT_SAMPLE_DUPLICATES
 
-        print("   Running duplicate check...")
-        duplicate_results = check_dataset_duplicates(dataset_id, connector_type=connector_type)
+        # Load the dataset once and share it across all checks
+        with DatasetSession(dataset_id, connector_type=connector_type,
+                            sample_duplicates=REPORT_SAMPLE_DUPLICATES) as session:
+            print("   Running duplicate check...")
+            duplicate_results = session.run_check('duplicates')
 
-        print("   Running null values check...")
-        null_results = check_dataset_null_values(dataset_id, connector_type=connector_type)
+            print("   Running null values check...")
+            null_results = session.run_check('null_values')
 
-        print("   Running descriptive statistics...")
-        stats_results = check_dataset_descriptive_stats(dataset_id, connector_type=connector_type)
+            print("   Running descriptive statistics...")
+            stats_results = session.run_check('descriptive_stats')
 
         return {
             'duplicates': duplicate_results,
@@ -424,3 +424,53 @@ class SmartDQReportProcessor:
             'assessment_results': assessment_results,
             'files_generated': generated_files
         }
+
+    def process_multiple_tables(self, tasks: Iterable[AssessmentTask], max_workers: int = DEFAULT_MAX_WORKERS,
+                                connector_limits: Optional[Dict[str, int]] = None) -> List[Dict[str, Any]]:
+        """
+        Assess several tables concurrently and write each table's reports as soon as it finishes.
+
+        Args:
+            tasks: (dataset_id, connector_type, checks) tuples; checks may be None for all checks
+            max_workers: Maximum number of tables assessed at once
+            connector_limits: Maximum concurrent tables per connector type
+
+        Returns:
+            One processing result per task, in input order
+        """
+        orchestrator = AssessmentOrchestrator(max_workers=max_workers, connector_limits=connector_limits)
+        results = []
+
+        for outcome in orchestrator.run(tasks):
+            dataset_id = outcome['dataset_id']
+            if outcome['status'] != 'success':
+                print(f"Assessment of {dataset_id} failed after {outcome['seconds']}s: {outcome['error']}")
+                results.append({
+                    'index': outcome['index'],
+                    'status': 'failed',
+                    'reason': 'assessment_error',
+                    'dataset_id': dataset_id,
+                    'connector_type': outcome['connector_type'],
+                    'error': outcome['error'],
+                    'files_generated': {}
+                })
+                continue
+
+            print(f"Assessment of {dataset_id} completed in {outcome['seconds']}s - generating reports...")
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            base_filename = f"comprehensive_dq_report_{self.generate_filename_suffix(dataset_id)}_{timestamp}"
+            generated_files = self.generate_all_reports(outcome['assessment_results'], base_filename)
+
+            results.append({
+                'index': outcome['index'],
+                'status': 'success',
+                'dataset_id': dataset_id,
+                'connector_type': outcome['connector_type'],
+                'assessment_results': outcome['assessment_results'],
+                'files_generated': generated_files
+            })
+
+        results.sort(key=lambda result: result['index'])
+        for result in results:
+            del result['index']
+        return results
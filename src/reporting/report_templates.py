@@ -2,8 +2,50 @@
 """
 Templates for generating different report formats (Markdown, HTML).
 """
+import html as html_lib
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
+
+
+def _sample_note(result: Dict[str, Any]) -> str:
+    """Title suffix for checks estimated from a table sample."""
+    if not result.get('sampled'):
+        return ""
+    return (f" (estimated from a {result['sample_percent']:g}% {result['sample_method']} sample"
+            f" of {result['sample_rows']:,} rows)")
+
+
+def _interval_note(interval: Optional[List[float]]) -> str:
+    """'; 95% CI low–high%' for sampled percentages (empty if there is no interval)."""
+    if not interval:
+        return ""
+    return f"; 95% CI {interval[0]:.2f}–{interval[1]:.2f}%"
+
+
+def _duplicates_found(check_name: str, result: Dict[str, Any]) -> bool:
+    """Whether a failed result is a duplicates check that found duplicates (rather than one that errored)."""
+    return check_name == 'duplicates' and result['status'] == 'failure' and 'error' not in result
+
+
+def _duplicate_impact(result: Dict[str, Any]) -> str:
+    """Impact line for a duplicates result with duplicate_qty > 0, worded as an estimate when it has bounds."""
+    duplicate_qty = result.get('duplicate_qty', 0)
+    bounds = result.get('duplicate_qty_bounds')
+    if not bounds:
+        return f"Data redundancy detected - {duplicate_qty:,} rows are duplicated"
+    impact = f"An estimated {duplicate_qty:,} rows are duplicated (95% interval {bounds[0]:,}–{bounds[1]:,})"
+    if result['status'] == 'success':
+        impact += " - the interval includes zero, so duplicates are not confirmed"
+    return impact
+
+
+def _duplicate_example_text(example: Dict[str, Any], max_length: int = 120) -> str:
+    """'appears N times: col=value, ...' for one of a result's duplicate_examples."""
+    values = ", ".join(f"{column}={value}" for column, value in (example.get('row') or {}).items())
+    if len(values) > max_length:
+        values = values[:max_length - 1] + "…"
+    text = f"appears {example.get('count', 1)} times"
+    return f"{text}: {values}" if values else text
 
 
 class ReportTemplates:
@@ -41,25 +83,26 @@ class ReportTemplates:
         # Individual check results
         for check_name, result in check_results.items():
             status_emoji = "✅" if result['status'] == 'success' else "❌"
-            markdown += f"### {status_emoji} {check_name.replace('_', ' ').title()}\n\n"
+            cached_note = f" (cached {result['cached_at'][:19].replace('T', ' ')})" if result.get('cached') else ""
+            markdown += f"### {status_emoji} {check_name.replace('_', ' ').title()}{cached_note}{_sample_note(result)}\n\n"
 
-            if result['status'] == 'success':
+            if result['status'] == 'success' or _duplicates_found(check_name, result):
                 if check_name == 'duplicates':
                     duplicate_qty = result.get('duplicate_qty', 0)
                     total_rows = result.get('total_rows', 0)
                     duplicate_percentage = (duplicate_qty / total_rows * 100) if total_rows > 0 else 0
-                    status_text = "PASS" if duplicate_qty == 0 else "FAIL"
+                    status_text = "PASS" if result['status'] == 'success' else "FAIL"
                     markdown += f"- **Status**: {status_text}\n"
                     markdown += f"- **Total Rows**: {total_rows:,}\n"
-                    markdown += f"- **Duplicate Records**: {duplicate_qty:,} ({duplicate_percentage:.2f}% of data)\n"
+                    markdown += f"- **Duplicate Records**: {duplicate_qty:,} ({duplicate_percentage:.2f}% of data{_interval_note(result.get('duplicate_percentage_ci'))})\n"
 
                     if duplicate_qty > 0:
-                        markdown += f"- **Impact**: Data redundancy detected - {duplicate_qty:,} rows are duplicated\n"
+                        markdown += f"- **Impact**: {_duplicate_impact(result)}\n"
                         duplicate_examples = result.get('duplicate_examples', [])
                         if duplicate_examples:
                             markdown += f"- **Sample Duplicate Records**:\n"
                             for i, example in enumerate(duplicate_examples[:3], 1):  # Show first 3 examples
-                                markdown += f"  {i}. Row appears {example.get('count', 1)} times\n"
+                                markdown += f"  {i}. Row {_duplicate_example_text(example)}\n"
                     else:
                         markdown += f"- **Quality**: Excellent - No duplicate records found\n"
 
@@ -83,7 +126,7 @@ class ReportTemplates:
                                 col_name = col_info['column_name']
                                 null_count = col_info['null_count']
                                 null_pct = col_info['null_percentage']
-                                markdown += f"- `{col_name}`: {null_count:,} nulls ({null_pct:.1f}%)\n"
+                                markdown += f"- `{col_name}`: {null_count:,} nulls ({null_pct:.1f}%{_interval_note(col_info.get('null_percentage_ci'))})\n"
                     else:
                         markdown += f"- **Quality**: Excellent - No missing values detected in any column\n"
 
@@ -236,7 +279,7 @@ class ReportTemplates:
         for check_name, result in check_results.items():
             # Determine status class and emoji based on actual results
             if result['status'] == 'success':
-                if check_name == 'duplicates' and result.get('duplicate_qty', 0) == 0:
+                if check_name == 'duplicates':
                     status_class = "status-pass"
                     status_emoji = "✅"
                 elif check_name == 'null_values' and result.get('columns_with_nulls', 0) == 0:
@@ -255,32 +298,33 @@ class ReportTemplates:
                 status_class = "status-error"
                 status_emoji = "❌"
 
+            cached_note = f" (cached {result['cached_at'][:19].replace('T', ' ')})" if result.get('cached') else ""
             html += f"""
     <div class="check-result">
         <div class="check-title {status_class}">
-            {status_emoji} {check_name.replace('_', ' ').title()}
+            {status_emoji} {check_name.replace('_', ' ').title()}{cached_note}{_sample_note(result)}
         </div>
 """
 
-            if result['status'] == 'success' or (result['status'] == 'failure' and check_name == 'duplicates'):
+            if result['status'] == 'success' or _duplicates_found(check_name, result):
                 if check_name == 'duplicates':
                     duplicate_qty = result.get('duplicate_qty', 0)
                     total_rows = result.get('total_rows', 0)
                     duplicate_percentage = (duplicate_qty / total_rows * 100) if total_rows > 0 else 0
-                    status_text = "PASS" if duplicate_qty == 0 else "FAIL"
-                    status_class = "status-pass" if duplicate_qty == 0 else "status-fail"
+                    status_text = "PASS" if result['status'] == 'success' else "FAIL"
+                    status_class = "status-pass" if result['status'] == 'success' else "status-fail"
                     html += f"""
         <p><strong>Status:</strong> <span class="{status_class}">{status_text}</span></p>
         <p><strong>Total Rows:</strong> {total_rows:,}</p>
-        <p><strong>Duplicate Records:</strong> {duplicate_qty:,} ({duplicate_percentage:.2f}% of data)</p>
+        <p><strong>Duplicate Records:</strong> {duplicate_qty:,} ({duplicate_percentage:.2f}% of data{_interval_note(result.get('duplicate_percentage_ci'))})</p>
 """
                     if duplicate_qty > 0:
-                        html += f"<p><strong>Impact:</strong> Data redundancy detected - {duplicate_qty:,} rows are duplicated</p>"
+                        html += f"<p><strong>Impact:</strong> {_duplicate_impact(result)}</p>"
                         duplicate_examples = result.get('duplicate_examples', [])
                         if duplicate_examples:
                             html += "<p><strong>Sample Duplicate Records:</strong></p><ul>"
                             for i, example in enumerate(duplicate_examples[:3], 1):  # Show first 3 examples
-                                html += f"<li>Row pattern appears {example.get('count', 1)} times</li>"
+                                html += f"<li>Row {html_lib.escape(_duplicate_example_text(example))}</li>"
                             html += "</ul>"
                     else:
                         html += "<p><strong>Quality:</strong> <span style='color: green;'>Excellent - No duplicate records found</span></p>"
@@ -308,7 +352,7 @@ class ReportTemplates:
                                 col_name = col_info['column_name']
                                 null_count = col_info['null_count']
                                 null_pct = col_info['null_percentage']
-                                html += f"<li><code>{col_name}</code>: {null_count:,} nulls ({null_pct:.1f}%)</li>"
+                                html += f"<li><code>{col_name}</code>: {null_count:,} nulls ({null_pct:.1f}%{_interval_note(col_info.get('null_percentage_ci'))})</li>"
                             html += "</ul>"
                     else:
                         html += "<p><strong>Quality:</strong> <span style='color: green;'>Excellent - No missing values detected in any column</span></p>"
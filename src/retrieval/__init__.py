@@ -1,4 +1,7 @@
 # Retrieval module - Schema indexing for automatic table discovery
-from .schema_indexer import SchemaIndexer
+from .schema_indexer import SchemaIndexer, get_schema_indexer, get_schema_vector_store, warm_up_retrieval
+from .embeddings import get_embeddings, warm_up_embeddings
+from .vector_store import VectorStore
 
-__all__ = ['SchemaIndexer']
+__all__ = ['SchemaIndexer', 'get_schema_indexer', 'get_schema_vector_store', 'warm_up_retrieval',
+           'get_embeddings', 'warm_up_embeddings', 'VectorStore']
@@ -0,0 +1,133 @@
+# src/retrieval/embedding_cache.py
+"""
+On-disk cache of document embeddings keyed by content hash.
+
+Most table metadata documents are byte-for-byte identical from one build to the next, so
+their vectors are looked up by sha256(model name + text) instead of being re-embedded.
+Vectors live in a memory-mapped float32 file (one row per document); a JSON index maps
+each content hash to its row.
+"""
+import hashlib
+import json
+import os
+import threading
+import numpy as np
+from typing import Dict, List, Optional, Sequence
+
+
+class EmbeddingCache:
+    """
+    Content-addressed embedding store for one embedding model.
+
+    Not safe for concurrent writers in different processes; threads in one process may
+    share an instance.
+
+    Example:
+        cache = EmbeddingCache("./chroma_db/embedding_cache", "all-MiniLM-L6-v2")
+        vectors = cache.get_many(texts)          # None for texts not seen before
+        cache.put_many(missing_texts, new_vectors)
+        cache.flush()
+    """
+
+    def __init__(self, directory: str, model_name: str):
+        """
+        Args:
+            directory: Root cache directory (a subdirectory is used per model)
+            model_name: Embedding model the vectors were produced by (part of every key)
+        """
+        self.model_name = model_name
+        self.directory = os.path.join(directory, model_name.replace('/', '__'))
+        self._vectors_path = os.path.join(self.directory, 'vectors.f32')
+        self._index_path = os.path.join(self.directory, 'index.json')
+
+        self._lock = threading.Lock()
+        self._rows: Dict[str, int] = {}
+        self._dim: Optional[int] = None
+        self._mmap: Optional[np.memmap] = None
+        self._dirty = False
+        self._load_index()
+
+    def _load_index(self) -> None:
+        try:
+            with open(self._index_path, 'r') as f:
+                stored = json.load(f)
+            dim, rows = stored['dim'], stored['rows']
+            # Ignore an index that points past the end of the vector file (e.g. interrupted write)
+            expected_size = len(rows) * dim * 4
+            if rows and os.path.getsize(self._vectors_path) < expected_size:
+                raise ValueError("vector file shorter than index")
+            # Drop rows appended after the last flush; new rows are numbered from the index
+            if os.path.exists(self._vectors_path) and os.path.getsize(self._vectors_path) > expected_size:
+                os.truncate(self._vectors_path, expected_size)
+            self._dim, self._rows = dim, rows
+        except (OSError, ValueError, KeyError):
+            self._dim, self._rows = None, {}
+            if os.path.exists(self._vectors_path):
+                os.remove(self._vectors_path)
+
+    def key(self, text: str) -> str:
+        """Content hash of a document for this model."""
+        return hashlib.sha256(f"{self.model_name}\0{text}".encode('utf-8')).hexdigest()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._rows)
+
+    def _vectors(self) -> np.ndarray:
+        """Memory-mapped vector file, remapped when rows were appended since the last map."""
+        if self._mmap is None or len(self._mmap) < len(self._rows):
+            self._mmap = np.memmap(self._vectors_path, dtype='float32', mode='r', shape=(len(self._rows), self._dim))
+        return self._mmap
+
+    def get_many(self, texts: Sequence[str]) -> List[Optional[List[float]]]:
+        """
+        Look up cached vectors.
+
+        Returns:
+            One entry per text: the cached vector, or None on a miss
+        """
+        keys = [self.key(text) for text in texts]
+        with self._lock:
+            positions = [self._rows.get(key) for key in keys]
+            if all(position is None for position in positions):
+                return [None] * len(texts)
+            vectors = self._vectors()
+            return [vectors[position].tolist() if position is not None else None for position in positions]
+
+    def put_many(self, texts: Sequence[str], vectors: Sequence[Sequence[float]]) -> None:
+        """Append vectors for texts that aren't cached yet (call flush() to persist the index)."""
+        if not texts:
+            return
+        array = np.asarray(vectors, dtype='float32')
+        keys = [self.key(text) for text in texts]
+
+        with self._lock:
+            if self._dim is None:
+                self._dim = array.shape[1]
+            elif array.shape[1] != self._dim:
+                raise ValueError(f"Embedding dimension {array.shape[1]} doesn't match cached dimension {self._dim}")
+
+            new = {}
+            for key, row in zip(keys, array):
+                if key not in self._rows and key not in new:
+                    new[key] = row
+            if not new:
+                return
+
+            os.makedirs(self.directory, exist_ok=True)
+            with open(self._vectors_path, 'ab') as f:
+                np.ascontiguousarray(np.stack(list(new.values()))).tofile(f)
+            for key in new:
+                self._rows[key] = len(self._rows)
+            self._dirty = True
+
+    def flush(self) -> None:
+        """Write the index file (atomically) if vectors were added."""
+        with self._lock:
+            if not self._dirty:
+                return
+            tmp_path = self._index_path + '.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump({'model': self.model_name, 'dim': self._dim, 'rows': self._rows}, f)
+            os.replace(tmp_path, self._index_path)
+            self._dirty = False
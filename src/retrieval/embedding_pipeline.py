@@ -0,0 +1,136 @@
+# src/retrieval/embedding_pipeline.py
+"""
+Batched, multi-threaded embedding stage for index builds.
+
+Documents are split into fixed-size batches; each batch is embedded on a worker thread
+(sentence-transformers releases the GIL inside torch, so batches run on separate cores) and
+written to the collection with one bulk upsert.
+"""
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+from .embedding_cache import EmbeddingCache
+
+# Documents embedded and written to the collection per batch
+DEFAULT_EMBED_BATCH_SIZE = 64
+
+# Threads embedding batches concurrently
+DEFAULT_EMBED_WORKERS = max(1, min(8, os.cpu_count() or 1))
+
+
+class EmbeddingPipeline:
+    """
+    Embeds documents in batches on a thread pool and bulk-upserts them into a Chroma collection.
+
+    Example:
+        pipeline = EmbeddingPipeline(collection, get_embeddings(), batch_size=64, workers=8)
+        pipeline.submit(ids, texts, metadatas)
+        stats = pipeline.close()  # waits for every batch; raises if one failed
+    """
+
+    def __init__(self, collection, embeddings, batch_size: int = DEFAULT_EMBED_BATCH_SIZE,
+                 workers: int = DEFAULT_EMBED_WORKERS, progress: bool = True,
+                 cache: Optional[EmbeddingCache] = None):
+        """
+        Args:
+            collection: Chroma collection the vectors are upserted into
+            embeddings: LangChain embeddings object (embed_documents)
+            batch_size: Documents per embedding call and per upsert
+            workers: Number of batches embedded concurrently
+            progress: Print progress and throughput after each batch
+            cache: Content-hash cache; only documents missing from it are embedded
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+
+        self.collection = collection
+        self.embeddings = embeddings
+        self.batch_size = batch_size
+        self.workers = max(1, workers)
+        self.progress = progress
+        self.cache = cache
+
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='embed')
+        self._futures: List[Future] = []
+        self._write_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._started = time.perf_counter()
+        self.stats = {'submitted': 0, 'documents': 0, 'batches': 0, 'embed_seconds': 0.0, 'write_seconds': 0.0,
+                      'cache_hits': 0}
+
+    def submit(self, ids: List[str], texts: List[str], metadatas: List[Dict[str, Any]]) -> None:
+        """Queue documents for embedding; they are written in batches of batch_size."""
+        for start in range(0, len(texts), self.batch_size):
+            end = start + self.batch_size
+            self.stats['submitted'] += len(texts[start:end])
+            self._futures.append(self._executor.submit(
+                self._embed_batch, ids[start:end], texts[start:end], metadatas[start:end]
+            ))
+
+    def _embed_batch(self, ids: List[str], texts: List[str], metadatas: List[Dict[str, Any]]) -> None:
+        started = time.perf_counter()
+        if self.cache is not None:
+            vectors = self.cache.get_many(texts)
+            missing = [i for i, vector in enumerate(vectors) if vector is None]
+            if missing:
+                computed = self.embeddings.embed_documents([texts[i] for i in missing])
+                for i, vector in zip(missing, computed):
+                    vectors[i] = vector
+                self.cache.put_many([texts[i] for i in missing], computed)
+            cache_hits = len(texts) - len(missing)
+        else:
+            vectors = self.embeddings.embed_documents(texts)
+            cache_hits = 0
+        embedded = time.perf_counter()
+
+        with self._write_lock:
+            self.collection.upsert(ids=ids, embeddings=vectors, documents=texts, metadatas=metadatas)
+        written = time.perf_counter()
+
+        with self._stats_lock:
+            self.stats['documents'] += len(texts)
+            self.stats['batches'] += 1
+            self.stats['cache_hits'] += cache_hits
+            self.stats['embed_seconds'] += embedded - started
+            self.stats['write_seconds'] += written - embedded
+            done, submitted = self.stats['documents'], self.stats['submitted']
+        if self.progress:
+            print(f"  Embedded {done}/{submitted} documents ({self._rate(done):.1f} docs/s)")
+
+    def _rate(self, documents: int) -> float:
+        elapsed = time.perf_counter() - self._started
+        return documents / elapsed if elapsed > 0 else 0.0
+
+    def close(self) -> Dict[str, Any]:
+        """
+        Wait for every queued batch and shut the worker threads down.
+
+        Returns:
+            Dict with documents, batches, cache_hits, embed_seconds, write_seconds, seconds and docs_per_second
+
+        Raises:
+            The first exception raised while embedding or writing a batch
+        """
+        error: Optional[BaseException] = None
+        try:
+            for future in self._futures:
+                exc = future.exception()
+                if exc is not None and error is None:
+                    error = exc
+        finally:
+            self._executor.shutdown(wait=True)
+            if self.cache is not None:
+                self.cache.flush()
+        if error is not None:
+            raise error
+
+        elapsed = time.perf_counter() - self._started
+        return {
+            **self.stats,
+            'workers': self.workers,
+            'batch_size': self.batch_size,
+            'seconds': round(elapsed, 3),
+            'docs_per_second': round(self.stats['documents'] / elapsed, 1) if elapsed > 0 else 0.0
+        }
@@ -0,0 +1,64 @@
+# src/retrieval/embeddings.py
+"""
+Process-wide embedding model shared by every SchemaIndexer.
+
+Loading the sentence-transformers weights takes far longer than embedding a query, so the
+model is loaded once per process (lazily, or up front via warm_up_embeddings()) and reused.
+"""
+import os
+import threading
+from functools import lru_cache
+from typing import Dict, Optional
+
+DEFAULT_EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+
+_models: Dict[str, object] = {}
+_models_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def get_default_embedding_model_name() -> str:
+    """Embedding model name from the rag.embedding_model setting in settings.yaml (read once per process)."""
+    import yaml
+    settings_path = os.path.join(os.path.dirname(__file__), '../../config/settings.yaml')
+    if os.path.exists(settings_path):
+        try:
+            with open(settings_path, 'r') as f:
+                settings = yaml.safe_load(f) or {}
+            model_name = (settings.get('rag') or {}).get('embedding_model')
+            if model_name:
+                return model_name
+        except Exception as e:
+            print(f"Warning: Could not load settings.yaml: {e}. Using {DEFAULT_EMBEDDING_MODEL}.")
+    return DEFAULT_EMBEDDING_MODEL
+
+
+def get_embeddings(model_name: Optional[str] = None):
+    """
+    Get the shared embedding model, loading it on first use.
+
+    Args:
+        model_name: Sentence-transformers model name (None = rag.embedding_model from settings.yaml)
+
+    Returns:
+        HuggingFaceEmbeddings instance shared by all callers asking for the same model
+    """
+    model_name = model_name or get_default_embedding_model_name()
+    model = _models.get(model_name)
+    if model is not None:
+        return model
+
+    with _models_lock:
+        if model_name not in _models:
+            from langchain_huggingface import HuggingFaceEmbeddings
+            _models[model_name] = HuggingFaceEmbeddings(model_name=model_name)
+        return _models[model_name]
+
+
+def warm_up_embeddings(model_name: Optional[str] = None) -> None:
+    """
+    Load the embedding model and run one query through it.
+
+    Call this at server startup so the first user query doesn't pay for the model load.
+    """
+    get_embeddings(model_name).embed_query("warm up")
@@ -0,0 +1,167 @@
+# src/retrieval/lexical_index.py
+"""
+In-memory BM25 index over the schema documents, plus exact table-name lookup.
+
+Built from the documents already stored in the schema collection (table name, column names
+and types, table and column comments). Used by SchemaIndexer.search_tables for hybrid
+retrieval: BM25 and vector rankings are combined with reciprocal rank fusion, and queries
+that name a table outright (the query is the name, or contains a schema-qualified name) are
+answered from the name lookup without embedding anything.
+"""
+import math
+import re
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Reciprocal rank fusion constant (score = sum of 1 / (RRF_K + rank))
+RRF_K = 60
+
+# BM25 parameters
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+# Table name tokens are counted this many times, so name matches outweigh column/comment matches
+TABLE_NAME_WEIGHT = 3
+
+_IDENTIFIER_PATTERN = re.compile(r"[a-z0-9_$]+(?:\.[a-z0-9_$]+)*")
+_WORD_PATTERN = re.compile(r"[a-z0-9_$]+")
+_SAMPLE_SECTION_PATTERN = re.compile(r"\nSAMPLE DATA:.*?(?=\nCreated:|\Z)", re.DOTALL)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase words; snake_case identifiers yield the whole identifier and each part."""
+    tokens = []
+    for word in _WORD_PATTERN.findall(text.lower()):
+        tokens.append(word)
+        if '_' in word:
+            tokens.extend(part for part in word.split('_') if part)
+    return tokens
+
+
+def query_identifiers(query: str) -> List[str]:
+    """Dotted or plain identifiers in a query, e.g. 'stage_sales.public.customers'."""
+    return _IDENTIFIER_PATTERN.findall(query.lower())
+
+
+class LexicalIndex:
+    """
+    BM25 inverted index and name lookup over indexed table documents.
+
+    Example:
+        index = LexicalIndex(ids, documents, metadatas)
+        index.exact_matches("duplicates on stage_sales.public.customers")  # -> [position]
+        index.is_name_lookup("duplicates on stage_sales.public.customers")  # -> True
+        index.search("customer email", top_n=20)                          # -> [(position, score)]
+    """
+
+    def __init__(self, ids: Sequence[str], documents: Sequence[str], metadatas: Sequence[dict]):
+        """
+        Args:
+            ids: Document ids (full_name)
+            documents: Metadata documents as stored in the collection
+            metadatas: Chroma metadata dicts (table_name, full_name, connector_type, schema)
+        """
+        self.ids = list(ids)
+        self.documents = list(documents)
+        self.metadatas = list(metadatas)
+
+        self._postings: Dict[str, Dict[int, int]] = {}
+        self._lengths: List[int] = []
+        self._names: Dict[str, List[int]] = {}
+
+        for position, (document, metadata) in enumerate(zip(self.documents, self.metadatas)):
+            table_name = (metadata.get('table_name') or '').lower()
+            full_name = (metadata.get('full_name') or '').lower()
+
+            # Sample rows are noise for lexical matching
+            text = _SAMPLE_SECTION_PATTERN.sub('', document or '')
+            terms = Counter(tokenize(text))
+            for token in tokenize(table_name):
+                terms[token] += TABLE_NAME_WEIGHT
+            for term, frequency in terms.items():
+                self._postings.setdefault(term, {})[position] = frequency
+            self._lengths.append(sum(terms.values()))
+
+            # Exact-name lookup by full name, schema.table and bare table name
+            parts = full_name.split('.')
+            for name in {full_name, '.'.join(parts[-2:]), table_name}:
+                if name:
+                    self._names.setdefault(name, []).append(position)
+
+        self._average_length = (sum(self._lengths) / len(self._lengths)) if self._lengths else 0.0
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def exact_matches(self, query: str) -> List[int]:
+        """
+        Documents whose name appears verbatim in the query.
+
+        Fully qualified names win over schema.table, which win over bare table names.
+
+        Returns:
+            Positions of matching documents in query order (empty if no name matched)
+        """
+        by_specificity: Dict[int, List[int]] = {}
+        for identifier in query_identifiers(query):
+            positions = self._names.get(identifier)
+            if positions:
+                bucket = by_specificity.setdefault(identifier.count('.'), [])
+                bucket.extend(position for position in positions if position not in bucket)
+        if not by_specificity:
+            return []
+        return by_specificity[max(by_specificity)]
+
+    def search(self, query: str, top_n: int = 20) -> List[Tuple[int, float]]:
+        """
+        Rank documents by BM25 score.
+
+        Returns:
+            Up to top_n (position, score) pairs with a positive score, best first
+        """
+        scores: Dict[int, float] = {}
+        total = len(self.ids)
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (total - len(postings) + 0.5) / (len(postings) + 0.5))
+            for position, frequency in postings.items():
+                length_norm = 1 - BM25_B + BM25_B * self._lengths[position] / (self._average_length or 1)
+                scores[position] = scores.get(position, 0.0) + idf * frequency * (BM25_K1 + 1) / (
+                    frequency + BM25_K1 * length_norm
+                )
+        return sorted(scores.items(), key=lambda item: item[1], reverse=True)[:top_n]
+
+    def is_name_lookup(self, query: str) -> bool:
+        """
+        Whether the query names indexed tables outright rather than describing them.
+
+        True when the whole query is one indexed name (e.g. 'customers'), or when it contains a
+        qualified indexed name (schema.table or database.schema.table). A bare table name inside
+        a sentence ('which tables describe customer orders') is not a lookup.
+        """
+        identifiers = query_identifiers(query)
+        if len(identifiers) == 1 and identifiers[0] == query.strip().strip('`"\'.,;:!?').lower():
+            return identifiers[0] in self._names
+        return any('.' in identifier and identifier in self._names for identifier in identifiers)
+
+
+def reciprocal_rank_fusion(rankings: Sequence[Sequence[str]], k: int = RRF_K,
+                           weights: Optional[Sequence[float]] = None) -> Dict[str, float]:
+    """
+    Combine several rankings of ids into one score per id.
+
+    Args:
+        rankings: Lists of ids, best first
+        k: Damping constant (higher = flatter contribution from top ranks)
+        weights: Optional weight per ranking (default 1.0 each)
+
+    Returns:
+        Dict mapping id to fused score (higher is better)
+    """
+    fused: Dict[str, float] = {}
+    for ranking, weight in zip(rankings, weights or [1.0] * len(rankings)):
+        for rank, item in enumerate(ranking, 1):
+            fused[item] = fused.get(item, 0.0) + weight / (k + rank)
+    return fused
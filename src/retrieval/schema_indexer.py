@@ -3,12 +3,22 @@
 Index database schema metadata into the vector database.
 Allows the agent to discover and select appropriate tables based on user queries.
 """
-from langchain_community.vectorstores import Chroma
-from langchain_huggingface import HuggingFaceEmbeddings
-import chromadb
-from src.connectors.schema_discovery import SchemaDiscovery
-from typing import Optional, List
+from src.connectors.schema_discovery import SchemaDiscovery, table_fingerprint
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import Any, Optional, List, Dict
+import json
+import numpy as np
 import os
+import threading
+import time
+import uuid
+from .embeddings import get_embeddings, get_default_embedding_model_name, warm_up_embeddings
+from .query_cache import TTLCache
+from .lexical_index import LexicalIndex, reciprocal_rank_fusion
+from .vector_store import VectorStore
+from .embedding_cache import EmbeddingCache
+from .embedding_pipeline import EmbeddingPipeline, DEFAULT_EMBED_BATCH_SIZE, DEFAULT_EMBED_WORKERS
 from dotenv import load_dotenv
 load_dotenv()
 
@@ -16,6 +26,59 @@ load_dotenv()
 SCHEMA_VECTOR_DB_PATH = "./chroma_db"
 SCHEMA_COLLECTION_NAME = "database_schemas"
 
+# Worker threads for catalog I/O in build_schema_index(parallel=True)
+DEFAULT_INDEX_WORKERS = 8
+
+# Candidates fetched from the collection per search; top_k and relevance filtering run over them
+DEFAULT_SEARCH_CANDIDATES = 20
+
+# Query embeddings and raw search results are cached (LRU, with expiry) per process
+QUERY_CACHE_SIZE = 512
+QUERY_CACHE_TTL = 3600.0
+
+_query_embedding_cache = TTLCache(maxsize=QUERY_CACHE_SIZE, ttl=QUERY_CACHE_TTL)
+_search_results_cache = TTLCache(maxsize=QUERY_CACHE_SIZE, ttl=QUERY_CACHE_TTL)
+
+# Merged database-to-connector mappings, keyed by (index version, settings.yaml mtime)
+_database_mappings_cache = TTLCache(maxsize=4, ttl=None)
+
+# BM25 / exact-name index over the collection, keyed by index version
+_lexical_index_cache = TTLCache(maxsize=2, ttl=None)
+
+
+def _index_version_path() -> str:
+    return os.path.join(SCHEMA_VECTOR_DB_PATH, "schema_index_version.json")
+
+
+def _database_mappings_path() -> str:
+    return os.path.join(SCHEMA_VECTOR_DB_PATH, "database_mappings.json")
+
+
+def get_index_version() -> str:
+    """
+    Token identifying the current build of the schema index.
+
+    It changes whenever build_schema_index() writes to the collection, so caches keyed by
+    it are invalidated by a rebuild (in this or any other process).
+    """
+    try:
+        stat = os.stat(_index_version_path())
+        return f"{stat.st_mtime_ns}-{stat.st_size}"
+    except OSError:
+        return "unversioned"
+
+
+def _bump_index_version() -> None:
+    """Record that the index was (re)built."""
+    os.makedirs(SCHEMA_VECTOR_DB_PATH, exist_ok=True)
+    with open(_index_version_path(), 'w') as f:
+        json.dump({'version': uuid.uuid4().hex, 'updated': datetime.now().isoformat()}, f)
+
+
+def normalize_query(query: str) -> str:
+    """Normalise query text for cache keys (case and whitespace insensitive)."""
+    return ' '.join(query.lower().split())
+
 
 class SchemaIndexer:
     """Index database schema metadata for RAG-based table discovery."""
@@ -23,9 +86,13 @@ class SchemaIndexer:
     def __init__(self, connector_type: str = 'snowflake'):
         self.connector_type = connector_type
         self.discovery = SchemaDiscovery(connector_type)
-        self.embeddings = HuggingFaceEmbeddings(model_name="all-MiniLM-L6-v2")
         self._load_discovery_config()
 
+    @property
+    def embeddings(self):
+        """Process-wide embedding model, loaded on first use."""
+        return get_embeddings()
+
     def _load_discovery_config(self):
         """Load database and schema from settings.yaml"""
         import yaml
@@ -89,10 +156,8 @@ class SchemaIndexer:
         """Discover all schemas from INFORMATION_SCHEMA."""
         from src.connectors.connector_factory import ConnectorFactory
 
-        # Create connector instance for specified database connector type
-        connector = ConnectorFactory.create_connector(self.connector_type)
-
-        with connector:
+        # Borrow a pooled connector for the specified database connector type
+        with ConnectorFactory.connection(self.connector_type) as connector:
             cursor = connector._cursor
 
             if self.connector_type == 'snowflake':
@@ -145,7 +210,13 @@ class SchemaIndexer:
         include_sample: Optional[bool] = None,
         sample_row_limit: Optional[int] = None,
         max_tables: Optional[int] = None,
-        recreate: bool = True
+        recreate: bool = True,
+        incremental: bool = False,
+        parallel: bool = False,
+        max_workers: int = DEFAULT_INDEX_WORKERS,
+        embed_batch_size: int = DEFAULT_EMBED_BATCH_SIZE,
+        embed_workers: int = DEFAULT_EMBED_WORKERS,
+        use_embedding_cache: bool = True
     ):
         """
         Discover all tables and index their metadata.
@@ -158,6 +229,16 @@ class SchemaIndexer:
             sample_row_limit: Number of sample rows per table (None = use config)
             max_tables: Limit number of tables per schema
             recreate: If True, delete existing collection first
+            incremental: Only rebuild documents whose catalog fingerprint (columns, types, comment,
+                         LAST_ALTERED) changed since the last build, and delete documents of dropped
+                         tables. Falls back to a full rebuild if no fingerprints were stored yet.
+            parallel: Discover schemas and fetch samples on a bounded thread pool while the
+                      calling thread embeds finished schemas in batches
+            max_workers: Worker threads for catalog I/O when parallel=True
+            embed_batch_size: Documents per embedding call and per bulk upsert
+            embed_workers: Threads embedding batches concurrently
+            use_embedding_cache: Reuse vectors of documents whose text is unchanged since an
+                                 earlier build (content-hash cache under SCHEMA_VECTOR_DB_PATH)
         """
         # Use config defaults if not specified
         include_sample = include_sample if include_sample is not None else self.default_include_sample
@@ -182,8 +263,24 @@ class SchemaIndexer:
             # No schema specified, will use connection default
             schemas_to_index = [None]
 
+        if incremental or parallel:
+            total_tables = self._build_schema_index_pipeline(
+                schemas_to_index, database, include_sample, sample_row_limit, max_tables,
+                recreate, incremental, max_workers if parallel else 1, embed_batch_size, embed_workers,
+                use_embedding_cache,
+                prune_schemas=schemas_to_index != [None] and not (schemas or self.default_schemas)
+            )
+            print(f" SCHEMA INDEX BUILT SUCCESSFULLY")
+            print(f"  - Collection: {SCHEMA_COLLECTION_NAME}")
+            print(f"  - Schemas indexed: {len(schemas_to_index)}")
+            print(f"  - Total tables indexed: {total_tables}")
+            return
+
         # Index all schemas
+        store = get_schema_vector_store()
+        cache = self._embedding_cache() if use_embedding_cache else None
         total_tables = 0
+        fingerprints = {} if recreate else (self._load_fingerprints() or {})
         for i, schema_name in enumerate(schemas_to_index, 1):
             schema_display = schema_name or "(current schema)"
             print(f"[{i}/{len(schemas_to_index)}] INDEXING SCHEMA: {schema_display}")
@@ -213,43 +310,283 @@ class SchemaIndexer:
                 for doc in metadata_docs
             ]
 
-            # Create ChromaDB client for vector store
-            client = chromadb.PersistentClient(path=SCHEMA_VECTOR_DB_PATH)
-
             # Delete existing collection if recreate=True and first schema
             if recreate and i == 1:
-                try:
-                    client.delete_collection(SCHEMA_COLLECTION_NAME)
-                    print(f" Deleted existing collection: {SCHEMA_COLLECTION_NAME}")
-                except:
-                    pass
+                store.reset_collection()
 
-            # Create vector store
+            # Embed in batches and bulk-upsert into the vector store
             print(f"\nIndexing {len(texts)} table metadata documents...")
-            vectorstore = Chroma.from_texts(
-                texts=texts,
-                embedding=self.embeddings,
-                metadatas=metadatas,
-                client=client,
-                collection_name=SCHEMA_COLLECTION_NAME
-            )
+            pipeline = EmbeddingPipeline(store.get_collection(create=True), self.embeddings,
+                                         batch_size=embed_batch_size, workers=embed_workers, cache=cache)
+            pipeline.submit([doc['full_name'] for doc in metadata_docs], texts, metadatas)
+            embed_stats = pipeline.close()
+
+            for doc in metadata_docs:
+                fingerprints[doc['full_name']] = {
+                    'schema': doc['full_name'].split('.')[1],
+                    'fingerprint': doc['fingerprint']
+                }
 
             total_tables += len(texts)
-            print(f"Indexed {len(texts)} tables from schema {schema_display}")
+            print(f"Indexed {len(texts)} tables from schema {schema_display} "
+                  f"({embed_stats['cache_hits']} from embedding cache, {embed_stats['docs_per_second']} docs/s)")
+
+        self._save_fingerprints(fingerprints)
+        _bump_index_version()
+        store.mark_updated()
+        self._save_index_database_mappings()
+        self._get_lexical_index()
 
         print(f" SCHEMA INDEX BUILT SUCCESSFULLY")
         print(f"  - Collection: {SCHEMA_COLLECTION_NAME}")
         print(f"  - Schemas indexed: {len(schemas_to_index)}")
         print(f"  - Total tables indexed: {total_tables}")
 
+    def _fingerprint_path(self) -> str:
+        """Path of the fingerprint file for this connector type."""
+        return os.path.join(SCHEMA_VECTOR_DB_PATH, f"schema_fingerprint_{self.connector_type}.json")
+
+    def _load_fingerprints(self) -> Optional[Dict[str, Dict[str, str]]]:
+        """
+        Load the per-table fingerprints stored by the last build.
+
+        Returns:
+            Dict mapping full_name to {'schema', 'fingerprint'}, or None if no per-table
+            fingerprints were stored (missing file or a file written by an older version)
+        """
+        try:
+            with open(self._fingerprint_path(), 'r') as f:
+                return json.load(f).get('table_fingerprints')
+        except (OSError, ValueError):
+            return None
+
+    def _save_fingerprints(self, fingerprints: Dict[str, Dict[str, str]]) -> None:
+        """Write the fingerprint file (schema/table summary plus per-table fingerprints)."""
+        tables_per_schema: Dict[str, List[str]] = {}
+        for full_name, entry in sorted(fingerprints.items()):
+            tables_per_schema.setdefault(entry['schema'], []).append(full_name.split('.')[-1])
+
+        os.makedirs(SCHEMA_VECTOR_DB_PATH, exist_ok=True)
+        with open(self._fingerprint_path(), 'w') as f:
+            json.dump({
+                'schemas': sorted(tables_per_schema),
+                'tables_per_schema': tables_per_schema,
+                'total_schemas': len(tables_per_schema),
+                'total_tables': len(fingerprints),
+                'timestamp': datetime.now().isoformat(),
+                'table_fingerprints': fingerprints
+            }, f, indent=2)
+
+    def _discover_schema_changes(
+        self,
+        database: Optional[str],
+        schema_name: Optional[str],
+        include_sample: bool,
+        sample_row_limit: int,
+        max_tables: Optional[int],
+        sample_workers: int,
+        previous: Optional[Dict[str, Dict[str, str]]]
+    ) -> Dict[str, Any]:
+        """
+        Discover one schema and build documents for its new or changed tables.
+
+        Returns:
+            Dict with the resolved 'schema' name, 'docs' to (re)index, the current
+            'fingerprints' of the tables within max_tables and the full names of every
+            table that 'exists' in the schema (so tables past the cut are not deleted)
+        """
+        # Discover untruncated so the existing-table list is complete, then apply the cut
+        tables, columns_by_table = self.discovery.discover_catalog(database, schema_name)
+        existing = {f"{table['DATABASE_NAME']}.{table['SCHEMA_NAME']}.{table['TABLE_NAME']}" for table in tables}
+        if max_tables:
+            tables = tables[:max_tables]
+
+        current = {}
+        changed = []
+        for table in tables:
+            full_name = f"{table['DATABASE_NAME']}.{table['SCHEMA_NAME']}.{table['TABLE_NAME']}"
+            current[full_name] = table_fingerprint(table, columns_by_table.get(table['TABLE_NAME'], []))
+            if previous is None or previous.get(full_name, {}).get('fingerprint') != current[full_name]:
+                changed.append(table)
+
+        docs = []
+        if changed:
+            docs = self.discovery.build_metadata_documents(
+                changed, columns_by_table, include_sample, sample_row_limit, sample_workers
+            )
+
+        return {
+            'schema': tables[0]['SCHEMA_NAME'] if tables else schema_name,
+            'docs': docs,
+            'fingerprints': current,
+            'existing': existing
+        }
+
+    def _build_schema_index_pipeline(
+        self,
+        schemas_to_index: List[Optional[str]],
+        database: Optional[str],
+        include_sample: bool,
+        sample_row_limit: int,
+        max_tables: Optional[int],
+        recreate: bool,
+        incremental: bool,
+        max_workers: int,
+        embed_batch_size: int,
+        embed_workers: int = DEFAULT_EMBED_WORKERS,
+        use_embedding_cache: bool = True,
+        prune_schemas: bool = False
+    ) -> int:
+        """
+        Two-stage pipeline: catalog discovery fans out over schemas on worker threads (sample
+        queries run on the connector's shared sampling pool), and each schema's documents are handed to an
+        EmbeddingPipeline as soon as the schema is discovered.
+
+        In incremental mode only tables whose fingerprint changed are re-embedded, and
+        documents of tables that no longer exist are deleted.
+
+        Returns:
+            Number of (re)indexed tables
+        """
+        store = get_schema_vector_store()
+
+        previous = None
+        if incremental:
+            previous = self._load_fingerprints()
+            if previous is None:
+                print("No table fingerprints stored yet - running a full rebuild")
+                recreate = True
+            else:
+                recreate = False
+
+        collection = store.reset_collection() if recreate else store.get_collection(create=True)
+
+        fingerprints = {} if recreate else (self._load_fingerprints() or {})
+        if previous:
+            # Tables whose document is missing from the collection count as changed
+            indexed_ids = set(collection.get(ids=list(previous), include=[])['ids'])
+            previous = {full_name: entry for full_name, entry in previous.items() if full_name in indexed_ids}
+
+        start = time.perf_counter()
+        total_tables = 0
+        total_deleted = 0
+        pipeline = EmbeddingPipeline(collection, self.embeddings, batch_size=embed_batch_size, workers=embed_workers,
+                                     cache=self._embedding_cache() if use_embedding_cache else None)
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='schema-index') as executor:
+            futures = {
+                executor.submit(
+                    self._discover_schema_changes,
+                    database,
+                    schema_name,
+                    include_sample,
+                    sample_row_limit,
+                    max_tables,
+                    max_workers,
+                    previous
+                ): schema_name
+                for schema_name in schemas_to_index
+            }
+
+            for i, future in enumerate(as_completed(futures), 1):
+                schema_name = futures[future]
+                schema_display = schema_name or "(current schema)"
+                try:
+                    result = future.result()
+                except Exception as e:
+                    print(f"✗ Error discovering schema {schema_display}: {str(e)}")
+                    continue
+
+                # Drop documents of tables that disappeared from this schema
+                removed = [
+                    full_name for full_name, entry in fingerprints.items()
+                    if entry['schema'] == result['schema'] and full_name not in result['existing']
+                ]
+                if removed:
+                    collection.delete(ids=removed)
+                    for full_name in removed:
+                        del fingerprints[full_name]
+                    total_deleted += len(removed)
+
+                metadata_docs = result['docs']
+                if metadata_docs:
+                    self._submit_documents(pipeline, metadata_docs, schema_name)
+                    for doc in metadata_docs:
+                        fingerprints[doc['full_name']] = {'schema': result['schema'], 'fingerprint': doc['fingerprint']}
+                    total_tables += len(metadata_docs)
+
+                unchanged = len(result['fingerprints']) - len(metadata_docs)
+                print(f"[{i}/{len(schemas_to_index)}] Schema {schema_display}: {len(metadata_docs)} queued, "
+                      f"{unchanged} unchanged, {len(removed)} removed")
+
+        embed_stats = pipeline.close()
+
+        if prune_schemas:
+            # Schemas that no longer exist (only known when the schema list was auto-discovered)
+            dropped = [full_name for full_name, entry in fingerprints.items() if entry['schema'] not in schemas_to_index]
+            if dropped:
+                collection.delete(ids=dropped)
+                for full_name in dropped:
+                    del fingerprints[full_name]
+                total_deleted += len(dropped)
+
+        self._save_fingerprints(fingerprints)
+        _bump_index_version()
+        store.mark_updated()
+        self._save_index_database_mappings()
+        self._get_lexical_index()
+
+        print(f"Indexed {total_tables} tables and removed {total_deleted} in {time.perf_counter() - start:.1f}s "
+              f"(embedding: {embed_stats['batches']} batches, {embed_stats['cache_hits']} cached, "
+              f"{embed_stats['docs_per_second']} docs/s "
+              f"on {embed_stats['workers']} workers)")
+        return total_tables
+
+    def _embedding_cache(self) -> EmbeddingCache:
+        """On-disk embedding cache for the configured model, stored next to the collection."""
+        return EmbeddingCache(os.path.join(SCHEMA_VECTOR_DB_PATH, "embedding_cache"), get_default_embedding_model_name())
+
+    def _submit_documents(self, pipeline: EmbeddingPipeline, metadata_docs: List[Dict[str, str]],
+                          schema_name: Optional[str]) -> None:
+        """Queue metadata documents on the embedding pipeline, keyed by full_name."""
+        pipeline.submit(
+            [doc['full_name'] for doc in metadata_docs],
+            [doc['metadata'] for doc in metadata_docs],
+            [
+                {
+                    'table_name': doc['table_name'],
+                    'full_name': doc['full_name'],
+                    'connector_type': self.connector_type,
+                    'schema': schema_name or 'default'
+                }
+                for doc in metadata_docs
+            ]
+        )
+
     def _get_database_mappings(self) -> dict:
         """
         Build intelligent database name to connector type mapping from indexed metadata
         and configuration. Maps environment keywords (staging/prod) to appropriate connectors.
 
+        The indexed part is computed at build time and persisted next to the collection
+        (chroma_db/database_mappings.json); the merged mapping is cached in memory until the index
+        is rebuilt or settings.yaml changes.
+
         Returns:
             Dict mapping database names and environment keywords to connector types
         """
+        settings_path = os.path.join(os.path.dirname(__file__), '../../config/settings.yaml')
+        try:
+            settings_version = os.stat(settings_path).st_mtime_ns
+        except OSError:
+            settings_version = None
+
+        key = (get_index_version(), settings_version)
+        return _database_mappings_cache.get_or_compute(
+            key, lambda: {**self._get_config_database_mappings(), **self._load_index_database_mappings()}
+        )
+
+    def _get_config_database_mappings(self) -> dict:
+        """Database name and environment keyword mappings derived from settings.yaml."""
         mappings = {}
 
         # First, build mappings from configuration (environment-based)
@@ -295,41 +632,96 @@ class SchemaIndexer:
         except Exception as e:
             print(f"Warning: Could not load configuration for mappings: {e}")
 
-        # Then, enhance with dynamic mappings from indexed metadata
-        client = chromadb.PersistentClient(path=SCHEMA_VECTOR_DB_PATH)
+        return mappings
+
+    @staticmethod
+    def _compute_index_database_mappings(metadatas: List[dict]) -> dict:
+        """Database name mappings derived from the metadata of every indexed document."""
+        mappings = {}
+        for metadata in metadatas or []:
+            full_name = metadata.get('full_name', '')
+            connector_type = metadata.get('connector_type', '')
+
+            # Extract database name from full table path
+            if connector_type and full_name:
+                # For postgres: database.schema.table -> database = database name
+                # For Snowflake: DATABASE.SCHEMA.TABLE -> DATABASE = database name
+                parts = full_name.split('.')
+                if len(parts) >= 2:
+                    database_name = parts[0]
+                    # Map both exact and partial matches
+                    mappings[database_name.lower()] = connector_type
+
+                    # Also map common words in database name
+                    db_words = database_name.lower().replace('_', ' ').split()
+                    for word in db_words:
+                        if len(word) >= 3:  # Avoid very short words
+                            mappings[word] = connector_type
+        return mappings
 
+    def _save_index_database_mappings(self) -> dict:
+        """Compute the indexed database mappings from the collection and persist them (build time)."""
+        mappings = {}
         try:
-            collection = client.get_collection(SCHEMA_COLLECTION_NAME)
-
-            # Get all metadata to analyze database patterns
-            all_results = collection.get(include=['metadatas'])
-
-            if all_results['metadatas']:
-                for metadata in all_results['metadatas']:
-                    full_name = metadata.get('full_name', '')
-                    connector_type = metadata.get('connector_type', '')
-
-                    # Extract database name from full table path
-                    if connector_type and full_name:
-                        # For postgres: database.schema.table -> database = database name
-                        # For Snowflake: DATABASE.SCHEMA.TABLE -> DATABASE = database name
-                        parts = full_name.split('.')
-                        if len(parts) >= 2:
-                            database_name = parts[0]
-                            # Map both exact and partial matches
-                            mappings[database_name.lower()] = connector_type
-
-                            # Also map common words in database name
-                            db_words = database_name.lower().replace('_', ' ').split()
-                            for word in db_words:
-                                if len(word) >= 3:  # Avoid very short words
-                                    mappings[word] = connector_type
+            with get_schema_vector_store().reader() as collection:
+                if collection is None:
+                    raise ValueError(f"collection '{SCHEMA_COLLECTION_NAME}' not found")
+
+                # Get all metadata to analyze database patterns
+                all_results = collection.get(include=['metadatas'])
+            mappings = self._compute_index_database_mappings(all_results['metadatas'])
 
+            with open(_database_mappings_path(), 'w') as f:
+                json.dump({'index_version': get_index_version(), 'mappings': mappings}, f, indent=2)
         except Exception as e:
             print(f"Warning: Could not build dynamic mappings: {e}")
-
         return mappings
 
+    def _load_index_database_mappings(self) -> dict:
+        """Load the persisted indexed database mappings, recomputing them if missing or stale."""
+        try:
+            with open(_database_mappings_path(), 'r') as f:
+                stored = json.load(f)
+            if stored.get('index_version') == get_index_version():
+                return stored['mappings']
+        except (OSError, ValueError, KeyError):
+            pass
+        return self._save_index_database_mappings()
+
+    def _embed_query(self, query: str) -> List[float]:
+        """
+        Embed a query, reusing cached embeddings of the same normalised text.
+
+        The normalised text is only the cache key; the model always embeds the query as written.
+        """
+        key = (get_default_embedding_model_name(), normalize_query(query))
+        return _query_embedding_cache.get_or_compute(key, lambda: self.embeddings.embed_query(query))
+
+    def _query_candidates(self, query: str, n_results: int) -> Optional[dict]:
+        """
+        Raw nearest-neighbour results for a query, cached by normalised query and index version.
+
+        Returns:
+            Chroma query result with documents, metadatas and distances, or None if the
+            collection doesn't exist
+        """
+        key = (normalize_query(query), get_index_version(), n_results)
+        results = _search_results_cache.get(key)
+        if results is not None:
+            return results
+
+        query_embedding = self._embed_query(query)
+        with get_schema_vector_store().reader() as collection:
+            if collection is None:
+                return None
+            results = collection.query(
+                query_embeddings=[query_embedding],
+                n_results=n_results,
+                include=['documents', 'metadatas', 'distances']
+            )
+        _search_results_cache.set(key, results)
+        return results
+
     def search_tables(self, query: str, top_k: int = 3, min_relevance: float = 0.05) -> List[dict]:
         """
         Search for relevant tables based on a natural language query with intelligent database matching.
@@ -364,11 +756,11 @@ class SchemaIndexer:
                     preferred_connector = database_mappings[word]
                     break
 
-            # Also check for partial matches in the full query string
+            # Also check whole tokens and dotted name parts (e.g. 'stage_sales.public.customers')
             if not preferred_connector:
-                for db_name, connector in database_mappings.items():
-                    if db_name in query_lower:
-                        preferred_connector = connector
+                for token in query_lower.replace('.', ' ').split():
+                    if token in database_mappings:
+                        preferred_connector = database_mappings[token]
                         break
 
             # Additional environment-based detection (fallback)
@@ -390,66 +782,100 @@ class SchemaIndexer:
                             preferred_connector = database_mappings[keyword]
                             break
 
-        # Connect to vector store
-        client = chromadb.PersistentClient(path=SCHEMA_VECTOR_DB_PATH)
-
-        try:
-            collection = client.get_collection(SCHEMA_COLLECTION_NAME)
-        except:
+        lexical_index = self._get_lexical_index()
+
+        # Queries that name indexed tables outright are answered without an embedding call;
+        # tables merely mentioned by bare name in a sentence are ranked first in the fusion instead
+        exact = []
+        if lexical_index is not None:
+            exact = lexical_index.exact_matches(query)
+            if preferred_connector:
+                exact = [
+                    position for position in exact
+                    if lexical_index.metadatas[position]['connector_type'] == preferred_connector
+                ] or exact
+            if exact and lexical_index.is_name_lookup(query):
+                return [
+                    self._format_search_result(
+                        rank, lexical_index.documents[position], lexical_index.metadatas[position],
+                        relevance=1.0, base_relevance=1.0, table_boost=0, match='exact',
+                        preferred_connector=preferred_connector, database_mappings=database_mappings
+                    )
+                    for rank, position in enumerate(exact[:top_k], 1)
+                ]
+
+        # Perform similarity search with expanded results (cached per query and index version)
+        search_limit = max(top_k * 2, DEFAULT_SEARCH_CANDIDATES)  # Get more results for filtering/boosting
+        results = self._query_candidates(query, search_limit)
+        if results is None:
             print(f"Schema collection '{SCHEMA_COLLECTION_NAME}' not found. Run build_schema_index() first.")
             return []
 
-        # Perform similarity search with expanded results
-        query_embedding = self.embeddings.embed_query(query)
-        search_limit = max(top_k * 2, 10)  # Get more results for filtering/boosting
-        results = collection.query(
-            query_embeddings=[query_embedding],
-            n_results=search_limit,
-            include=['documents', 'metadatas', 'distances']
-        )
-
-        # Format and boost results based on database preference
-        relevant_tables = []
+        # Candidates from both retrievers: full_name -> (document, metadata, distance)
+        candidates = {}
+        vector_ranking = []
         if results['documents'] and len(results['documents'][0]) > 0:
-            for i, (doc, metadata, distance) in enumerate(zip(
-                results['documents'][0],
-                results['metadatas'][0],
-                results['distances'][0]
-            )):
-                base_relevance = 1 - distance  # Convert distance to similarity
-                boosted_relevance = base_relevance
-
-                # Apply database preference boost
-                if preferred_connector and metadata['connector_type'] == preferred_connector:
-                    boosted_relevance = min(base_relevance + 0.3, 1.0)  # Max available value 1.0
-
-                # Apply table name matching boost
-                table_name = metadata.get('table_name', '').lower()
-                query_words = query_lower.split()
-
-                # Boost if table name matches words in query
-                table_name_boost = 0
-                for word in query_words:
-                    if len(word) >= 3 and word in table_name:
-                        table_name_boost += 0.2  # Additional boost for table name match
-
-                # Apply table name boost
-                boosted_relevance = min(boosted_relevance + table_name_boost, 1.0)
-
-                relevant_tables.append({
-                    'rank': i + 1,
-                    'table_name': metadata['table_name'],
-                    'full_name': metadata['full_name'],
-                    'metadata': doc,
-                    'relevance_score': boosted_relevance,
-                    'connector_type': metadata['connector_type'],
-                    'original_relevance': base_relevance,  # Keep original for debugging
-                    'boosted': preferred_connector == metadata['connector_type'],
-                    'table_boost': table_name_boost,
-                    'detected_db': preferred_connector,  # Show what database was detected
-                    'db_mappings_used': database_mappings if preferred_connector else None
-                })        # Re-sort by boosted relevance and take top_k in our case top 3
-        relevant_tables.sort(key=lambda x: x['relevance_score'], reverse=True)
+            for doc, metadata, distance in zip(results['documents'][0], results['metadatas'][0], results['distances'][0]):
+                candidates[metadata['full_name']] = (doc, metadata, distance)
+                vector_ranking.append(metadata['full_name'])
+
+        lexical_ranking = []
+        lexical_scores = {}
+        exact_ranking = []
+        if lexical_index is not None:
+            lexical_ids = {}
+            for position, score in lexical_index.search(query, search_limit):
+                full_name = lexical_index.metadatas[position]['full_name']
+                lexical_ranking.append(full_name)
+                lexical_scores[full_name] = score
+                if full_name not in candidates:
+                    lexical_ids[lexical_index.ids[position]] = full_name
+            for position in exact:
+                full_name = lexical_index.metadatas[position]['full_name']
+                exact_ranking.append(full_name)
+                if full_name not in candidates:
+                    lexical_ids[lexical_index.ids[position]] = full_name
+            if lexical_ids:
+                candidates.update(self._score_candidates(query, list(lexical_ids)))
+
+        # Reciprocal rank fusion of the vector, BM25 and name-mention rankings (plus the detected database)
+        rankings = [vector_ranking, lexical_ranking, exact_ranking]
+        if preferred_connector:
+            rankings.append([
+                full_name for full_name in dict.fromkeys(vector_ranking + lexical_ranking)
+                if full_name in candidates and candidates[full_name][1]['connector_type'] == preferred_connector
+            ])
+        fused = reciprocal_rank_fusion(rankings)
+
+        # Relevance scores keep their 0-1 similarity scale (callers filter on them); RRF decides the order
+        relevant_tables = []
+        query_words = query_lower.split()
+        for full_name, (doc, metadata, distance) in candidates.items():
+            base_relevance = 1 - distance  # Convert distance to similarity
+            boosted_relevance = base_relevance
+
+            # Apply database preference boost
+            if preferred_connector and metadata['connector_type'] == preferred_connector:
+                boosted_relevance = min(base_relevance + 0.3, 1.0)  # Max available value 1.0
+
+            # Boost if table name matches words in query
+            table_name = metadata.get('table_name', '').lower()
+            table_name_boost = 0
+            for word in query_words:
+                if len(word) >= 3 and word in table_name:
+                    table_name_boost += 0.2  # Additional boost for table name match
+            boosted_relevance = min(boosted_relevance + table_name_boost, 1.0)
+
+            table = self._format_search_result(
+                0, doc, metadata, relevance=boosted_relevance, base_relevance=base_relevance,
+                table_boost=table_name_boost, match='hybrid',
+                preferred_connector=preferred_connector, database_mappings=database_mappings
+            )
+            table['rrf_score'] = fused.get(full_name, 0.0)
+            table['lexical_score'] = lexical_scores.get(full_name, 0.0)
+            relevant_tables.append(table)
+
+        relevant_tables.sort(key=lambda x: (x['rrf_score'], x['relevance_score']), reverse=True)
 
         # Apply relevance threshold filtering
         filtered_tables = [
@@ -465,6 +891,109 @@ class SchemaIndexer:
 
         return final_results
 
+    def _format_search_result(self, rank: int, doc: str, metadata: dict, relevance: float, base_relevance: float,
+                              table_boost: float, match: str, preferred_connector: Optional[str],
+                              database_mappings: dict) -> dict:
+        """Result dict returned by search_tables for one table."""
+        return {
+            'rank': rank,
+            'table_name': metadata['table_name'],
+            'full_name': metadata['full_name'],
+            'metadata': doc,
+            'relevance_score': relevance,
+            'connector_type': metadata['connector_type'],
+            'original_relevance': base_relevance,  # Keep original for debugging
+            'boosted': preferred_connector == metadata['connector_type'],
+            'table_boost': table_boost,
+            'match': match,  # 'exact' (named in the query) or 'hybrid' (BM25 + vector)
+            'detected_db': preferred_connector,  # Show what database was detected
+            'db_mappings_used': database_mappings if preferred_connector else None
+        }
+
+    def _get_lexical_index(self) -> Optional[LexicalIndex]:
+        """BM25 / exact-name index over every indexed document, rebuilt once per index version."""
+        def build():
+            with get_schema_vector_store().reader() as collection:
+                if collection is None:
+                    return None
+                stored = collection.get(include=['documents', 'metadatas'])
+            return LexicalIndex(stored['ids'], stored['documents'], stored['metadatas'])
+
+        return _lexical_index_cache.get_or_compute(get_index_version(), build)
+
+    def _score_candidates(self, query: str, ids: List[str]) -> Dict[str, tuple]:
+        """
+        Vector distances for candidates found only by the lexical retriever.
+
+        Returns:
+            Dict mapping full_name to (document, metadata, distance), with the squared L2
+            distance Chroma reports for query results
+        """
+        with get_schema_vector_store().reader() as collection:
+            if collection is None:
+                return {}
+            stored = collection.get(ids=ids, include=['documents', 'metadatas', 'embeddings'])
+
+        query_vector = np.asarray(self._embed_query(query), dtype='float64')
+        scored = {}
+        for doc, metadata, embedding in zip(stored['documents'], stored['metadatas'], stored['embeddings']):
+            distance = float(np.sum((np.asarray(embedding, dtype='float64') - query_vector) ** 2))
+            scored[metadata['full_name']] = (doc, metadata, distance)
+        return scored
+
+
+_vector_store: Optional[VectorStore] = None
+_vector_store_lock = threading.Lock()
+
+
+def get_schema_vector_store() -> VectorStore:
+    """
+    Get the process-wide handle on the schema collection, opening the Chroma client on first use.
+
+    Returns:
+        Shared VectorStore for SCHEMA_VECTOR_DB_PATH / SCHEMA_COLLECTION_NAME
+    """
+    global _vector_store
+    with _vector_store_lock:
+        if _vector_store is None:
+            _vector_store = VectorStore(SCHEMA_VECTOR_DB_PATH, SCHEMA_COLLECTION_NAME, version_fn=get_index_version)
+        return _vector_store
+
+
+_indexers: Dict[str, SchemaIndexer] = {}
+_indexers_lock = threading.Lock()
+
+
+def get_schema_indexer(connector_type: str = 'snowflake') -> SchemaIndexer:
+    """
+    Get the process-wide SchemaIndexer for a connector type, creating it on first use.
+
+    Args:
+        connector_type: Connector the indexer discovers schemas from ('snowflake', 'postgres')
+
+    Returns:
+        Cached SchemaIndexer instance
+    """
+    with _indexers_lock:
+        if connector_type not in _indexers:
+            _indexers[connector_type] = SchemaIndexer(connector_type)
+        return _indexers[connector_type]
+
+
+def warm_up_retrieval(connector_type: str = 'snowflake') -> SchemaIndexer:
+    """
+    Load the embedding model, open the schema vector store and create the cached indexer
+    ahead of the first query.
+
+    Intended as a startup hook for long-running processes (API servers, workers).
+
+    Returns:
+        The warmed-up SchemaIndexer
+    """
+    warm_up_embeddings()
+    get_schema_vector_store().get_collection()
+    return get_schema_indexer(connector_type)
+
 
 if __name__ == "__main__":
     # Build schema index when run directly
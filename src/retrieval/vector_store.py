@@ -0,0 +1,196 @@
+# src/retrieval/vector_store.py
+"""
+Process-wide handle on the persistent Chroma store.
+
+Opening a chromadb.PersistentClient reopens SQLite and reloads the HNSW segments, which is
+measurable latency when it happens several times per query. A VectorStore opens the client
+once, keeps the collection handle, and only reloads when the index is rebuilt.
+"""
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+
+
+class _ReadWriteLock:
+    """Many concurrent readers or one writer; waiting writers block new readers."""
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._readers = 0
+        self._writer = False
+        self._writers_waiting = 0
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        with self._condition:
+            while self._writer or self._writers_waiting:
+                self._condition.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._readers -= 1
+                if self._readers == 0:
+                    self._condition.notify_all()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        with self._condition:
+            self._writers_waiting += 1
+            while self._writer or self._readers:
+                self._condition.wait()
+            self._writers_waiting -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._writer = False
+                self._condition.notify_all()
+
+
+class VectorStore:
+    """
+    Shared Chroma client and collection handle with a generation counter.
+
+    The generation is incremented whenever the collection is recreated or the index is
+    rebuilt (mark_updated(), or a new index version written by another process), and the
+    collection handle is reloaded at that point. Searches run concurrently under a shared
+    lock; recreating the collection takes the lock exclusively.
+
+    Example:
+        store = VectorStore("./chroma_db", "database_schemas", version_fn=get_index_version)
+        with store.reader() as collection:
+            results = collection.query(query_embeddings=[embedding], n_results=20)
+    """
+
+    def __init__(self, path: str, collection_name: str, version_fn: Optional[Callable[[], str]] = None):
+        """
+        Args:
+            path: Directory of the persistent Chroma store
+            collection_name: Collection the handle points at
+            version_fn: Returns a token that changes whenever the index is rebuilt (lets the
+                        store notice rebuilds made by other processes)
+        """
+        self.path = path
+        self.collection_name = collection_name
+        self.version_fn = version_fn
+
+        self._client = None
+        self._collection = None
+        self._loaded_version: Optional[str] = None
+        self._generation = 0
+        self._lock = threading.Lock()  # guards client/handle (re)loading
+        self._rw_lock = _ReadWriteLock()
+        self.stats = {'client_opens': 0, 'collection_loads': 0}
+
+    @property
+    def generation(self) -> int:
+        """Number of reloads since the store was opened."""
+        return self._generation
+
+    @property
+    def client(self):
+        """The shared chromadb.PersistentClient, opened on first use."""
+        with self._lock:
+            return self._get_client()
+
+    def _get_client(self):
+        if self._client is None:
+            import chromadb
+            self._client = chromadb.PersistentClient(path=self.path)
+            self.stats['client_opens'] += 1
+        return self._client
+
+    def _current_version(self) -> Optional[str]:
+        return self.version_fn() if self.version_fn else None
+
+    def _refresh_if_rebuilt(self) -> None:
+        """Reload the handle (and reopen the client) if the index was rebuilt by another process."""
+        if self._current_version() == self._loaded_version:
+            return
+
+        with self._rw_lock.write(), self._lock:
+            version = self._current_version()
+            if version == self._loaded_version:
+                return
+            if self._client is not None and self._loaded_version is not None:
+                # Segments loaded by this client predate the rebuild
+                if hasattr(self._client, 'clear_system_cache'):
+                    self._client.clear_system_cache()
+                self._client = None
+            self._collection = None
+            self._loaded_version = version
+            self._generation += 1
+
+    def _load_collection(self, create: bool):
+        with self._lock:
+            if self._collection is None:
+                client = self._get_client()
+                try:
+                    if create:
+                        self._collection = client.get_or_create_collection(self.collection_name)
+                    else:
+                        self._collection = client.get_collection(self.collection_name)
+                except Exception:
+                    return None
+                self.stats['collection_loads'] += 1
+            return self._collection
+
+    def get_collection(self, create: bool = False):
+        """
+        Get the cached collection handle (for writers; searches should use reader()).
+
+        Args:
+            create: Create the collection if it doesn't exist
+
+        Returns:
+            Chroma collection, or None if it doesn't exist and create=False
+        """
+        self._refresh_if_rebuilt()
+        return self._load_collection(create)
+
+    @contextmanager
+    def reader(self) -> Iterator[Any]:
+        """Yield the collection (or None if it doesn't exist) for the duration of a read."""
+        self._refresh_if_rebuilt()
+        with self._rw_lock.read():
+            yield self._load_collection(create=False)
+
+    def reset_collection(self):
+        """
+        Delete and recreate the collection, waiting for in-flight readers to finish.
+
+        Returns:
+            The new, empty collection
+        """
+        with self._rw_lock.write(), self._lock:
+            client = self._get_client()
+            try:
+                client.delete_collection(self.collection_name)
+                print(f" Deleted existing collection: {self.collection_name}")
+            except Exception:
+                pass
+            self._collection = client.get_or_create_collection(self.collection_name)
+            self._generation += 1
+            self.stats['collection_loads'] += 1
+            return self._collection
+
+    def mark_updated(self) -> None:
+        """Record a rebuild made by this process (call after the index version is bumped)."""
+        with self._lock:
+            self._loaded_version = self._current_version()
+            self._collection = None
+            self._generation += 1
+
+    def close(self) -> None:
+        """Drop the client and collection handle; the next access reopens them."""
+        with self._rw_lock.write(), self._lock:
+            self._collection = None
+            self._client = None
+            self._loaded_version = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Open/load counters plus the current generation."""
+        return {**self.stats, 'generation': self._generation}
@@ -0,0 +1,125 @@
+"""
+Structured row filters and quoting in BaseConnector.build_select_query.
+
+Filter values reach the generated SQL only through quote_literal and column names only through
+quote_identifier, so these tests pin down the escaping of both.
+"""
+import math
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from src.connectors.postgres_connector import PostgresConnector
+from src.connectors.snowflake_connector import SnowflakeConnector
+
+
+@pytest.fixture
+def connector():
+    return PostgresConnector({}, verbose=False)
+
+
+def where(connector, filters):
+    return connector.build_select_query('public.orders', filters=filters).split(' WHERE ', 1)[1]
+
+
+@pytest.mark.parametrize('value, literal', [
+    ("O'Brien", "'O''Brien'"),
+    ("'; DROP TABLE orders; --", "'''; DROP TABLE orders; --'"),
+    ("''", "''''''"),
+    (None, 'NULL'),
+    (True, 'TRUE'),
+    (False, 'FALSE'),
+    (42, '42'),
+    (1.5, '1.5'),
+    (Decimal('10.25'), '10.25'),
+    (date(2024, 1, 31), "'2024-01-31'"),
+])
+def test_quote_literal(connector, value, literal):
+    assert connector.quote_literal(value) == literal
+
+
+def test_snowflake_literals_also_escape_backslashes():
+    connector = SnowflakeConnector({}, verbose=False)
+
+    # Without doubling, \' would end the string literal in Snowflake
+    assert connector.quote_literal("a\\' OR 1=1 --") == "'a\\\\'' OR 1=1 --'"
+
+
+@pytest.mark.parametrize('value', [math.inf, -math.inf, math.nan, Decimal('Infinity'), Decimal('NaN')])
+def test_non_finite_numbers_are_rejected(connector, value):
+    with pytest.raises(ValueError, match='finite'):
+        connector.quote_literal(value)
+
+
+@pytest.mark.parametrize('column, reference', [
+    ('email', 'email'),
+    ('EMAIL', 'EMAIL'),
+    ('_col$1', '_col$1'),
+    ('"Mixed Case"', '"Mixed Case"'),
+    ('"has ""quotes"""', '"has ""quotes"""'),
+    ('order date', '"order date"'),
+    ('a"b', '"a""b"'),
+    ('x" = 1 OR "1', '"x"" = 1 OR ""1"'),
+    ('1st', '"1st"'),
+])
+def test_quote_identifier(connector, column, reference):
+    assert connector.quote_identifier(column) == reference
+
+
+def test_columns_are_quoted_in_the_projection(connector):
+    sql = connector.build_select_query('public.orders', columns=['id', 'a"b'])
+
+    assert sql == 'SELECT id, "a""b" FROM public.orders'
+
+
+def test_equality_null_and_in_filters(connector):
+    assert where(connector, {'region': 'EU'}) == "region = 'EU'"
+    assert where(connector, {'deleted_at': None}) == "deleted_at IS NULL"
+    assert where(connector, {'region': ['EU', "O'Hare"]}) == "region IN ('EU', 'O''Hare')"
+    assert where(connector, {'id': (1, 2)}) == "id IN (1, 2)"
+
+
+def test_filters_are_combined_with_and(connector):
+    sql = connector.build_select_query('public.orders', filters={'region': 'EU', 'status': 'open'}, limit=10)
+
+    assert sql == "SELECT * FROM public.orders WHERE region = 'EU' AND status = 'open' LIMIT 10"
+
+
+def test_operator_dicts(connector):
+    assert where(connector, {'created_at': {'>=': '2024-01-01', '<': '2025-01-01'}}) == \
+        "created_at >= '2024-01-01' AND created_at < '2025-01-01'"
+    assert where(connector, {'amount': {'!=': 0}}) == "amount <> 0"
+    assert where(connector, {'name': {' LIKE ': "O'%"}}) == "name LIKE 'O''%'"
+    assert where(connector, {'region': {'not in': ['EU']}}) == "region NOT IN ('EU')"
+    assert where(connector, {'region': {'in': 'EU'}}) == "region IN ('EU')"
+    assert where(connector, {'email': {'=': None}}) == "email IS NULL"
+    assert where(connector, {'email': {'<>': None}}) == "email IS NOT NULL"
+
+
+def test_empty_in_lists(connector):
+    assert where(connector, {'region': []}) == "1 = 0"
+    assert where(connector, {'region': {'not in': []}}) == "1 = 1"
+
+
+@pytest.mark.parametrize('filters', [
+    {'id': {'; DROP TABLE orders; --': 1}},
+    {'id': {'==': 1}},
+    {'id': {'between': [1, 2]}},
+])
+def test_unknown_operators_are_rejected(connector, filters):
+    with pytest.raises(ValueError, match='Unknown filter operator'):
+        connector.build_select_query('public.orders', filters=filters)
+
+
+def test_invalid_filters_are_rejected(connector):
+    with pytest.raises(ValueError, match='Empty filter'):
+        connector.build_select_query('public.orders', filters={'id': {}})
+    with pytest.raises(ValueError, match='NULL'):
+        connector.build_select_query('public.orders', filters={'id': {'>': None}})
+    with pytest.raises(ValueError, match='finite'):
+        connector.build_select_query('public.orders', filters={'amount': {'<': math.inf}})
+
+
+def test_custom_query_is_used_as_is(connector):
+    assert connector.build_select_query('public.orders', query='SELECT 1', filters={'id': 1}) == 'SELECT 1'
@@ -0,0 +1,135 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.data_quality.hash_dedup import (
+    HashPartitionedDuplicateCounter,
+    count_duplicates_out_of_core,
+    find_duplicate_examples,
+    hash_rows,
+)
+
+
+def expected_duplicates(chunks):
+    """Reference duplicate count: pandas drop_duplicates over the concatenated chunks."""
+    df = pd.concat(chunks, ignore_index=True)
+    return len(df) - len(df.drop_duplicates())
+
+
+def chunked(df, rows):
+    return [df.iloc[start:start + rows].reset_index(drop=True) for start in range(0, len(df), rows)]
+
+
+@pytest.mark.parametrize('digest_bits', [64, 128])
+def test_mixed_dtype_chunks_match_drop_duplicates(digest_bits):
+    # The second chunk's integer column holds a NULL, so it arrives as float64
+    chunks = [
+        pd.DataFrame({'id': [1, 2, 3], 'name': ['a', 'b', 'c'], 'amount': [1.5, 2.0, 3.25]}),
+        pd.DataFrame({'id': [1.0, 2.0, np.nan], 'name': ['a', 'x', None], 'amount': [1.5, 2.0, np.nan]}),
+        pd.DataFrame({'id': [np.nan, 3.0], 'name': [None, 'c'], 'amount': [np.nan, 3.25]}),
+    ]
+
+    result = count_duplicates_out_of_core(chunks, 'test.mixed', digest_bits=digest_bits)
+
+    assert result['total_rows'] == 8
+    assert result['duplicate_qty'] == expected_duplicates(chunks) == 3
+    assert result['status'] == 'failure'
+
+
+def test_int_and_float_chunks_hash_alike():
+    as_int = pd.DataFrame({'value': [1, 2, 3]})
+    as_float = pd.DataFrame({'value': [1.0, 2.0, 3.0]})
+
+    np.testing.assert_array_equal(hash_rows(as_int), hash_rows(as_float))
+
+
+def test_negative_zero_equals_zero():
+    chunks = [pd.DataFrame({'value': [0.0]}), pd.DataFrame({'value': [-0.0]}), pd.DataFrame({'value': [0]})]
+
+    result = count_duplicates_out_of_core(chunks, 'test.zero')
+
+    assert result['duplicate_qty'] == expected_duplicates(chunks) == 2
+
+
+def test_integers_above_2_53_stay_distinct():
+    big = 2 ** 53
+    chunks = [pd.DataFrame({'value': [big, big + 1]}), pd.DataFrame({'value': [big + 2, big + 1]})]
+
+    result = count_duplicates_out_of_core(chunks, 'test.big')
+
+    # float64 would round 2^53 + 1 to 2^53; the digests must not
+    assert result['duplicate_qty'] == expected_duplicates(chunks) == 1
+
+
+def test_nullable_integer_chunks_match_plain_integers():
+    nullable = pd.DataFrame({'value': pd.array([1, 2, None], dtype='Int64')})
+    plain = pd.DataFrame({'value': [1.0, 2.0, np.nan]})
+
+    np.testing.assert_array_equal(hash_rows(nullable), hash_rows(plain))
+
+
+def test_128_bit_halves_are_independent():
+    df = pd.DataFrame({'id': np.arange(1000), 'score': np.linspace(0, 1, 1000), 'tag': ['t'] * 1000})
+
+    digests = hash_rows(df, digest_bits=128)
+
+    assert digests.shape == (1000, 2)
+    np.testing.assert_array_equal(digests[:, 0], hash_rows(df, digest_bits=64))
+    assert not np.array_equal(digests[:, 0], digests[:, 1])
+    # Rows that differ only in a numeric column must differ in the upper half as well
+    assert len(np.unique(digests[:, 1])) == 1000
+
+
+def test_invalid_digest_bits():
+    with pytest.raises(ValueError):
+        hash_rows(pd.DataFrame({'a': [1]}), digest_bits=32)
+    with pytest.raises(ValueError):
+        HashPartitionedDuplicateCounter(digest_bits=96)
+
+
+@pytest.mark.parametrize('num_partitions', [1, 3, 64])
+def test_bucket_counts_match_drop_duplicates(num_partitions):
+    rng = np.random.default_rng(7)
+    df = pd.DataFrame({
+        'customer_id': rng.integers(0, 50, 5000),
+        'region': rng.choice(['EU', 'US', 'APAC'], 5000),
+        'amount': rng.choice([0.5, 1.0, 2.25, np.nan], 5000),
+    })
+    chunks = chunked(df, 700)
+
+    result = count_duplicates_out_of_core(chunks, 'test.buckets', num_partitions=num_partitions)
+
+    assert result['total_rows'] == len(df)
+    assert result['duplicate_qty'] == expected_duplicates(chunks)
+
+
+def test_no_duplicates_reports_success(tmp_path):
+    chunks = chunked(pd.DataFrame({'id': range(100), 'name': [f'n{i}' for i in range(100)]}), 30)
+
+    result = count_duplicates_out_of_core(chunks, 'test.clean', sample_groups=2, spill_dir=str(tmp_path))
+
+    assert result['duplicate_qty'] == 0
+    assert result['status'] == 'success'
+    assert result['duplicate_examples'] == []
+    # Bucket files are removed from a caller-provided spill directory
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_duplicate_examples_are_counted():
+    chunks = [
+        pd.DataFrame({'id': [1, 2, 2], 'name': ['a', 'b', 'b']}),
+        pd.DataFrame({'id': [2, 3], 'name': ['b', 'c']}),
+    ]
+
+    result = count_duplicates_out_of_core(chunks, 'test.examples', sample_groups=1)
+
+    assert result['duplicate_qty'] == 2
+    assert result['duplicate_examples'] == [{'count': 3, 'row': {'id': 2, 'name': 'b'}}]
+
+
+def test_find_duplicate_examples_in_memory():
+    df = pd.DataFrame({'id': [1, 1, 2, 3, 3, 3], 'name': ['a', 'a', 'b', 'c', 'c', 'c']})
+
+    examples = find_duplicate_examples(df, max_groups=5)
+
+    assert [example['count'] for example in examples] == [3, 2]
+    assert examples[0]['row'] == {'id': 3, 'name': 'c'}
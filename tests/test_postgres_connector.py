@@ -0,0 +1,200 @@
+"""
+Dtype parity of the PostgreSQL connector's sync and async load paths, checked through the DQ
+check engines.
+
+The connector runs against fake psycopg2/asyncpg connections returning the Python values the
+drivers produce (NUMERIC columns arrive as Decimal), so no database is needed.
+"""
+import asyncio
+from contextlib import asynccontextmanager, contextmanager
+from decimal import Decimal
+
+import pytest
+
+from src.connectors.connector_factory import ConnectorFactory
+from src.connectors.postgres_connector import PostgresConnector
+from src.data_quality.async_checks import acheck_dataset_descriptive_stats
+from src.data_quality.checks import check_dataset_descriptive_stats
+
+COLUMNS = ['id', 'amount', 'region']
+ROWS = [
+    (1, Decimal('10.50'), 'EU'),
+    (2, Decimal('3.25'), 'US'),
+    (3, None, 'EU'),
+    (4, Decimal('7.00'), 'EU'),
+    (5, Decimal('-1.75'), None),
+]
+
+
+class FakeCursor:
+    """psycopg2 cursor (plain or named) over fixed rows."""
+
+    def __init__(self, rows, columns):
+        self._rows = list(rows)
+        self._columns = columns
+        self.description = None
+        self.itersize = None
+
+    def execute(self, sql, *args):
+        self.description = [(column, None, None, None, None, None, None) for column in self._columns]
+
+    def fetchmany(self, size):
+        batch, self._rows = self._rows[:size], self._rows[size:]
+        return batch
+
+    def fetchall(self):
+        return self.fetchmany(len(self._rows))
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    """psycopg2 connection handing out FakeCursors."""
+
+    def __init__(self, rows, columns):
+        self._rows = rows
+        self._columns = columns
+
+    def cursor(self, name=None):
+        return FakeCursor(self._rows, self._columns)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+
+class FakeAttribute:
+    def __init__(self, name):
+        self.name = name
+
+
+class FakeAsyncCursor:
+    """asyncpg cursor over fixed rows."""
+
+    def __init__(self, rows):
+        self._rows = list(rows)
+
+    async def fetch(self, size):
+        batch, self._rows = self._rows[:size], self._rows[size:]
+        return batch
+
+
+class FakeStatement:
+    """asyncpg prepared statement over fixed rows."""
+
+    def __init__(self, rows, columns):
+        self._rows = rows
+        self._columns = columns
+
+    def get_attributes(self):
+        return [FakeAttribute(column) for column in self._columns]
+
+    async def fetch(self):
+        return list(self._rows)
+
+    async def cursor(self):
+        return FakeAsyncCursor(self._rows)
+
+
+class FakeAsyncConnection:
+    """asyncpg connection preparing FakeStatements."""
+
+    def __init__(self, rows, columns):
+        self._rows = rows
+        self._columns = columns
+
+    async def prepare(self, sql):
+        return FakeStatement(self._rows, self._columns)
+
+    @asynccontextmanager
+    async def transaction(self, readonly=False):
+        yield
+
+
+def _connector(rows=ROWS, columns=COLUMNS):
+    connector = PostgresConnector({}, verbose=False)
+    connector._connection = FakeConnection(rows, columns)
+    connector._cursor = connector._connection.cursor()
+    connector._async_connection = FakeAsyncConnection(rows, columns)
+    return connector
+
+
+@pytest.fixture
+def fake_postgres(monkeypatch):
+    connector = _connector()
+
+    @contextmanager
+    def connection(connector_type, config=None, verbose=False):
+        yield connector
+
+    @asynccontextmanager
+    async def aconnection(connector_type, config=None, verbose=False):
+        yield connector
+
+    monkeypatch.setattr(ConnectorFactory, 'connection', connection)
+    monkeypatch.setattr(ConnectorFactory, 'aconnection', aconnection)
+    return connector
+
+
+def _stats(result):
+    """descriptive_stats with numbers as floats (the pandas engine returns some counts as strings)."""
+    assert result['status'] == 'success', result
+    normalised = {}
+    for column, stats in result['descriptive_stats'].items():
+        normalised[column] = {}
+        for stat, value in stats.items():
+            try:
+                normalised[column][stat] = None if value is None else float(value)
+            except ValueError:
+                normalised[column][stat] = value
+    return normalised
+
+
+def test_stream_batches_converts_numeric_to_float(fake_postgres):
+    batches = list(fake_postgres.stream_batches('public.orders', batch_rows=2))
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert all(batch['amount'].dtype == 'float64' for batch in batches)
+
+
+@pytest.mark.filterwarnings('ignore::UserWarning')
+def test_streaming_stats_match_pandas_engine(fake_postgres):
+    pandas_stats = _stats(check_dataset_descriptive_stats('public.orders', connector_type='postgres',
+                                                          engine='pandas'))
+    streaming_stats = _stats(check_dataset_descriptive_stats('public.orders', connector_type='postgres',
+                                                             engine='streaming', batch_rows=2))
+
+    assert 'mean' in streaming_stats['amount']
+    assert set(streaming_stats) == set(pandas_stats)
+    for column, stats in pandas_stats.items():
+        assert streaming_stats[column] == pytest.approx(stats), column
+
+
+def test_async_loads_convert_numeric_to_float(fake_postgres):
+    async def load():
+        df = await fake_postgres.aload_data('public.orders')
+        batches = [batch async for batch in fake_postgres.astream_batches('public.orders', batch_rows=2)]
+        return df, batches
+
+    df, batches = asyncio.run(load())
+
+    assert df['amount'].dtype == 'float64'
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert all(batch['amount'].dtype == 'float64' for batch in batches)
+
+
+@pytest.mark.filterwarnings('ignore::UserWarning')
+@pytest.mark.parametrize('engine', ['pandas', 'streaming'])
+def test_async_stats_match_sync_check(fake_postgres, engine):
+    sync_stats = _stats(check_dataset_descriptive_stats('public.orders', connector_type='postgres',
+                                                        engine=engine, batch_rows=2))
+    async_stats = _stats(asyncio.run(acheck_dataset_descriptive_stats('public.orders', connector_type='postgres',
+                                                                      engine=engine, batch_rows=2)))
+
+    assert 'mean' in async_stats['amount']
+    assert set(async_stats) == set(sync_stats)
+    for column, stats in sync_stats.items():
+        assert async_stats[column] == pytest.approx(stats), column
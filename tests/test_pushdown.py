@@ -0,0 +1,410 @@
+"""
+Push-down checks without a warehouse.
+
+Every plan is compiled for both dialects and run through _run_plan against a fake connector
+that answers each compiled query the way the warehouse would, with aggregates computed from a
+DataFrame. The results must match the pandas engine on the same DataFrame.
+"""
+import re
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.connectors.connector_factory import ConnectorFactory
+from src.connectors.postgres_connector import PostgresConnector
+from src.connectors.snowflake_connector import SnowflakeConnector
+from src.data_quality.checks import (
+    check_dataset_descriptive_stats,
+    check_dataset_duplicates,
+    check_dataset_null_values,
+)
+from src.data_quality.hash_dedup import hash_rows
+from src.data_quality.pushdown import (
+    NULL_PLACEHOLDERS,
+    PostgresDialect,
+    SnowflakeDialect,
+    compile_approx_duplicates_sql,
+    compile_column_hll_registers_sql,
+    compile_duplicates_sql,
+    compile_hll_registers_sql,
+    compile_null_counts_sql,
+    compile_stats_sql,
+    compile_top_values_sql,
+    pushdown_descriptive_stats,
+    pushdown_duplicates,
+    pushdown_null_values,
+)
+from src.data_quality.sketches import DEFAULT_HLL_PRECISION
+
+DIALECTS = ['postgres', 'snowflake']
+
+ORDERS = pd.DataFrame({
+    'order_id': [1, 2, 3, 4, 5, 5, 6, 6],
+    'amount': [10.5, 3.25, None, 7.0, -1.75, -1.75, 12.0, 12.0],
+    'region': ['EU', 'US', 'EU', 'NULL', 'APAC', 'APAC', 'EU', 'EU'],
+    'note': ['a', '', 'b', None, 'c', 'c', 'd', 'd'],
+})
+
+# information_schema data types of ORDERS' columns
+DATA_TYPES = {
+    'postgres': {'order_id': 'integer', 'amount': 'numeric(10,2)', 'region': 'text', 'note': 'character varying(20)'},
+    'snowflake': {'order_id': 'NUMBER', 'amount': 'FLOAT', 'region': 'TEXT', 'note': 'TEXT'},
+}
+
+_QUOTED = r'"((?:[^"]|"")+)"'
+
+
+def _column(quoted):
+    return quoted.replace('""', '"')
+
+
+def _quantile(values, quantile):
+    return values.quantile(quantile)
+
+
+def _aggregate(expression, df):
+    """Evaluate one aggregate expression of compile_stats_sql over df."""
+    patterns = [
+        (r'COUNT\(DISTINCT ' + _QUOTED + r'\)$', lambda s: s.nunique()),
+        (r'APPROX_COUNT_DISTINCT\(' + _QUOTED + r'\)$', lambda s: s.nunique()),
+        (r'COUNT\(' + _QUOTED + r'\)$', lambda s: s.count()),
+        (r'AVG\(' + _QUOTED + r'\)$', lambda s: s.mean()),
+        (r'STDDEV_SAMP\(' + _QUOTED + r'\)$', lambda s: s.std()),
+        (r'MIN\(' + _QUOTED + r'\)$', lambda s: s.min()),
+        (r'MAX\(' + _QUOTED + r'\)$', lambda s: s.max()),
+    ]
+    for pattern, function in patterns:
+        match = re.match(pattern, expression)
+        if match:
+            return function(df[_column(match.group(1))])
+    match = (re.match(r'PERCENTILE_CONT\(([\d.]+)\) WITHIN GROUP \(ORDER BY ' + _QUOTED + r'\)$', expression)
+             or re.match(r'APPROX_PERCENTILE\(' + _QUOTED + r', ([\d.]+)\)$', expression))
+    if match is None:
+        raise AssertionError(f"Unexpected aggregate: {expression}")
+    quantile, column = match.groups() if expression.startswith('PERCENTILE_CONT') else match.groups()[::-1]
+    return _quantile(df[_column(column)], float(quantile))
+
+
+def _hll_registers(hashes, precision=DEFAULT_HLL_PRECISION):
+    """(register, rank) pairs the register scan SQL computes for signed 64-bit hashes."""
+    remaining_bits = 64 - precision
+    mask = (1 << remaining_bits) - 1
+    pairs = []
+    for h in hashes:
+        h = int(h)
+        register = (h >> remaining_bits) & ((1 << precision) - 1)
+        low = h & mask
+        rank = remaining_bits + 1 if low == 0 else remaining_bits - (low.bit_length() - 1)
+        pairs.append((register, rank))
+    return pairs
+
+
+def _signed_hashes(df):
+    return hash_rows(df).view('int64')
+
+
+def warehouse_answer(sql, df):
+    """What the warehouse returns for one of the compiled push-down queries over df."""
+    if 'SELECT DISTINCT *' in sql:
+        return pd.DataFrame([[len(df), len(df.drop_duplicates())]], columns=['total_rows', 'distinct_rows'])
+
+    if 'APPROX_COUNT_DISTINCT(HASH(t.*))' in sql:
+        return pd.DataFrame([[len(df), len(df.drop_duplicates())]], columns=['TOTAL_ROWS', 'DISTINCT_ROWS'])
+
+    if 'AS column_index, top_value, freq' in sql:
+        rows = []
+        for index, quoted in re.findall(r'SELECT (\d+) AS column_index, top_value, freq FROM '
+                                        r'\(SELECT CAST\(' + _QUOTED, sql):
+            counts = df[_column(quoted)].dropna().value_counts()
+            if len(counts):
+                rows.append((int(index), str(counts.index[0]), int(counts.iloc[0])))
+        return pd.DataFrame(rows, columns=['column_index', 'top_value', 'freq'])
+
+    if 'AS column_index' in sql and 'register' in sql:
+        rows = {}
+        for index, quoted in re.findall(r'SELECT (\d+) AS column_index, \w+\(' + _QUOTED, sql):
+            values = df[[_column(quoted)]].dropna()
+            for register, rank in _hll_registers(_signed_hashes(values)):
+                key = (int(index), register)
+                rows[key] = max(rows.get(key, 0), rank)
+        return pd.DataFrame([(*key, rank) for key, rank in rows.items()],
+                            columns=['column_index', 'register', 'rank'])
+
+    if 'register' in sql:
+        registers = pd.DataFrame(_hll_registers(_signed_hashes(df)), columns=['register', 'rank'])
+        return (registers.groupby('register')
+                .agg(rank=('rank', 'max'), row_count=('rank', 'size')).reset_index())
+
+    if ' AS null_0' in sql:
+        row = [len(df)]
+        for quoted in re.findall(r'WHEN ' + _QUOTED + r' IS NULL', sql):
+            values = df[_column(quoted)]
+            row.append(int((values.isna() | values.astype(str).isin(NULL_PLACEHOLDERS)).sum()))
+        return pd.DataFrame([row], columns=['total_rows'] + [f'null_{i}' for i in range(len(row) - 1)])
+
+    if ' AS s_0' in sql:
+        select_list = sql[len('SELECT '):sql.rindex(' FROM ')]
+        expressions = re.split(r' AS s_\d+(?:, |$)', select_list)[:-1]
+        return pd.DataFrame([[_aggregate(expression, df) for expression in expressions]],
+                            columns=[f's_{i}' for i in range(len(expressions))])
+
+    raise AssertionError(f"Unexpected query: {sql}")
+
+
+def fake_connector(connector_type, df):
+    """Real connector class (dialect, quoting, sampling) with describe/load answered from df."""
+    connector_class = PostgresConnector if connector_type == 'postgres' else SnowflakeConnector
+
+    class CannedConnector(connector_class):
+        def __init__(self):
+            super().__init__({}, verbose=False)
+            self.queries = []
+
+        def describe_columns(self, dataset_id):
+            return [{'COLUMN_NAME': column, 'DATA_TYPE': DATA_TYPES[connector_type][column]} for column in df.columns]
+
+        def load_data(self, dataset_id, query=None, **kwargs):
+            self.queries.append(query)
+            return warehouse_answer(query, df)
+
+    return CannedConnector()
+
+
+@pytest.fixture
+def warehouse(monkeypatch):
+    """Install a fake connector over a DataFrame; returns a function (connector_type, df) -> connector."""
+    connectors = {}
+
+    @contextmanager
+    def connection(connector_type, config=None, verbose=False):
+        yield connectors[connector_type]
+
+    monkeypatch.setattr(ConnectorFactory, 'connection', connection)
+
+    def install(connector_type, df=ORDERS):
+        connectors[connector_type] = fake_connector(connector_type, df)
+        return connectors[connector_type]
+
+    return install
+
+
+def _normalised_stats(result):
+    """descriptive_stats with numbers as floats (the pandas engine returns some counts as strings)."""
+    assert result['status'] == 'success', result
+    normalised = {}
+    for column, stats in result['descriptive_stats'].items():
+        normalised[column] = {}
+        for stat, value in stats.items():
+            try:
+                normalised[column][stat] = None if value is None else float(value)
+            except ValueError:
+                normalised[column][stat] = value
+    return normalised
+
+
+# ---------------------------------------------------------------------------
+# Compiled SQL
+# ---------------------------------------------------------------------------
+
+def test_duplicates_sql():
+    assert compile_duplicates_sql('public.orders') == (
+        "SELECT (SELECT COUNT(*) FROM public.orders AS src) AS total_rows, "
+        "(SELECT COUNT(*) FROM (SELECT DISTINCT * FROM public.orders AS src) AS distinct_rows) AS distinct_rows"
+    )
+
+
+def test_approx_duplicates_sql_uses_the_native_estimator():
+    assert compile_approx_duplicates_sql(SnowflakeDialect(), 'DB.S.T') == (
+        "SELECT COUNT(*) AS total_rows, APPROX_COUNT_DISTINCT(HASH(t.*)) AS distinct_rows FROM DB.S.T AS t"
+    )
+    with pytest.raises(NotImplementedError):
+        compile_approx_duplicates_sql(PostgresDialect(), 'public.orders')
+
+
+def test_hll_register_scans_hash_in_the_warehouse():
+    rows_sql = compile_hll_registers_sql(PostgresDialect(), 'public.orders', precision=14)
+    assert 'hashtextextended(t::text, 0) AS h' in rows_sql
+    assert '(h >> 50) & 16383 AS register' in rows_sql
+    assert rows_sql.endswith('GROUP BY register')
+
+    columns_sql = compile_column_hll_registers_sql(PostgresDialect(), 'public.orders', ['region', 'a"b'])
+    assert 'SELECT 0 AS column_index, hashtextextended("region"::text, 0) AS h' in columns_sql
+    assert 'WHERE "a""b" IS NOT NULL' in columns_sql
+    assert columns_sql.endswith('GROUP BY column_index, register')
+
+
+@pytest.mark.parametrize('dialect, cast', [(PostgresDialect(), 'CAST("note" AS VARCHAR)'),
+                                           (SnowflakeDialect(), 'CAST("note" AS VARCHAR)')])
+def test_null_counts_sql(dialect, cast):
+    sql = compile_null_counts_sql(dialect, 'src_table', ['note'])
+
+    assert sql == (
+        f"SELECT COUNT(*) AS total_rows, SUM(CASE WHEN \"note\" IS NULL OR {cast} IN ('', 'NULL', 'null', '<NA>') "
+        f"THEN 1 ELSE 0 END) AS null_0 FROM src_table AS src"
+    )
+
+
+def test_stats_sql_per_dialect():
+    columns = [('amount', True), ('region', False)]
+
+    postgres_sql, layout = compile_stats_sql(PostgresDialect(), 't', columns)
+    snowflake_sql, snowflake_layout = compile_stats_sql(SnowflakeDialect(), 't', columns)
+
+    assert layout == snowflake_layout == [
+        ('amount', 'count'), ('amount', 'mean'), ('amount', 'std'), ('amount', 'min'),
+        ('amount', '25%'), ('amount', '50%'), ('amount', '75%'), ('amount', 'max'),
+        ('region', 'count'), ('region', 'unique'),
+    ]
+    assert 'PERCENTILE_CONT(0.25) WITHIN GROUP (ORDER BY "amount") AS s_4' in postgres_sql
+    assert 'APPROX_PERCENTILE("amount", 0.25) AS s_4' in snowflake_sql
+    assert 'COUNT(DISTINCT "region") AS s_9' in postgres_sql
+
+
+def test_approximate_stats_sql_per_dialect():
+    columns = [('region', False)]
+
+    snowflake_sql, snowflake_layout = compile_stats_sql(SnowflakeDialect(), 't', columns, approximate=True)
+    postgres_sql, postgres_layout = compile_stats_sql(PostgresDialect(), 't', columns, approximate=True)
+
+    assert 'APPROX_COUNT_DISTINCT("region") AS s_1' in snowflake_sql
+    assert snowflake_layout == [('region', 'count'), ('region', 'unique')]
+    # No native estimator: 'unique' comes from the per-column register scan instead
+    assert postgres_layout == [('region', 'count')]
+    assert 'DISTINCT' not in postgres_sql
+
+
+def test_top_values_are_one_query_for_all_columns():
+    sql = compile_top_values_sql(SnowflakeDialect(), 't', ['region', 'note'])
+
+    assert sql.count(' UNION ALL ') == 1
+    assert sql.startswith('SELECT 0 AS column_index, top_value, freq FROM (SELECT CAST("region" AS VARCHAR)')
+    assert 'SELECT 1 AS column_index' in sql
+    assert sql.count('ORDER BY freq DESC LIMIT 1') == 2
+
+
+# ---------------------------------------------------------------------------
+# Results against the pandas engine
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize('connector_type', DIALECTS)
+def test_duplicates_match_pandas(warehouse, connector_type):
+    connector = warehouse(connector_type)
+
+    result = pushdown_duplicates('sales.orders', connector_type)
+
+    assert len(connector.queries) == 1
+    assert result == check_dataset_duplicates('sales.orders', df=ORDERS)
+
+
+@pytest.mark.parametrize('connector_type', DIALECTS)
+def test_approximate_duplicates(warehouse, connector_type):
+    warehouse(connector_type)
+    exact = check_dataset_duplicates('sales.orders', df=ORDERS)
+
+    result = pushdown_duplicates('sales.orders', connector_type, approximate=True)
+
+    assert result['approximate'] is True
+    assert result['method'] == ('APPROX_COUNT_DISTINCT' if connector_type == 'snowflake' else 'hyperloglog')
+    assert result['total_rows'] == exact['total_rows']
+    low, high = result['duplicate_qty_bounds']
+    assert low <= exact['duplicate_qty'] <= high
+    assert result['duplicate_qty'] == exact['duplicate_qty']
+
+
+@pytest.mark.parametrize('connector_type', DIALECTS)
+def test_duplicates_over_selected_columns(warehouse, connector_type):
+    connector = warehouse(connector_type, ORDERS[['region']])
+
+    result = pushdown_duplicates('sales.orders', connector_type, columns=['REGION'])
+
+    assert result == check_dataset_duplicates('sales.orders', df=ORDERS[['region']])
+    assert 'SELECT "region" FROM sales.orders' in connector.queries[0]
+
+
+@pytest.mark.parametrize('connector_type', DIALECTS)
+def test_null_values_match_pandas(warehouse, connector_type):
+    warehouse(connector_type)
+
+    result = pushdown_null_values('sales.orders', connector_type)
+    expected = check_dataset_null_values('sales.orders', df=ORDERS)
+
+    assert result == expected
+    assert {info['column_name'] for info in result['null_analysis']} == {'amount', 'region', 'note'}
+
+
+@pytest.mark.parametrize('connector_type', DIALECTS)
+def test_descriptive_stats_match_pandas(warehouse, connector_type):
+    connector = warehouse(connector_type)
+
+    result = pushdown_descriptive_stats('sales.orders', connector_type)
+    expected = check_dataset_descriptive_stats('sales.orders', df=ORDERS)
+
+    # One aggregate query plus one batched top-value query
+    assert len(connector.queries) == 2
+    assert list(result['descriptive_stats']) == list(expected['descriptive_stats'])
+    for column, stats in result['descriptive_stats'].items():
+        assert list(stats) == list(expected['descriptive_stats'][column]), column
+    actual, wanted = _normalised_stats(result), _normalised_stats(expected)
+    for column, stats in wanted.items():
+        assert actual[column] == pytest.approx(stats), column
+
+
+@pytest.mark.parametrize('connector_type', DIALECTS)
+def test_approximate_descriptive_stats(warehouse, connector_type):
+    connector = warehouse(connector_type)
+
+    result = pushdown_descriptive_stats('sales.orders', connector_type, approximate=True)
+    expected = _normalised_stats(check_dataset_descriptive_stats('sales.orders', df=ORDERS))
+
+    assert result['approximate'] is True
+    # PostgreSQL adds the per-column register scan for 'unique'
+    assert len(connector.queries) == (2 if connector_type == 'snowflake' else 3)
+    for column in ('order_id', 'region', 'note'):
+        assert result['descriptive_stats'][column]['unique'] == expected[column]['unique'], column
+
+
+@pytest.mark.parametrize('connector_type', DIALECTS)
+def test_empty_table(warehouse, connector_type):
+    warehouse(connector_type, ORDERS.iloc[0:0])
+
+    assert pushdown_duplicates('sales.orders', connector_type) == {
+        'dataset_id': 'sales.orders', 'total_rows': 0, 'duplicate_qty': 0, 'status': 'success'
+    }
+    stats = pushdown_descriptive_stats('sales.orders', connector_type)['descriptive_stats']
+    assert stats['region'] == {'count': 0, 'unique': 0, 'top': None, 'freq': None,
+                               'mean': None, 'std': None, 'min': None, '25%': None, '50%': None,
+                               '75%': None, 'max': None}
+
+
+@pytest.mark.parametrize('connector_type', DIALECTS)
+def test_filters_and_samples_become_a_subquery(warehouse, connector_type):
+    connector = warehouse(connector_type)
+
+    pushdown_null_values('sales.orders', connector_type, filters={'region': "O'Hare"}, sample_percent=10)
+
+    sql = connector.queries[0]
+    assert "FROM (SELECT * FROM sales.orders " in sql
+    assert "WHERE region = 'O''Hare') AS src" in sql
+    assert ('TABLESAMPLE BERNOULLI (10) REPEATABLE (42)' if connector_type == 'postgres'
+            else 'SAMPLE ROW (10) SEED (42)') in sql
+
+
+@pytest.mark.parametrize('connector_type', DIALECTS)
+def test_failures_are_reported_not_raised(warehouse, connector_type):
+    warehouse(connector_type)
+
+    unknown = pushdown_null_values('sales.orders', connector_type, columns=['missing'])
+    unseeded = pushdown_duplicates('sales.orders', connector_type, sample_percent=5, sample_seed=None)
+
+    assert unknown['status'] == 'failure' and 'missing' in unknown['error']
+    assert unseeded['status'] == 'failure' and 'sample_seed' in unseeded['error']
+
+
+def test_hll_registers_helper_matches_the_rank_definition():
+    # Lowest bits all zero: rank is remaining_bits + 1; a single low bit set: rank is 1 + leading zeros
+    remaining_bits = 64 - DEFAULT_HLL_PRECISION
+    assert _hll_registers([0])[0] == (0, remaining_bits + 1)
+    assert _hll_registers([1])[0] == (0, remaining_bits)
+    assert _hll_registers([np.int64(-1)])[0] == ((1 << DEFAULT_HLL_PRECISION) - 1, 1)
@@ -0,0 +1,125 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.data_quality.hash_dedup import estimate_duplicates_approximate
+from src.data_quality.sampling import extrapolate_duplicates
+from src.data_quality.sketches import HyperLogLog, approximate_duplicates_result
+
+
+def within_standard_errors(sketch, true_count, errors=3):
+    return abs(sketch.estimate() - true_count) <= errors * sketch.relative_error * true_count
+
+
+@pytest.mark.parametrize('true_count', [100, 10_000, 200_000])
+def test_estimate_within_three_standard_errors(true_count):
+    sketch = HyperLogLog()
+    sketch.update(pd.Series(np.arange(true_count)))
+
+    assert within_standard_errors(sketch, true_count)
+
+
+def test_repeated_values_do_not_change_the_estimate():
+    values = pd.Series(np.arange(5_000))
+    once = HyperLogLog()
+    once.update(values)
+    repeated = HyperLogLog()
+    for _ in range(3):
+        repeated.update(values)
+
+    assert repeated.estimate() == once.estimate()
+
+
+def test_nulls_are_ignored():
+    sketch = HyperLogLog()
+    sketch.update(pd.Series([1.0, np.nan, 2.0, None]))
+
+    assert round(sketch.estimate()) == 2
+
+
+def test_merge_equals_sketch_of_the_union():
+    left, right, union = HyperLogLog(), HyperLogLog(), HyperLogLog()
+    left.update(pd.Series(np.arange(0, 60_000)))
+    right.update(pd.Series(np.arange(40_000, 100_000)))
+    union.update(pd.Series(np.arange(0, 100_000)))
+
+    left.merge(right)
+
+    np.testing.assert_array_equal(left.registers, union.registers)
+    assert within_standard_errors(left, 100_000)
+
+
+def test_merge_rejects_different_precision():
+    with pytest.raises(ValueError):
+        HyperLogLog(12).merge(HyperLogLog(14))
+
+
+def test_invalid_precision():
+    with pytest.raises(ValueError):
+        HyperLogLog(3)
+
+
+def test_no_duplicates_reports_success():
+    df = pd.DataFrame({'id': np.arange(50_000), 'name': [f'customer_{i}' for i in range(50_000)]})
+
+    result = estimate_duplicates_approximate([df], 'test.clean')
+
+    assert result['total_rows'] == 50_000
+    assert result['status'] == 'success'
+    assert result['duplicate_qty_bounds'][0] == 0
+    assert result['approximate'] is True
+
+
+def test_heavy_duplication_reports_failure():
+    df = pd.DataFrame({'id': np.arange(20_000) % 1_000})
+
+    result = estimate_duplicates_approximate([df], 'test.dupes')
+
+    assert result['status'] == 'failure'
+    low, high = result['duplicate_qty_bounds']
+    assert low <= 19_000 <= high
+
+
+def test_result_interval_and_status_rule():
+    # 1000 rows, ~990 distinct with 1% error: the interval [0, 30] includes zero
+    clean = approximate_duplicates_result('t', 1000, 990.0, 0.01, method='hyperloglog')
+    assert clean['duplicate_qty'] == 10
+    assert clean['duplicate_qty_bounds'] == [0, 30]
+    assert clean['status'] == 'success'
+
+    # 1000 rows, ~800 distinct: the interval [184, 216] excludes zero
+    dirty = approximate_duplicates_result('t', 1000, 800.0, 0.01, method='hyperloglog')
+    assert dirty['duplicate_qty'] == 200
+    assert dirty['duplicate_qty_bounds'] == [184, 216]
+    assert dirty['status'] == 'failure'
+
+
+def test_result_caps_the_estimate_at_total_rows():
+    result = approximate_duplicates_result('t', 1000, 1012.0, 0.01, method='hyperloglog')
+
+    assert result['duplicate_qty'] == 0
+    assert result['status'] == 'success'
+
+
+def test_sampled_estimate_keeps_the_sketch_error():
+    # 50% sample of 1000 rows, ~980 distinct: sketch interval [16, 24] on the sample
+    approximate = extrapolate_duplicates(
+        approximate_duplicates_result('t', 1000, 980.0, 0.002, method='hyperloglog'), sample_percent=50
+    )
+    # The same sample count without sketch error
+    exact = extrapolate_duplicates({'dataset_id': 't', 'total_rows': 1000, 'duplicate_qty': 20,
+                                    'status': 'failure'}, sample_percent=50)
+
+    assert approximate['sample_duplicate_qty_bounds'] == [16, 24]
+    assert approximate['duplicate_qty'] == exact['duplicate_qty'] == 80
+    low, high = approximate['duplicate_qty_bounds']
+    assert low < exact['duplicate_qty_bounds'][0] and high > exact['duplicate_qty_bounds'][1]
+    assert approximate['status'] == 'failure'
+
+
+def test_sampled_estimate_status_follows_the_widened_interval():
+    clean = extrapolate_duplicates(
+        approximate_duplicates_result('t', 1000, 990.0, 0.01, method='hyperloglog'), sample_percent=10
+    )
+
+    assert clean['duplicate_qty_bounds'][0] == 0
+    assert clean['status'] == 'success'
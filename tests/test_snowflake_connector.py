@@ -0,0 +1,63 @@
+"""
+Catalog queries of the Snowflake connector, run against a fake cursor that records the SQL.
+"""
+from src.connectors.snowflake_connector import SnowflakeConnector
+
+HOSTILE_TABLE = "PUBLIC.ORDERS' OR '1'='1"
+
+
+class RecordingCursor:
+    """snowflake.connector cursor that records executed statements and returns fixed rows."""
+
+    def __init__(self, rows=()):
+        self.rows = list(rows)
+        self.executed = []
+
+    def execute(self, sql, params=None):
+        self.executed.append((sql, params))
+
+    def fetchall(self):
+        return self.rows
+
+    def fetchone(self):
+        if 'CURRENT_DATABASE' in self.executed[-1][0]:
+            return ('SALES',)
+        return self.rows[0] if self.rows else None
+
+
+def _connector(rows=()):
+    connector = SnowflakeConnector({}, verbose=False)
+    connector._cursor = RecordingCursor(rows)
+    return connector
+
+
+def test_describe_columns_binds_schema_and_table():
+    connector = _connector([('ID', 'NUMBER'), ('EMAIL', 'TEXT')])
+
+    columns = connector.describe_columns(HOSTILE_TABLE)
+
+    sql, params = connector._cursor.executed[-1]
+    assert params == ('PUBLIC', "ORDERS' OR '1'='1")
+    assert "'1'='1" not in sql
+    assert columns == [{'COLUMN_NAME': 'ID', 'DATA_TYPE': 'NUMBER'}, {'COLUMN_NAME': 'EMAIL', 'DATA_TYPE': 'TEXT'}]
+
+
+def test_describe_columns_quotes_an_unusual_database_name():
+    connector = _connector()
+
+    connector.describe_columns('sales db".public.orders')
+
+    sql, _ = connector._cursor.executed[-1]
+    assert 'FROM "sales db""".INFORMATION_SCHEMA.COLUMNS' in sql
+
+
+def test_get_table_version_binds_schema_and_table():
+    connector = _connector([('2024-01-01 00:00:00', 42)])
+
+    version = connector.get_table_version(HOSTILE_TABLE)
+
+    sql, params = connector._cursor.executed[-1]
+    assert params == ('PUBLIC', "ORDERS' OR '1'='1")
+    assert "'1'='1" not in sql
+    assert 'FROM SALES.INFORMATION_SCHEMA.TABLES' in sql
+    assert version == '2024-01-01 00:00:00|42'